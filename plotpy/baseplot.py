@@ -52,7 +52,7 @@ import numpy as np
 
 from plotpy.qt.QtGui import (QSizePolicy, QColor, QPixmap, QPrinter,
                               QApplication)
-from plotpy.qt.QtCore import QSize, Qt, Signal
+from plotpy.qt.QtCore import QSize, Qt, Signal, QTimer
 from plotpy.qt import PYQT5
 
 from plotpy.configtools import get_font
@@ -64,7 +64,8 @@ from plotpy.transitional import (QwtPlot, QwtLinearScaleEngine,
 from plotpy import io
 from plotpy.config import CONF, _
 from plotpy.events import StatefulEventFilter
-from plotpy.interfaces import IBasePlotItem, IItemType, ISerializableType
+from plotpy.interfaces import (IBasePlotItem, IItemType, ISerializableType,
+                               IShapeItemType)
 from plotpy.styles import ItemParameters, AxeStyleParam, AxesParam, AxisParam
 
 #==============================================================================
@@ -115,6 +116,10 @@ class BasePlot(QwtPlot):
     AXIS_CONF_OPTIONS = ("axis", "axis", "axis", "axis")
     DEFAULT_ACTIVE_XAXIS = X_BOTTOM
     DEFAULT_ACTIVE_YAXIS = Y_LEFT
+    #: Deferred replot mode default state (see `set_deferred_replot`)
+    DEFERRED_REPLOT = False
+    #: Delay (ms) of deferred replots: 0 -> once per event loop iteration
+    REPLOT_DELAY = 0
     
     #: Signal emitted by plot when an IBasePlotItem object was moved (args: x0, y0, x1, y1)
     SIG_ITEM_MOVED = Signal("PyQt_PyObject", float, float, float, float)
@@ -161,12 +166,23 @@ class BasePlot(QwtPlot):
 
     def __init__(self, parent=None, section="plot"):
         super(BasePlot, self).__init__(parent)
+        self._replot_pending = False
+        self._axes_outdated = True
+        self._replot_timer = QTimer(self)
+        self._replot_timer.setSingleShot(True)
+        self._replot_timer.timeout.connect(self.flush_replot)
+        self._deferred_replot = self.DEFERRED_REPLOT
+        self.replot_stats = {"requested": 0, "performed": 0, "coalesced": 0}
         self._start_autoscaled = True
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.manager = None
         self.plot_id = None # id assigned by it's manager
         self.filter = StatefulEventFilter(self)
         self.items = []
+        # Cached item lists (see get_items): a mapping from item type to 
+        # items of this type, and the same for z-sorted items
+        self._items_by_type = {}
+        self._zsorted_items_by_type = {}
         self.active_item = None
         self.last_selected = {} # a mapping from item type to last selected item
         self.axes_styles = [AxeStyleParam(_("Left")),
@@ -180,6 +196,7 @@ class BasePlot(QwtPlot):
         canvas = self.canvas()
         canvas.setFocusPolicy(Qt.StrongFocus)
         canvas.setFocusIndicator(QwtPlotCanvas.ItemFocusIndicator)
+        canvas.setPaintAttribute(QwtPlotCanvas.LayeredBackingStore, True)
         self.SIG_ITEM_MOVED.connect(self._move_selected_items_together)
         self.legendDataChanged.connect(lambda item, _legdata:
                                        item.update_item_parameters())
@@ -202,6 +219,18 @@ class BasePlot(QwtPlot):
         if self._start_autoscaled:
             self.do_autoscale()
 
+    def isOverlayItem(self, item):
+        """Reimplement Qwt method: shapes (markers, cursors, selection 
+        rectangles, annotations, ...) are painted on the canvas overlay layer, 
+        so that they may be moved without repainting images and curves"""
+        return IShapeItemType in getattr(item, "types", tuple)()
+
+    def attachItem(self, plotItem, on):
+        """Reimplement Qwt method: called when an item is attached, 
+        detached or when its z-order has changed"""
+        QwtPlot.attachItem(self, plotItem, on)
+        self.invalidate_items_cache(z_only=True)
+
     #---- Public API ----------------------------------------------------------
     def _move_selected_items_together(self, item, x0, y0, x1, y1):
         """Selected items move together"""
@@ -328,6 +357,12 @@ class BasePlot(QwtPlot):
     def get_axis_limits(self, axis_id):
         """Return axis limits (minimum and maximum values)"""
         axis_id = self.get_axis_id(axis_id)
+        if self._replot_pending and (self._axes_outdated
+                                     or self.axisAutoScale(axis_id)):
+            # Scale divisions are updated when replotting: updating them 
+            # now, without flushing the pending replot (canvas is repainted
+            # once, when the replot is actually performed)
+            self.updateAxes()
         sdiv = self.axisScaleDiv(axis_id)
         return sdiv.lowerBound(), sdiv.upperBound()
 
@@ -396,18 +431,32 @@ class BasePlot(QwtPlot):
         for axis in unused_axes:
             self.enableAxis(axis, False)
 
+    def invalidate_items_cache(self, z_only=False):
+        """Invalidate cached item lists used by get_items
+        (if *z_only* is True, only z-sorted item lists are invalidated)"""
+        if not z_only:
+            self._items_by_type.clear()
+        self._zsorted_items_by_type.clear()
+
     def get_items(self, z_sorted=False, item_type=None):
         """Return widget's item list
         (items are based on IBasePlotItem's interface)"""
+        if not z_sorted and item_type is None:
+            return self.items
         if z_sorted:
-            items = sorted(self.items, reverse=True, key=lambda x:x.z())
+            cache = self._zsorted_items_by_type
         else:
-            items = self.items
-        if item_type is None:
-            return items
-        else:
-            assert issubclass(item_type, IItemType)
-            return [item for item in items if item_type in item.types()]
+            cache = self._items_by_type
+        items = cache.get(item_type)
+        if items is None:
+            if item_type is None:
+                items = sorted(self.items, reverse=True, key=lambda x:x.z())
+            else:
+                assert issubclass(item_type, IItemType)
+                items = [item for item in self.get_items(z_sorted=z_sorted)
+                         if item_type in item.types()]
+            cache[item_type] = items
+        return items[:]
             
     def get_public_items(self, z_sorted=False, item_type=None):
         """Return widget's public item list
@@ -485,6 +534,46 @@ class BasePlot(QwtPlot):
             print("Warning: item %r is already attached to plot" % item, file=sys.stderr)
         else:
             self.items.append(item)
+            self.invalidate_items_cache()
+        self.SIG_ITEMS_CHANGED.emit(self)
+        
+    def add_items(self, items, z=None):
+        """
+        Add several *plot item* instances to this *plot widget*
+        (emitting a single SIG_ITEMS_CHANGED signal)
+        
+        items: list of :py:data:`qwt.QwtPlotItem` objects implementing
+               the IBasePlotItem interface (plotpy.interfaces)
+        z: first item's z order (None -> z = max(self.get_items())+1), 
+           the other items are stacked above it
+        """
+        if z is None:
+            z = self.get_max_z()+1
+        attached = set([id(_it) for _it in self.items])
+        # Attaching an item triggers a replot when auto-replot is enabled: 
+        # the plot is replotted only once, after all items are attached
+        auto = self.autoReplot()
+        self.setAutoReplot(False)
+        try:
+            for item in items:
+                assert hasattr(item, "__implements__")
+                assert IBasePlotItem in item.__implements__
+                if id(item) in attached:
+                    # Already attached items are left untouched (z order)
+                    print("Warning: item %r is already attached to plot"
+                          % item, file=sys.stderr)
+                    continue
+                # Setting z before attaching the item avoids moving it 
+                # in the z-ordered item list afterwards
+                item.setZ(z)
+                z += 1
+                item.attach(self)
+                attached.add(id(item))
+                self.items.append(item)
+        finally:
+            self.setAutoReplot(auto)
+        self.invalidate_items_cache()
+        self.replot()
         self.SIG_ITEMS_CHANGED.emit(self)
         
     def add_item_with_z_offset(self, item, zoffset):
@@ -512,16 +601,30 @@ class BasePlot(QwtPlot):
                 del self.last_selected[key]
 
     def del_items(self, items):
-        """Remove item from widget"""
+        """Remove items from widget
+        (emitting a single SIG_ITEMS_CHANGED signal)"""
         items = items[:] # copy the list to avoid side effects when we empty it
+        attached = set([id(_it) for _it in self.items])
+        removed = set()
+        for item in items:
+            if id(item) not in attached or id(item) in removed:
+                raise ValueError("item not in list")
+            removed.add(id(item))
         active_item = self.get_active_item()
-        while items:
-            item = items.pop()
-            item.detach()
-            # raises ValueError if item not in list
-            self.items.remove(item)
-            self.__clean_item_references(item)
-            self.SIG_ITEM_REMOVED.emit(item)
+        self.items[:] = [_it for _it in self.items if id(_it) not in removed]
+        self.invalidate_items_cache()
+        # Replotting only once, after all items are detached
+        auto = self.autoReplot()
+        self.setAutoReplot(False)
+        try:
+            while items:
+                item = items.pop()
+                item.detach()
+                self.__clean_item_references(item)
+                self.SIG_ITEM_REMOVED.emit(item)
+        finally:
+            self.setAutoReplot(auto)
+        self.replot()
         self.SIG_ITEMS_CHANGED.emit(self)
         if active_item is not self.get_active_item():
             self.SIG_ACTIVE_ITEM_CHANGED.emit(self)
@@ -563,11 +666,14 @@ class BasePlot(QwtPlot):
         """Hide items (if *items* is None, hide all items)"""
         self.__set_items_visible(False, items, item_type=item_type)
 
-    def save_items(self, iofile, selected=False):
+    def save_items(self, iofile, selected=False, buffers=None):
         """
         Save (serializable) items to file using the :py:mod:`pickle` protocol
             * iofile: file object or filename
             * selected=False: if True, will save only selected items
+            * buffers=None: if not None, sidecar filename to which array 
+              data is written directly (pickle protocol 5 out-of-band 
+              buffers, memory-mapped when restoring items)
             
         See also :py:meth:`plotpy.baseplot.BasePlot.restore_items`
         """
@@ -576,20 +682,18 @@ class BasePlot(QwtPlot):
         else:
             items = self.items[:]
         items = [item for item in items if ISerializableType in item.types()]
-        import pickle
-        pickle.dump(items, iofile)
+        io.pickle_items(items, iofile, buffers=buffers)
 
-    def restore_items(self, iofile):
+    def restore_items(self, iofile, buffers=None):
         """
         Restore items from file using the :py:mod:`pickle` protocol
             * iofile: file object or filename
+            * buffers=None: sidecar filename (must be specified if items 
+              were saved with a sidecar file)
             
         See also :py:meth:`plotpy.baseplot.BasePlot.save_items`
         """
-        import pickle
-        items = pickle.load(iofile)
-        for item in items:
-            self.add_item(item)
+        self.add_items(io.unpickle_items(iofile, buffers=buffers))
 
     def serialize(self, writer, selected=False):
         """
@@ -613,15 +717,13 @@ class BasePlot(QwtPlot):
             
         See also :py:meth:`plotpy.baseplot.BasePlot.save_items_to_hdf5`
         """
-        for item in io.load_items(reader):
-            self.add_item(item)
+        self.add_items(io.load_items(reader))
 
     def set_items(self, *args):
         """Utility function used to quickly setup a plot
         with a set of items"""
         self.del_all_items()
-        for item in args:
-            self.add_item(item)
+        self.add_items(args)
 
     def del_all_items(self):
         """Remove (detach) all attached items"""
@@ -904,6 +1006,21 @@ class BasePlot(QwtPlot):
             vmin, vmax = self.get_axis_limits(axis_id)
             self.set_axis_limits(axis_id, vmin, vmax)
 
+    def replot_overlay(self, items=()):
+        """
+        Repaint canvas overlay layer only (i.e. shapes, markers, ...) 
+        instead of replotting everything (see `isOverlayItem`):
+            * items: changed items (if any of them is painted on the 
+              static layer, a full replot is performed)
+        """
+        canvas = self.canvas()
+        for item in items:
+            if canvas.isStaticLayerItem(item):
+                self.replot()
+                break
+        else:
+            canvas.updateOverlay()
+
     def invalidate(self):
         """Invalidate paint cache and schedule redraw
         use instead of replot when only the content
@@ -912,8 +1029,70 @@ class BasePlot(QwtPlot):
         self.canvas().replot()
         self.update()
 
-## Keep this around to debug too many replots
-##    def replot(self):
-##        import traceback
-##        traceback.print_stack()
-##        QwtPlot.replot(self)
+    def replot(self):
+        """Reimplement Qwt method: in deferred replot mode, replot 
+        is only scheduled (see `set_deferred_replot`)"""
+        if self._deferred_replot:
+            self.schedule_replot()
+        else:
+            self.replot_stats["requested"] += 1
+            self._replot_timer.stop()
+            self._replot_pending = False
+            self.__replot_now()
+
+    def autoRefresh(self):
+        """Reimplement Qwt method: called when axes scale settings or plot 
+        items have changed, so that scale divisions are outdated"""
+        self._axes_outdated = True
+        QwtPlot.autoRefresh(self)
+
+    def updateAxes(self):
+        """Reimplement Qwt method"""
+        QwtPlot.updateAxes(self)
+        self._axes_outdated = False
+
+    def __replot_now(self):
+        self.replot_stats["performed"] += 1
+        QwtPlot.replot(self)
+
+    def set_deferred_replot(self, state):
+        """
+        Enable/disable deferred replot mode
+        
+        In deferred replot mode, successive calls to `replot` are coalesced 
+        into a single replot, performed at the next event loop iteration 
+        (or after REPLOT_DELAY ms)
+        """
+        self._deferred_replot = state
+        if not state:
+            self.flush_replot()
+
+    def is_deferred_replot(self):
+        """Return True if deferred replot mode is enabled"""
+        return self._deferred_replot
+
+    def schedule_replot(self):
+        """Schedule a replot (pending replots are coalesced)"""
+        self.replot_stats["requested"] += 1
+        if self._replot_pending:
+            self.replot_stats["coalesced"] += 1
+        else:
+            self._replot_pending = True
+            self._replot_timer.start(self.REPLOT_DELAY)
+
+    def flush_replot(self):
+        """Perform scheduled replot now, if any"""
+        if self._replot_pending:
+            self._replot_timer.stop()
+            self._replot_pending = False
+            self.__replot_now()
+
+    def get_replot_stats(self):
+        """Return replot statistics: number of requested, performed and 
+        coalesced replots (see `set_deferred_replot`)"""
+        return self.replot_stats.copy()
+
+    def reset_replot_stats(self):
+        """Reset replot statistics"""
+        for key in self.replot_stats:
+            self.replot_stats[key] = 0
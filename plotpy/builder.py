@@ -794,7 +794,7 @@ class PlotItemBuilder(object):
         return image
     
     def imagefilter(self, xmin, xmax, ymin, ymax,
-                    imageitem, filter, title=None):
+                    imageitem, filter, title=None, threaded=False):
         """
         Make a rectangular area image filter `plot item`
         (:py:class:`plotpy.image.ImageFilterItem` object)
@@ -802,12 +802,14 @@ class PlotItemBuilder(object):
             * xmin, xmax, ymin, ymax: filter area bounds
             * imageitem: An imageitem instance
             * filter: function (x, y, data) --> data
+            * threaded: compute filter in a worker thread pool (bool)
         """
         param = ImageFilterParam(_("Filter"), icon="funct.png")
         param.xmin, param.xmax, param.ymin, param.ymax = xmin, xmax, ymin, ymax
         if title is not None:
             param.label = title
         filt = imageitem.get_filter(filter, param)
+        filt.set_threaded(threaded)
         _m, _M = imageitem.get_lut_range()
         filt.set_lut_range([_m, _M])
         return filt
@@ -57,6 +57,8 @@ DEFAULTS = {
             'plot':
              {
               "selection/distance": 6,
+              # Minimum interval between two processed mouse move events (ms)
+              "mouse_move/interval": 16,
               "antialiasing": False,
               
               "title/font/size": 12,
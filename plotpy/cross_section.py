@@ -43,7 +43,7 @@ import weakref
 
 from plotpy.qt.QtGui import (QVBoxLayout, QSizePolicy, QHBoxLayout, QToolBar,
                               QSpacerItem)
-from plotpy.qt.QtCore import QSize, QPointF, Qt
+from plotpy.qt.QtCore import QSize, QPointF, Qt, QTimer
 
 import numpy as np
 
@@ -115,7 +115,7 @@ class CrossSectionItem(ErrorBarCurveItem):
         """
         self.set_data(x, y, dx, dy)
 
-    def update_item(self, obj):
+    def update_item(self, obj, replot=True):
         plot = self.plot()
         if not plot:
             return
@@ -125,9 +125,9 @@ class CrossSectionItem(ErrorBarCurveItem):
         self.update_curve_data(obj)
         self.plot().SIG_CS_CURVE_CHANGED.emit(self)
         if not self.autoscale_mode:
-            self.update_scale()
+            self.update_scale(replot=replot)
             
-    def update_scale(self):
+    def update_scale(self, replot=True):
         plot = self.plot()
         if self.orientation() == Qt.Vertical:
             axis_id = plot.Y_LEFT
@@ -136,7 +136,8 @@ class CrossSectionItem(ErrorBarCurveItem):
         source = self.get_source_image()
         sdiv = source.plot().axisScaleDiv(axis_id)
         plot.setAxisScale(axis_id, sdiv.lowerBound(), sdiv.upperBound())
-        plot.replot()
+        if replot:
+            plot.replot()
 
 
 def get_rectangular_area(obj):
@@ -327,6 +328,12 @@ class CrossSectionPlot(CurvePlot):
     Z_AXIS = None
     Z_MAX_MAJOR = 5
     SHADE = .2
+    #: Minimum time interval (ms) between two cross section updates triggered
+    #: by marker/shape changes (see `schedule_update`)
+    UPDATE_INTERVAL = 20
+    #: Cross section updates trigger several replots in a row (curves update, 
+    #: autoscale, ...): those are coalesced (see `BasePlot.set_deferred_replot`)
+    DEFERRED_REPLOT = True
     def __init__(self, parent=None):
         super(CrossSectionPlot, self).__init__(parent=parent, title="",
                                                section="cross_section")
@@ -341,6 +348,12 @@ class CrossSectionPlot(CurvePlot):
         self.known_items = {}
         self._shapes = {}
         
+        self._pending_update = None
+        self._curves_outdated = False
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(self.process_pending_update)
+        
         self.curveparam = CurveParam(_("Curve"), icon="curve.png")
         self.set_curve_style("cross_section", "curve")
         
@@ -367,7 +380,7 @@ class CrossSectionPlot(CurvePlot):
             return
         plot.SIG_ITEMS_CHANGED.connect(self.items_changed)
         plot.SIG_LUT_CHANGED.connect(self.lut_changed)
-        plot.SIG_MASK_CHANGED.connect(lambda item: self.update_plot())
+        plot.SIG_MASK_CHANGED.connect(lambda item: self.schedule_update())
         plot.SIG_ACTIVE_ITEM_CHANGED.connect(self.active_item_changed)
         plot.SIG_MARKER_CHANGED.connect(self.marker_changed)
         plot.SIG_ANNOTATION_CHANGED.connect(self.shape_changed)
@@ -457,7 +470,7 @@ class CrossSectionPlot(CurvePlot):
             self.set_axis_limits(self.CS_AXIS, vmin, vmax)
         
     def marker_changed(self, marker):
-        self.update_plot(marker)
+        self.schedule_update(marker)
 
     def is_shape_known(self, shape):
         for shapes in list(self._shapes.values()):
@@ -469,12 +482,50 @@ class CrossSectionPlot(CurvePlot):
     def shape_changed(self, shape):
         if self.autorefresh_mode:
             if self.is_shape_known(shape):
-                self.update_plot(shape)
+                self.schedule_update(shape)
             
     def get_last_obj(self):
         if self.last_obj is not None:
             return self.last_obj()
         
+    def schedule_update(self, obj=None, refresh=True):
+        """
+        Schedule cross section update (see `update_plot`)
+        
+        Bursts of marker/shape changes (e.g. when dragging a marker) are 
+        coalesced into at most one update every `UPDATE_INTERVAL` ms:
+        only the last object is taken into account (a weak reference is 
+        kept until update is processed)
+        """
+        if obj is not None:
+            obj = weakref.ref(obj)
+        if self._pending_update is not None:
+            pending_obj, pending_refresh = self._pending_update
+            if obj is None:
+                obj = pending_obj
+            refresh = refresh or pending_refresh
+        self._pending_update = obj, refresh
+        if not self._update_timer.isActive():
+            self._update_timer.start(self.UPDATE_INTERVAL)
+    
+    def process_pending_update(self):
+        """Process scheduled cross section update, if any"""
+        self._update_timer.stop()
+        if self._pending_update is not None:
+            obj, refresh = self._pending_update
+            self._pending_update = None
+            if obj is not None:
+                obj = obj()
+            self.update_plot(obj, refresh=refresh)
+
+    def showEvent(self, event):
+        """Reimplement Qt method: cross section curves which were not 
+        updated while panel was hidden are updated when it is shown"""
+        super(CrossSectionPlot, self).showEvent(event)
+        if self._curves_outdated:
+            self._curves_outdated = False
+            self.schedule_update(refresh=True)
+        
     def update_plot(self, obj=None, refresh=True):
         """
         Update cross section curve(s) associated to object *obj*
@@ -496,6 +547,13 @@ class CrossSectionPlot(CurvePlot):
             return
         if self.label.isVisible():
             self.label.hide()
+        if not self.isVisible():
+            # Hidden panel: cross section curves are not updated
+            # (see `CrossSectionItem.update_item`) until panel is shown
+            self._curves_outdated = self._curves_outdated or refresh
+            refresh = False
+        elif refresh:
+            self._curves_outdated = False
         items = list(self.known_items.items())
         for index, (item, curve) in enumerate(iter(items)):
             if (not self.perimage_mode and index > 0) or not item.isVisible():
@@ -506,11 +564,13 @@ class CrossSectionPlot(CurvePlot):
                 curve.autoscale_mode = self.autoscale_mode
                 curve.apply_lut = self.apply_lut
                 if refresh:
-                    curve.update_item(obj)
+                    curve.update_item(obj, replot=False)
         if self.autoscale_mode:
             self.do_autoscale(replot=True)
         elif self.lockscales:
             self.do_autoscale(replot=True, axis_id=self.Z_AXIS)
+        else:
+            self.replot()
         
     def toggle_perimage_mode(self, state):
         self.perimage_mode = state
@@ -833,75 +893,143 @@ class YCrossSection(XCrossSection):
 DEBUG = False
 TEMP_ITEM = None
 
-def compute_oblique_section(item, obj):
-    """Return oblique averaged cross section"""
-    global TEMP_ITEM
+class ObliqueSectionEngine(object):
+    """
+    Oblique averaged cross section computation engine
     
-    xa, ya, xb, yb = obj.get_bounding_rect_coords()
-    x0, y0, x1, y1, x2, y2, x3, y3 = obj.get_rect()
-
-    getcpi = item.get_closest_pixel_indexes
-    ixa, iya = getcpi(xa, ya)
-    ixb, iyb = getcpi(xb, yb)
-    ix0, iy0 = getcpi(x0, y0)
-    ix1, iy1 = getcpi(x1, y1)
-    ix3, iy3 = getcpi(x3, y3)
+    Only the source image pixels covered by the rotated rectangle (plus a
+    one-pixel margin for linear interpolation) are read -- in particular,
+    masked image data is filled only on this footprint instead of copying
+    the whole image. The destination buffer is reused from one computation
+    to the next, as long as the rectangle size does not change.
+    """
+    def __init__(self):
+        self._dst_image = None
     
-    destw = vector_norm(ix0, iy0, ix1, iy1)
-    desth = vector_norm(ix0, iy0, ix3, iy3)
-    ysign = -1 if obj.plot().get_axis_direction('left') else 1
-    angle = vector_angle(ix1-ix0, (iy1-iy0)*ysign)
+    def get_dst_image(self, width, height):
+        """Return destination buffer of shape (height, width)"""
+        shape = (height, width)
+        if self._dst_image is None or self._dst_image.shape != shape:
+            self._dst_image = np.empty(shape, dtype=np.float64)
+        return self._dst_image
     
-    dst_rect = (0, 0, int(destw), int(desth))
-    dst_image = np.empty((desth, destw), dtype=np.float64)
+    def get_transform(self, item, obj):
+        """
+        Return destination size and transform matrix from destination
+        pixel coordinates to source image pixel coordinates
+        """
+        xa, ya, xb, yb = obj.get_bounding_rect_coords()
+        x0, y0, x1, y1, x2, y2, x3, y3 = obj.get_rect()
     
-    if isinstance(item.data, np.ma.MaskedArray):
-        if item.data.dtype in (np.float32, np.float64):
-            item_data = item.data
-        else:
-            item_data = np.ma.array(item.data, dtype=np.float32, copy=True)
-        data = np.ma.filled(item_data, np.nan)
-    else:
-        data = item.data
+        getcpi = item.get_closest_pixel_indexes
+        ixa, iya = getcpi(xa, ya)
+        ixb, iyb = getcpi(xb, yb)
+        ix0, iy0 = getcpi(x0, y0)
+        ix1, iy1 = getcpi(x1, y1)
+        ix3, iy3 = getcpi(x3, y3)
+        
+        destw = vector_norm(ix0, iy0, ix1, iy1)
+        desth = vector_norm(ix0, iy0, ix3, iy3)
+        ysign = -1 if obj.plot().get_axis_direction('left') else 1
+        angle = vector_angle(ix1-ix0, (iy1-iy0)*ysign)
+        
+        ixr = .5*(ixb+ixa)
+        iyr = .5*(iyb+iya)
+        mat = translate(ixr, iyr)*rotate(-angle)*\
+              translate(-.5*destw, -.5*desth)
+        return int(destw), int(desth), mat
     
-    ixr = .5*(ixb+ixa)
-    iyr = .5*(iyb+iya)
-    mat = translate(ixr, iyr)*rotate(-angle)*translate(-.5*destw, -.5*desth)
-    _scale_tr(data, mat, dst_image, dst_rect,
-              (1., 0., np.nan), (INTERP_LINEAR,))
-
-    if DEBUG:
-        plot = obj.plot()
-        if TEMP_ITEM is None:
-            from plotpy.builder import make
-            TEMP_ITEM = make.image(dst_image)
-            plot.add_item(TEMP_ITEM)
-        else:
-            TEMP_ITEM.set_data(dst_image)
-        if False:
-            TEMP_ITEM.imageparam.alpha_mask = True
-            xmin, ymin = ixa, iya
-            xmax, ymax = xmin+destw, ymin+desth
-            TEMP_ITEM.imageparam.xmin = xmin
-            TEMP_ITEM.imageparam.xmax = xmax
-            TEMP_ITEM.imageparam.ymin = ymin
-            TEMP_ITEM.imageparam.ymax = ymax
-            TEMP_ITEM.imageparam.update_image(TEMP_ITEM)
-        plot.replot()
+    def get_footprint(self, data, mat, width, height):
+        """
+        Return source image index bounds (i0, j0, i1, j1) of the area
+        covered by destination image (with transform matrix *mat*)
+        """
+        corners = np.array(mat*np.matrix([[0, width, 0, width],
+                                          [0, 0, height, height],
+                                          [1, 1, 1, 1]], float))
+        ni, nj = data.shape
+        i0 = int(min([max([np.floor(corners[0].min())-1, 0]), nj]))
+        i1 = int(min([max([np.ceil(corners[0].max())+2, 0]), nj]))
+        j0 = int(min([max([np.floor(corners[1].min())-1, 0]), ni]))
+        j1 = int(min([max([np.ceil(corners[1].max())+2, 0]), ni]))
+        return i0, j0, i1, j1
     
-    ydata = np.ma.fix_invalid(dst_image, copy=DEBUG).mean(axis=1)
-    xdata = item.get_x_values(0, ydata.size)[:ydata.size]
-    try:
-        xdata -= xdata[0]
-    except IndexError:
-        print(xdata, ydata)
-    return xdata, ydata
+    def get_source_data(self, item, i0, j0, i1, j1):
+        """Return source image data on footprint, masked pixels being
+        replaced by NaNs"""
+        data = item.data[j0:j1, i0:i1]
+        if isinstance(data, np.ma.MaskedArray):
+            if data.dtype not in (np.float32, np.float64):
+                data = data.astype(np.float32)
+            data = np.ma.filled(data, np.nan)
+        return data
+    
+    def compute_image(self, item, obj):
+        """Return oblique section image (rotated rectangle area,
+        pixels outside source image being set to NaN)"""
+        destw, desth, mat = self.get_transform(item, obj)
+        dst_image = self.get_dst_image(destw, desth)
+        if dst_image.size == 0:
+            return dst_image
+        i0, j0, i1, j1 = self.get_footprint(item.data, mat, destw, desth)
+        if i1 <= i0 or j1 <= j0:
+            dst_image[...] = np.nan
+            return dst_image
+        data = self.get_source_data(item, i0, j0, i1, j1)
+        mat = translate(-i0, -j0)*mat
+        _scale_tr(data, mat, dst_image, (0, 0, destw, desth),
+                  (1., 0., np.nan), (INTERP_LINEAR,))
+        return dst_image
+    
+    def compute_profile(self, dst_image):
+        """Return averaged profile of oblique section image, ignoring NaNs
+        (NaN is returned for rows without any valid pixel)"""
+        valid = ~np.isnan(dst_image)
+        count = valid.sum(axis=1)
+        total = np.where(valid, dst_image, 0.).sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return total/count
+    
+    def compute(self, item, obj):
+        """Return oblique averaged cross section: xdata, ydata"""
+        return self.get_section(item, self.compute_image(item, obj))
+    
+    def get_section(self, item, dst_image):
+        """Return oblique averaged cross section from section image"""
+        ydata = self.compute_profile(dst_image)
+        xdata = item.get_x_values(0, ydata.size)[:ydata.size]
+        try:
+            xdata = xdata-xdata[0]
+        except IndexError:
+            pass
+        return xdata, ydata
+
+
+def compute_oblique_section(item, obj, engine=None):
+    """Return oblique averaged cross section"""
+    global TEMP_ITEM
+    if engine is None:
+        engine = ObliqueSectionEngine()
+    if not DEBUG:
+        return engine.compute(item, obj)
+
+    dst_image = engine.compute_image(item, obj)
+    plot = obj.plot()
+    if TEMP_ITEM is None:
+        from plotpy.builder import make
+        TEMP_ITEM = make.image(dst_image.copy())
+        plot.add_item(TEMP_ITEM)
+    else:
+        TEMP_ITEM.set_data(dst_image.copy())
+    plot.replot()
+    return engine.get_section(item, dst_image)
 
 # Oblique cross section item
 class ObliqueCrossSectionItem(CrossSectionItem):
     """A Qwt item representing radially-averaged cross section data"""
     def __init__(self, curveparam=None, errorbarparam=None):
         CrossSectionItem.__init__(self, curveparam, errorbarparam)
+        self.engine = ObliqueSectionEngine()
         
     def update_curve_data(self, obj):
         source = self.get_source_image()
@@ -909,12 +1037,13 @@ class ObliqueCrossSectionItem(CrossSectionItem):
         if rect is not None and source.data is not None:
 #            x0, y0, x1, y1 = rect
 #            angle = obj.get_tr_angle()
-            sectx, secty = compute_oblique_section(source, obj)
+            sectx, secty = compute_oblique_section(source, obj,
+                                                   engine=self.engine)
             if secty.size == 0 or np.all(np.isnan(secty)):
                 sectx, secty = np.array([]), np.array([])
             self.process_curve_data(sectx, secty, None, None)
             
-    def update_scale(self):
+    def update_scale(self, replot=True):
         pass
 
 # Oblique cross section plot
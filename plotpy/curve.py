@@ -327,6 +327,8 @@ class CurveItem(QwtPlotCurve):
     
     _readonly = False
     _private = False
+    _data_version = 0
+    _bounds_cache = None
     
     def __init__(self, curveparam=None):
         super(CurveItem, self).__init__()
@@ -348,8 +350,18 @@ class CurveItem(QwtPlotCurve):
         else:
             return axis_data.min()
         
-    def boundingRect(self):
-        """Return the bounding rectangle of the data"""
+    def setData(self, *args, **kwargs):
+        """Reimplement Qwt method (data version is used to invalidate the 
+        cached bounding rectangle)"""
+        self.invalidate_bounds()
+        QwtPlotCurve.setData(self, *args, **kwargs)
+
+    def invalidate_bounds(self):
+        """Invalidate cached bounding rectangle"""
+        self._data_version += 1
+
+    def compute_bounds(self):
+        """Compute the bounding rectangle of the data"""
         plot = self.plot()
         if plot is not None and 'log' in (plot.get_axis_scale(self.xAxis()),
                                           plot.get_axis_scale(self.yAxis())):
@@ -360,6 +372,20 @@ class CurveItem(QwtPlotCurve):
             return QRectF(xmin, ymin, xf.max()-xmin, yf.max()-ymin)
         else:
             return QwtPlotCurve.boundingRect(self)
+
+    def boundingRect(self):
+        """Return the bounding rectangle of the data
+        (cached until data or axes scale types change)"""
+        plot = self.plot()
+        if plot is None:
+            scales = None
+        else:
+            scales = (plot.get_axis_scale(self.xAxis()),
+                      plot.get_axis_scale(self.yAxis()))
+        key = (self._data_version, scales)
+        if self._bounds_cache is None or self._bounds_cache[0] != key:
+            self._bounds_cache = (key, self.compute_bounds())
+        return QRectF(self._bounds_cache[1])
         
     def types(self):
         return (ICurveItemType, ITrackableItemType, ISerializableType)
@@ -414,8 +440,8 @@ class CurveItem(QwtPlotCurve):
         """Deserialize object from HDF5 reader"""
         self.curveparam = CurveParam(_("Curve"), icon='curve.png')
         reader.read('curveparam', instance=self.curveparam)
-        x = reader.read(group_name='Xdata', func=reader.read_array)
-        y = reader.read(group_name='Ydata', func=reader.read_array)
+        x = reader.read(group_name='Xdata', func=reader.read_ndarray)
+        y = reader.read(group_name='Ydata', func=reader.read_ndarray)
         self.set_data(x, y)
         self.setZ(reader.read('z'))
         self.update_params()
@@ -617,6 +643,9 @@ class PolygonMapItem(QwtPlotItem):
         self._pts = None # Array of points Mx2
         self._n = None   # Array of polygon offsets/ends Nx1 (polygon k points are _pts[_n[k-1]:_n[k]])
         self._c = None   # Color of polygon Nx2 [border,background] as RGBA uint32
+        # Drawing polygons is expensive: the item output is cached until 
+        # item is modified (all modifications have to invalidate the cache)
+        self.setItemAttribute(QwtPlotItem.RenderCache)
         self.update_params()
         
     def types(self):
@@ -682,9 +711,9 @@ class PolygonMapItem(QwtPlotItem):
     
     def deserialize(self, reader):
         """Deserialize object from HDF5 reader"""
-        pts = reader.read(group_name='Pdata', func=reader.read_array)
-        n = reader.read(group_name='Ndata', func=reader.read_array)
-        c = reader.read(group_name='Cdata', func=reader.read_array)
+        pts = reader.read(group_name='Pdata', func=reader.read_ndarray)
+        n = reader.read(group_name='Ndata', func=reader.read_ndarray)
+        c = reader.read(group_name='Cdata', func=reader.read_ndarray)
         self.set_data(pts, n, c)
         self.setZ(reader.read('z'))
         self.curveparam = CurveParam(_("PolygonMap"), icon='curve.png')
@@ -716,6 +745,7 @@ class PolygonMapItem(QwtPlotItem):
         """Select item"""
         self.selected = True
         self.setSymbol(SELECTED_SYMBOL)
+        self.invalidateRenderCache()
         self.invalidate_plot()
     
     def unselect(self):
@@ -723,6 +753,7 @@ class PolygonMapItem(QwtPlotItem):
         self.selected = False
         # Restoring initial curve parameters:
         self.curveparam.update_curve(self)
+        self.invalidateRenderCache()
         self.invalidate_plot()
 
     def get_data(self):
@@ -741,6 +772,7 @@ class PolygonMapItem(QwtPlotItem):
         xmin, ymin = self._pts.min(axis=0)
         xmax, ymax = self._pts.max(axis=0)
         self.bounds = QRectF(xmin, ymin, xmax-xmin, ymax-ymin)
+        self.invalidateRenderCache()
         
     def is_empty(self):
         """Return True if item data is empty"""
@@ -777,6 +809,7 @@ class PolygonMapItem(QwtPlotItem):
 
     def update_params(self):
         self.curveparam.update_curve(self)
+        self.invalidateRenderCache()
         if self.selected:
             self.select()
 
@@ -871,10 +904,10 @@ class ErrorBarCurveItem(CurveItem):
         self.errorbarparam = ErrorBarParam(_("Error bars"),
                                            icon='errorbar.png')
         reader.read('errorbarparam', instance=self.errorbarparam)
-        x = reader.read(group_name='Xdata', func=reader.read_array)
-        y = reader.read(group_name='Ydata', func=reader.read_array)
-        dx = reader.read(group_name='dXdata', func=reader.read_array)
-        dy = reader.read(group_name='dYdata', func=reader.read_array)
+        x = reader.read(group_name='Xdata', func=reader.read_ndarray)
+        y = reader.read(group_name='Ydata', func=reader.read_ndarray)
+        dx = reader.read(group_name='dXdata', func=reader.read_ndarray)
+        dy = reader.read(group_name='dYdata', func=reader.read_ndarray)
         self.set_data(x, y, dx, dy)
         self.setZ(reader.read('z'))
         self.update_params()
@@ -916,6 +949,7 @@ class ErrorBarCurveItem(CurveItem):
         self._dx = dx
         self._dy = dy
         self._minmaxarrays = {}
+        self.invalidate_bounds()
 
     def get_minmax_arrays(self, all_values=True):
         if self._minmaxarrays.get(all_values) is None:
@@ -975,11 +1009,11 @@ class ErrorBarCurveItem(CurveItem):
             x = xmax[i]
         return x, y
 
-    def boundingRect(self):
-        """Return the bounding rectangle of the data, error bars included"""
+    def compute_bounds(self):
+        """Compute the bounding rectangle of the data, error bars included"""
         xmin, xmax, ymin, ymax = self.get_minmax_arrays()
         if xmin is None or xmin.size == 0:
-            return CurveItem.boundingRect(self)
+            return CurveItem.compute_bounds(self)
         plot = self.plot()
         xminf, yminf = xmin[np.isfinite(xmin)], ymin[np.isfinite(ymin)]
         xmaxf, ymaxf = xmax[np.isfinite(xmax)], ymax[np.isfinite(ymax)]
@@ -1589,6 +1623,20 @@ class CurvePlot(BasePlot):
             item.setRenderHint(QwtPlotItem.RenderAntialiased, self.antialiased)
         BasePlot.add_item(self, item, z)
 
+    def add_items(self, items, z=None):
+        """
+        Add several *plot item* instances to this *plot widget*
+        
+            * items: list of :py:data:`qwt.QwtPlotItem` objects implementing
+              the :py:data:`plotpy.interfaces.IBasePlotItem` interface
+            * z: first item's z order (None -> z = max(self.get_items())+1)
+        """
+        for item in items:
+            if isinstance(item, QwtPlotCurve):
+                item.setRenderHint(QwtPlotItem.RenderAntialiased,
+                                   self.antialiased)
+        BasePlot.add_items(self, items, z)
+
     def del_all_items(self, except_grid=True):
         """Del all items, eventually (default) except grid"""
         items = [item for item in self.items
@@ -1623,26 +1671,30 @@ class CurvePlot(BasePlot):
         auto = self.autoReplot()
         self.setAutoReplot(False)
         # XXX implement the case when axes are synchronised
-        for axis_id in self.AXIS_IDS if axis_id is None else [axis_id]:
-            vmin, vmax = None, None
-            if not self.axisEnabled(axis_id):
-                continue
-            for item in self.get_items():
-                if isinstance(item, self.AUTOSCALE_TYPES) \
-                   and not item.is_empty() and item.isVisible():
-                    bounds = item.boundingRect()
-                    if axis_id == item.xAxis():
-                        xmin, xmax = bounds.left(), bounds.right()
-                        if vmin is None or xmin < vmin:
-                            vmin = xmin
-                        if vmax is None or xmax > vmax:
-                            vmax = xmax
-                    elif axis_id == item.yAxis():
-                        ymin, ymax = bounds.top(), bounds.bottom()
-                        if vmin is None or ymin < vmin:
-                            vmin = ymin
-                        if vmax is None or ymax > vmax:
-                            vmax = ymax
+        axis_ids = [_id for _id in (self.AXIS_IDS if axis_id is None
+                                    else [axis_id]) if self.axisEnabled(_id)]
+        # Computing limits of all axes at once: each item's bounding
+        # rectangle is requested only once
+        limits = dict([(_id, [None, None]) for _id in axis_ids])
+        for item in self.get_items():
+            if isinstance(item, self.AUTOSCALE_TYPES) \
+               and not item.is_empty() and item.isVisible():
+                xlimits = limits.get(item.xAxis())
+                ylimits = limits.get(item.yAxis())
+                if xlimits is None and ylimits is None:
+                    continue
+                bounds = item.boundingRect()
+                for vlimits, vmin, vmax in (
+                        (xlimits, bounds.left(), bounds.right()),
+                        (ylimits, bounds.top(), bounds.bottom())):
+                    if vlimits is None:
+                        continue
+                    if vlimits[0] is None or vmin < vlimits[0]:
+                        vlimits[0] = vmin
+                    if vlimits[1] is None or vmax > vlimits[1]:
+                        vlimits[1] = vmax
+        for axis_id in axis_ids:
+            vmin, vmax = limits[axis_id]
             if vmin is None or vmax is None:
                 continue
             if vmin == vmax: # same behavior as MATLAB
@@ -19,8 +19,9 @@ The `event` module handles event management (states, event filter, ...).
 from __future__ import print_function
 
 import weakref
-from plotpy.qt.QtCore import QEvent, Qt, QObject, QPointF, Signal
-from plotpy.qt.QtGui import QKeySequence
+import time
+from plotpy.qt.QtCore import QEvent, Qt, QObject, QPointF, Signal, QTimer
+from plotpy.qt.QtGui import QKeySequence, QMouseEvent
 
 CursorShape = type(Qt.ArrowCursor)
 
@@ -139,6 +140,10 @@ class MouseMoveMatch(MouseEventMatch):
 class StatefulEventFilter(QObject):
     """Gestion d'une machine d'état pour les événements
     d'un canvas
+    
+    Mouse move events are compressed: when they are received faster than
+    the mouse move interval (see `set_mouse_move_interval`), only the 
+    last one is processed, once the interval has elapsed
     """
     def __init__(self, parent):
         super(StatefulEventFilter, self).__init__()
@@ -149,14 +154,75 @@ class StatefulEventFilter(QObject):
         self.events = {}
         self.plot = parent
         self.all_event_types = frozenset()
+        self.mouse_move_interval = CONF.get("plot", "mouse_move/interval", 16)
+        self._pending_mouse_move = None
+        self._last_mouse_move_time = 0.
+        self._mouse_move_timer = QTimer(self)
+        self._mouse_move_timer.setSingleShot(True)
+        self._mouse_move_timer.timeout.connect(self.flush_mouse_move)
 
     def eventFilter(self, _obj, event):
         """Le callback 'eventfilter' pour Qt"""
         if not hasattr(self, "all_event_types"):
             print(repr(self), self)
-        if event.type() not in self.all_event_types:
+        evt_type = event.type()
+        if evt_type not in self.all_event_types:
             return False
+        if evt_type == QEvent.MouseMove and self.mouse_move_interval > 0:
+            self.__compress_mouse_move(event)
+        else:
+            # Pending mouse move has to be processed first (state machine)
+            self.flush_mouse_move()
+            self.__dispatch(event)
+        return False
 
+    def set_mouse_move_interval(self, interval):
+        """
+        Set the minimum interval between two processed mouse move events 
+        (in milliseconds): default value (see configuration option 
+        "mouse_move/interval") corresponds to a 60Hz display refresh rate
+        
+        Mouse move events are not compressed if *interval* is 0
+        """
+        self.mouse_move_interval = interval
+        if interval <= 0:
+            self.flush_mouse_move()
+
+    def get_mouse_move_interval(self):
+        """Return the minimum interval between two processed mouse move 
+        events (in milliseconds)"""
+        return self.mouse_move_interval
+
+    def __compress_mouse_move(self, event):
+        """Process mouse move event now or later, depending on the time 
+        elapsed since the last processed mouse move event"""
+        if not self._mouse_move_timer.isActive():
+            elapsed = (time.time()-self._last_mouse_move_time)*1000
+            if elapsed >= self.mouse_move_interval:
+                self.__dispatch_mouse_move(event)
+                return
+            self._mouse_move_timer.start(int(self.mouse_move_interval
+                                             -elapsed)+1)
+        # Qt deletes the event after filtering: a copy is kept (replacing 
+        # the previous pending mouse move event, if any)
+        self._pending_mouse_move = QMouseEvent(event.type(), event.pos(),
+                                               event.globalPos(),
+                                               event.button(), event.buttons(),
+                                               event.modifiers())
+
+    def flush_mouse_move(self):
+        """Process pending mouse move event now, if any"""
+        self._mouse_move_timer.stop()
+        event, self._pending_mouse_move = self._pending_mouse_move, None
+        if event is not None:
+            self.__dispatch_mouse_move(event)
+
+    def __dispatch_mouse_move(self, event):
+        self._last_mouse_move_time = time.time()
+        self.__dispatch(event)
+
+    def __dispatch(self, event):
+        """Call handlers matching event in current state"""
         state = self.states[self.state]
 #        from pprint import pprint
 #        print self.state
@@ -166,7 +232,6 @@ class StatefulEventFilter(QObject):
                 self.set_state(next_state, event)
                 for call in call_list:
                     call(self, event) # might change state
-        return False
 
     def set_state(self, state, event):
         """Change l'état courant.
@@ -585,7 +650,8 @@ class ObjectHandler(object):
             self.undo_action = UndoMovePoint(self.active, self.first_pos,
                                              event.pos(), self.handle, ctrl)
         self.last_pos = QPointF(event.pos())
-        filter.plot.replot()
+        plot = filter.plot
+        plot.replot_overlay([self.active]+plot.get_selected_items())
         
     def stop_tracking(self, filter, event):
         self.add_undo_move_action(self.undo_action)
@@ -636,7 +702,7 @@ class RectangularSelectionHandler(DragHandler):
     def move(self, filter, event):
         self.shape.move_local_point_to(self.shape_h1, event.pos())
         self.move_action(filter, event)
-        filter.plot.replot()
+        filter.plot.replot_overlay([self.shape])
         
     def move_action(self, filter, event):
         """Les classes derivees peuvent surcharger cette methode"""
@@ -12,6 +12,7 @@ Reader and Writer for the serialization of DataSets into HDF5 files
 from __future__ import print_function
 
 import sys
+import multiprocessing
 from uuid import uuid1
 
 import h5py
@@ -21,7 +22,7 @@ from plotpy.utils import utf8_to_unicode
 from plotpy.userconfigio import BaseIOHandler, WriterMixin
 
 from plotpy.py3compat import (PY2, PY3, is_binary_string, to_binary_string,
-                               to_text_string)
+                               to_text_string, is_unicode)
 
 
 class TypeConverter(object):
@@ -108,11 +109,70 @@ class Attr(object):
         self.set_value(struct, value)
 
 
-def createdset(group, name, value):
-    group.create_dataset(name,
-                         compression=None,
-                         #compression_opts=3,
-                         data=value)
+class StoragePolicy(object):
+    """
+    Storage policy for HDF5 array datasets
+    
+        * compression: None (no compression), 'gzip' or 'lzf'
+        * level: gzip compression level (0-9, default: 4)
+        * shuffle: if True, apply shuffle filter before compression
+        * min_bytes: arrays smaller than this size (in bytes) are stored 
+          contiguously and without compression
+        * chunk_bytes: target size of chunks (in bytes)
+    
+    Arrays which are large enough are chunked: chunk shape is obtained by 
+    halving the largest dimension until chunk size is lower than 
+    `chunk_bytes`, so that images are split into nearly square tiles 
+    (reading a slice of the dataset reads only the intersecting chunks).
+    """
+    def __init__(self, compression=None, level=None, shuffle=False,
+                 min_bytes=65536, chunk_bytes=1048576):
+        assert compression in (None, 'gzip', 'lzf')
+        self.compression = compression
+        if compression == 'gzip' and level is None:
+            level = 4
+        self.level = level
+        self.shuffle = shuffle
+        self.min_bytes = min_bytes
+        self.chunk_bytes = chunk_bytes
+
+    def get_chunk_shape(self, shape, itemsize):
+        """Return chunk shape for an array of shape *shape*"""
+        chunks = list(shape)
+        maxsize = max(self.chunk_bytes//itemsize, 1)
+        while int(np.prod(chunks)) > maxsize:
+            idx = chunks.index(max(chunks))
+            chunks[idx] = (chunks[idx]+1)//2
+        return tuple(chunks)
+
+    def get_options(self, value):
+        """Return `h5py.Group.create_dataset` keyword arguments
+        for storing array *value*"""
+        value = np.asanyarray(value)
+        if value.dtype.hasobject or value.ndim == 0\
+           or value.nbytes < self.min_bytes:
+            return {}
+        options = dict(chunks=self.get_chunk_shape(value.shape,
+                                                   value.dtype.itemsize))
+        if self.compression is not None:
+            options['compression'] = self.compression
+            if self.compression == 'gzip':
+                options['compression_opts'] = self.level
+            options['shuffle'] = self.shuffle
+        return options
+
+CONTIGUOUS_STORAGE = StoragePolicy(min_bytes=np.inf)
+CHUNKED_STORAGE = StoragePolicy()
+GZIP_STORAGE = StoragePolicy('gzip', shuffle=True)
+LZF_STORAGE = StoragePolicy('lzf', shuffle=True)
+
+
+def createdset(group, name, value, storage=None):
+    """Create dataset *name* in *group* from array *value*,
+    using *storage* policy (default: contiguous storage)"""
+    if storage is None:
+        storage = CONTIGUOUS_STORAGE
+    group.create_dataset(name, data=value, **storage.get_options(value))
 
 
 class Dset(Attr):
@@ -161,6 +221,241 @@ class Dlist(Dset):
         setattr(struct, self.struct_name, list(value))
 
 
+#==============================================================================
+# Deferred HDF5 datasets
+#==============================================================================
+class LazyArray(object):
+    """
+    Deferred HDF5 dataset: data is read from file on first access
+    
+        * filename: HDF5 filename
+        * path: dataset path in HDF5 file
+        * dset (optional): h5py dataset object (when file is already open)
+    
+    Shape and data type are available without reading data. Slicing a 
+    `LazyArray` object which has not been materialized yet reads only the 
+    requested part of the dataset. Any other access (NumPy function call, 
+    arithmetic operation, array attribute or method) materializes the array.
+    
+    If the HDF5 file has been closed in the meantime, it is opened again
+    (read-only) when data is read.
+    """
+    def __init__(self, filename, path, dset=None):
+        self.filename = filename
+        self.path = path
+        self._dset = dset
+        self._value = None
+        self._meta = None
+
+    def __reduce__(self):
+        if self._value is not None:
+            return (np.asarray, (self._value,))
+        return (self.__class__, (self.filename, self.path))
+
+    def __repr__(self):
+        if self._value is not None:
+            return repr(self._value)
+        return "<LazyArray %r in %r: shape %r, dtype %r>" % (
+                    self.path, self.filename, self.shape, self.dtype)
+
+    def _read(self, key=Ellipsis):
+        """Read (part of) dataset from file"""
+        if self._dset is not None and self._dset.id.valid:
+            return self._dset[key]
+        self._dset = None
+        with h5py.File(self.filename, mode="r") as h5:
+            return h5[self.path][key]
+
+    def _get_meta(self):
+        if self._meta is None:
+            if self._dset is not None and self._dset.id.valid:
+                dset = self._dset
+                self._meta = dset.shape, dset.dtype
+            else:
+                with h5py.File(self.filename, mode="r") as h5:
+                    dset = h5[self.path]
+                    self._meta = dset.shape, dset.dtype
+        return self._meta
+
+    @property
+    def shape(self):
+        if self._value is not None:
+            return self._value.shape
+        return self._get_meta()[0]
+
+    @property
+    def dtype(self):
+        if self._value is not None:
+            return self._value.dtype
+        return self._get_meta()[1]
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def is_materialized(self):
+        """Return True if data has already been read"""
+        return self._value is not None
+
+    def materialize(self):
+        """Read data (if not already done) and return NumPy array"""
+        if self._value is None:
+            self._value = self._read()
+            self._dset = None
+        return self._value
+
+    def __array__(self, dtype=None, copy=None):
+        value = self.materialize()
+        if dtype is not None and np.dtype(dtype) != value.dtype:
+            if copy is False:
+                raise ValueError("unable to avoid copy while converting "
+                                 "LazyArray to %s" % np.dtype(dtype))
+            return value.astype(dtype)
+        if copy:
+            return value.copy()
+        return value
+
+    def __getitem__(self, key):
+        if self._value is None:
+            return self._read(key)
+        return self._value[key]
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+def _forward_to_array(name):
+    def method(self, *args):
+        return getattr(self.materialize(), name)(*args)
+    method.__name__ = name
+    return method
+
+for _name in ('__add__', '__radd__', '__sub__', '__rsub__', '__mul__',
+              '__rmul__', '__truediv__', '__rtruediv__', '__div__',
+              '__rdiv__', '__floordiv__', '__rfloordiv__', '__mod__',
+              '__pow__', '__neg__', '__pos__', '__abs__', '__lt__', '__le__',
+              '__eq__', '__ne__', '__gt__', '__ge__', '__and__', '__or__',
+              '__invert__', '__float__', '__int__', '__bool__',
+              '__nonzero__'):
+    setattr(LazyArray, _name, _forward_to_array(_name))
+del _name
+LazyArray.__hash__ = object.__hash__
+
+def materialize(value):
+    """Return NumPy array from `LazyArray` object
+    (other objects are returned unchanged)"""
+    if isinstance(value, LazyArray):
+        return value.materialize()
+    return value
+
+
+#==============================================================================
+# Packed attributes
+#==============================================================================
+#: Name of the root group holding packed attributes tables
+PACKED_ATTRS = "__attrs__"
+#: Name of the packed attributes field holding group path
+PACKED_PATH = "__path__"
+#: Sequences larger than this may be stored as datasets instead of 
+#: attributes (HDF5 attributes can't exceed the 64 kB object header limit)
+MAX_ATTRIBUTE_SIZE = 16384
+#: Arrays smaller than this (in bytes) are packed with attributes instead 
+#: of being stored as datasets
+PACKED_ARRAY_MAXSIZE = 4096
+
+def _attr_key(name):
+    """Return native string corresponding to attribute or group *name*"""
+    if PY3 and is_binary_string(name):
+        return name.decode("utf-8")
+    elif PY2 and is_unicode(name):
+        return name.encode("utf-8")
+    return name
+
+def _path_key(path):
+    """Return HDF5 path of group *path* (tuple of group names)"""
+    return "/"+"/".join([_attr_key(name) for name in path])
+
+def _attr_field(value):
+    """Return (value, dtype, shape) field of attribute *value*, 
+    or None if value can't be packed (numbers, strings, numeric 
+    arrays and sequences of numbers or binary strings only)"""
+    if is_unicode(value):
+        value = value.encode("utf-8")
+    if is_binary_string(value):
+        return value, np.dtype("S%d" % max(len(value), 1)), ()
+    if isinstance(value, (list, tuple)) and len(value) == 0:
+        return
+    arr = np.asarray(value)
+    if arr.dtype.kind not in "biuf" and (arr.dtype.kind != "S"
+                                         or arr.ndim != 1):
+        return
+    return arr, arr.dtype, arr.shape
+
+def pack_attributes(groups):
+    """Pack attributes of groups (dictionary: group path --> attributes) 
+    into NumPy structured arrays: one record per group, one array per 
+    set of attribute names and types (strings of any length share the 
+    same array).
+    Return list of structured arrays and dictionary of attributes which 
+    could not be packed (group path --> attributes)"""
+    layouts, others = {}, {}
+    for path, attrs in groups.items():
+        fields = []
+        for name, value in attrs.items():
+            field = _attr_field(value)
+            if field is None:
+                others.setdefault(path, {})[name] = value
+            else:
+                fields.append((_attr_key(name),)+field)
+        if not fields:
+            continue
+        fields.sort(key=lambda field: field[0])
+        key = tuple([(name, dtype.kind if dtype.kind == "S" else dtype.str,
+                      shape) for name, _v, dtype, shape in fields])
+        path = to_binary_string(_path_key(path))
+        layouts.setdefault(key, []).append([path]+fields)
+    tables = []
+    for rows in layouts.values():
+        # Sizes of string fields are the largest of all records
+        sizes = [max([row[index][2].itemsize if index else len(row[0])
+                      for row in rows])
+                 for index in range(len(rows[0]))]
+        dtype = [(PACKED_PATH, "S%d" % sizes[0])]
+        for size, (name, _v, ftype, shape) in zip(sizes[1:], rows[0][1:]):
+            if ftype.kind == "S":
+                ftype = "S%d" % size
+            dtype.append((name, ftype, shape))
+        values = [tuple([row[0]]+[field[1] for field in row[1:]])
+                  for row in rows]
+        tables.append(np.array(values, dtype=dtype))
+    return tables, others
+
+def read_packed_attributes(h5):
+    """Read packed attributes tables of HDF5 file *h5*.
+    Return dictionary: group path --> attributes"""
+    groups = {}
+    if PACKED_ATTRS in h5:
+        for dset in h5[PACKED_ATTRS].values():
+            table = dset[...]
+            names = [name for name in table.dtype.names
+                     if name != PACKED_PATH]
+            for row in table:
+                groups[_attr_key(row[PACKED_PATH])] =\
+                                dict([(name, row[name]) for name in names])
+    return groups
+
+
 #==============================================================================
 # Base HDF5 Store object: do not break API compatibility here as this class is 
 # used in various critical projects for saving/loading application data
@@ -169,6 +464,12 @@ class H5Store(object):
     def __init__(self, filename):
         self.filename = filename
         self.h5 = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def open(self, mode="a"):
         """Open an hdf5 file"""
@@ -221,20 +522,81 @@ class HDF5Handler(H5Store, BaseIOHandler):
     def __init__(self, filename):
         H5Store.__init__(self, filename)
         self.option = []
-        
+        self._groups = {}
+
+    def close(self):
+        self._groups = {}
+        H5Store.close(self)
+
+    def get_group(self, path):
+        """Return group from path (tuple of group names)"""
+        try:
+            return self._groups[path]
+        except KeyError:
+            parent = self.h5 if not path else self.get_group(path[:-1])
+            if path:
+                parent = self.open_group(parent, path[-1])
+            self._groups[path] = parent
+            return parent
+
+    def open_group(self, parent, name):
+        """Return group *name* of *parent*, creating it if necessary"""
+        return parent.require_group(name)
+
     def get_parent_group(self):
-        parent = self.h5
-        for option in self.option[:-1]:
-            parent = parent.require_group(option)
-        return parent
+        return self.get_group(tuple(self.option[:-1]))
 
 class HDF5Writer(HDF5Handler, WriterMixin):
-    """Writer for HDF5 files"""
-    def __init__(self, filename):
+    """
+    Writer for HDF5 files
+    
+    storage: :py:class:`plotpy.hdf5io.StoragePolicy` object applied to 
+    arrays (e.g. image data or curve data), default: contiguous storage.
+    Predefined policies: `CONTIGUOUS_STORAGE`, `CHUNKED_STORAGE`, 
+    `GZIP_STORAGE` and `LZF_STORAGE`. This policy may be overridden for 
+    a given array with the `storage` argument of `write_array`.
+    
+    packed: if True, attributes (scalar values, strings and sequences) 
+    and small arrays (:py:data:`PACKED_ARRAY_MAXSIZE` bytes at most) are 
+    buffered and written at once when closing the file, in a few tables 
+    shared by all groups (one record per group): groups holding attributes 
+    only are not even created (files written this way may be read with 
+    :py:class:`plotpy.hdf5io.HDF5Reader` only). Buffered attributes are 
+    also written when leaving a `with` statement on an exception.
+    """
+    def __init__(self, filename, storage=None, packed=False):
         super(HDF5Writer, self).__init__(filename)
+        self.storage = storage
+        self.packed = packed
+        self._pending_attrs = {}
         self.open("w")
 
+    def close(self):
+        try:
+            if self.h5 and self._pending_attrs:
+                self.__write_attributes()
+        finally:
+            self._pending_attrs = {}
+            super(HDF5Writer, self).close()
+
+    def __write_attributes(self):
+        """Write buffered attributes"""
+        tables, others = pack_attributes(self._pending_attrs)
+        if tables:
+            group = self.h5.require_group(PACKED_ATTRS)
+            for index, table in enumerate(tables):
+                group.create_dataset("table%d" % index, data=table)
+        for path, attrs in others.items():
+            group = self.get_group(path)
+            for name, value in attrs.items():
+                group.attrs[name] = value
+
     def write_any(self, val):
+        if self.packed:
+            path = tuple(self.option[:-1])
+            attrs = self._pending_attrs.setdefault(path, {})
+            attrs[self.option[-1]] = val
+            return
         group = self.get_parent_group()
         group.attrs[self.option[-1]] = val
     
@@ -246,20 +608,43 @@ class HDF5Writer(HDF5Handler, WriterMixin):
     write_str = write_any
 
     def write_unicode(self, val):
-        group = self.get_parent_group()
-        group.attrs[self.option[-1]] = val.encode("utf-8")
+        self.write_any(val.encode("utf-8"))
     if PY3:
         write_unicode = write_str
 
-    def write_array(self, val):
+    def write_array(self, val, storage=None):
+        """Write array *val*, using *storage* policy
+        (default: writer's storage policy)"""
+        if self.packed and 0 < val.nbytes <= PACKED_ARRAY_MAXSIZE\
+           and val.dtype.kind in "biuf":
+            self.write_any(val)
+            return
+        if storage is None:
+            storage = self.storage
         group = self.get_parent_group()
-        group[self.option[-1]] = val
+        createdset(group, self.option[-1], val, storage)
     
-    write_sequence = write_any
+    def write_sequence(self, val):
+        large = len(val) and np.asarray(val).nbytes > MAX_ATTRIBUTE_SIZE
+        if self.packed:
+            if not large or _attr_field(val) is not None:
+                self.write_any(val)
+                return
+        else:
+            # Sequences are stored as attributes as long as HDF5 accepts 
+            # them, so that layout of files written before is unchanged
+            try:
+                self.write_any(val)
+                return
+            except (ValueError, RuntimeError, EnvironmentError):
+                if not large:
+                    raise
+        # Too large to be stored as an attribute
+        group = self.get_parent_group()
+        group.create_dataset(self.option[-1], data=val)
     
     def write_none(self):
-        group = self.get_parent_group()
-        group.attrs[self.option[-1]] = ""
+        self.write_any("")
 
     def write_object_list(self, seq, group_name):
         """Write object sequence in group.
@@ -279,12 +664,77 @@ class HDF5Writer(HDF5Handler, WriterMixin):
                             obj.serialize(self)
                 self.write(ids, 'IDs')
 
+#: Readers of `read_object_list` worker processes (file is opened and packed
+#: attributes are read only once per process)
+_WORKER_READERS = {}
+
+def _read_object(args):
+    """Read object from HDF5 file (function run by `read_object_list` 
+    worker processes)"""
+    filename, path, klass, lazy = args
+    try:
+        reader = _WORKER_READERS[filename]
+    except KeyError:
+        reader = _WORKER_READERS[filename] = HDF5Reader(filename)
+    reader.lazy = lazy
+    reader.option = list(path)
+    if reader.has_attribute(tuple(path[:-1]), path[-1]):
+        # This is an attribute (not a group), meaning that 
+        # the object was None when deserializing it
+        return None
+    obj = klass()
+    obj.deserialize(reader)
+    return obj
+
 class HDF5Reader(HDF5Handler):
-    """Reader for HDF5 files"""
-    def __init__(self, filename):
+    """
+    Reader for HDF5 files
+    
+    lazy: if True, arrays are not read when deserializing objects: 
+    `read_array` returns `LazyArray` objects instead, which are materialized
+    on first access (see also the `lazy` argument of `read_object_list`)
+    """
+    def __init__(self, filename, lazy=False):
         super(HDF5Reader, self).__init__(filename)
+        self.lazy = lazy
+        self._packed_attrs = None
         self.open("r")
 
+    def close(self):
+        self._packed_attrs = None
+        super(HDF5Reader, self).close()
+
+    def open_group(self, parent, name):
+        """Return group *name* of *parent*"""
+        return parent[name]
+
+    def get_packed_attributes(self, path):
+        """Return packed attributes of group *path* (tuple of group names), 
+        reading packed attributes of all groups at once on first access"""
+        if self._packed_attrs is None:
+            self._packed_attrs = read_packed_attributes(self.h5)
+        return self._packed_attrs.get(_path_key(path), {})
+
+    def has_attribute(self, path, name):
+        """Return True if group *path* (tuple of group names) 
+        has attribute *name*"""
+        if _attr_key(name) in self.get_packed_attributes(path):
+            return True
+        try:
+            group = self.get_group(path)
+        except KeyError:
+            # Group holding packed attributes only
+            return False
+        return name in group.attrs
+
+    def get_attribute(self, path, name):
+        """Return attribute *name* of group *path* (tuple of group names)"""
+        attrs = self.get_packed_attributes(path)
+        key = _attr_key(name)
+        if key in attrs:
+            return attrs[key]
+        return self.get_group(path).attrs[name]
+
     def read(self, group_name=None, func=None, instance=None):
         """Read value within current group or group_name.
 
@@ -297,8 +747,7 @@ class HDF5Reader(HDF5Handler):
                 func = self.read_any
             val = func()
         else:
-            group = self.get_parent_group()
-            if group_name in group.attrs:
+            if self.has_attribute(tuple(self.option[:-1]), group_name):
                 # This is an attribute (not a group), meaning that 
                 # the object was None when deserializing it
                 val = None
@@ -310,8 +759,7 @@ class HDF5Reader(HDF5Handler):
         return val
 
     def read_any(self):
-        group = self.get_parent_group()
-        value = group.attrs[self.option[-1]]
+        value = self.get_attribute(tuple(self.option[:-1]), self.option[-1])
         if is_binary_string(value):
             return value.decode("utf-8")
         else:
@@ -334,15 +782,48 @@ class HDF5Reader(HDF5Handler):
 
     read_unicode = read_str = read_any
     
+    def read_packed_array(self):
+        """Read small array packed with attributes (see `HDF5Writer`), 
+        return None if array is stored as a dataset"""
+        attrs = self.get_packed_attributes(tuple(self.option[:-1]))
+        key = _attr_key(self.option[-1])
+        if key in attrs:
+            return np.array(attrs[key])
+
     def read_array(self):
+        """Read array: return a `LazyArray` object in lazy mode, 
+        a NumPy array otherwise (or if array is a packed small array)"""
+        value = self.read_packed_array()
+        if value is not None:
+            return value
+        group = self.get_parent_group()
+        dset = group[self.option[-1]]
+        if self.lazy:
+            return LazyArray(self.filename, dset.name, dset)
+        return dset[...]
+
+    def read_ndarray(self):
+        """Read array: always return a NumPy array, even in lazy mode
+        (this is used by curves and shapes, which require actual arrays: 
+        image items read their data with `read_array` and keep deferred 
+        datasets until data is accessed)"""
+        value = self.read_packed_array()
+        if value is not None:
+            return value
         group = self.get_parent_group()
         return group[self.option[-1]][...]
         
     def read_sequence(self):
-        group = self.get_parent_group()
-        return list(group.attrs[self.option[-1]])
+        path, name = tuple(self.option[:-1]), self.option[-1]
+        if not self.has_attribute(path, name):
+            # Sequence too large to be stored as an attribute
+            group = self.get_group(path)
+            if name in group:
+                return list(group[name][...])
+        return list(self.get_attribute(path, name))
     
-    def read_object_list(self, group_name, klass, progress_callback=None):
+    def read_object_list(self, group_name, klass, progress_callback=None,
+                         lazy=None, processes=None):
         """Read object sequence in group.
         Objects must implement the DataSet-like `deserialize` method.
         `klass` is the object class which constructor requires no argument.
@@ -351,7 +832,21 @@ class HDF5Reader(HDF5Handler):
         an integer argument (progress: 0 --> 100). Function returns the 
         `cancel` state (True: progress dialog has been canceled, False 
         otherwise)
+        
+        lazy: if True, arrays are returned as `LazyArray` objects, i.e. data
+        is read only when accessed (default: reader's `lazy` attribute)
+        
+        processes: if not None, objects are deserialized in parallel in a 
+        pool of worker processes (0: number of CPUs) -- `klass` must be
+        picklable (i.e. defined at module level), as well as its instances.
+        Deserialized objects are sent back to this process through the pool
+        pipe, arrays included (only unread `LazyArray` objects are sent as 
+        references): parallel mode is worthwhile when deserialization is 
+        CPU bound (e.g. many small objects), not for array-heavy files 
+        -- note that plot items always read their arrays (see `read_ndarray`)
         """
+        if lazy is None:
+            lazy = self.lazy
         with self.group(group_name):
             try:
                 ids = self.read('IDs', func=self.read_sequence)
@@ -359,22 +854,54 @@ class HDF5Reader(HDF5Handler):
                 # None was saved instead of list of objects
                 self.end('IDs')
                 return
+            if processes is not None:
+                return self.__read_objects_in_pool(ids, klass,
+                                                   progress_callback,
+                                                   lazy, processes)
             seq = []
             count = len(ids)
-            for idx, name in enumerate(ids):
+            old_lazy, self.lazy = self.lazy, lazy
+            try:
+                for idx, name in enumerate(ids):
+                    if progress_callback is not None:
+                        if progress_callback(int(100*float(idx)/count)):
+                            break
+                    with self.group(name):
+                        if self.has_attribute(tuple(self.option[:-1]),
+                                              name):
+                            # This is an attribute (not a group), meaning 
+                            # that the object was None when deserializing it
+                            obj = None
+                        else:
+                            obj = klass()
+                            obj.deserialize(self)
+                    seq.append(obj)
+            finally:
+                self.lazy = old_lazy
+        return seq
+
+    def __read_objects_in_pool(self, ids, klass, progress_callback, lazy,
+                               processes):
+        """Read objects in a pool of worker processes"""
+        count = len(ids)
+        tasks = [(self.filename, self.option+[name], klass, lazy)
+                 for name in ids]
+        pool = multiprocessing.Pool(processes or None)
+        seq = []
+        try:
+            for idx, obj in enumerate(pool.imap(_read_object, tasks)):
                 if progress_callback is not None:
                     if progress_callback(int(100*float(idx)/count)):
+                        pool.terminate()
                         break
-                with self.group(name):
-                    group = self.get_parent_group()
-                    if name in group.attrs:
-                        # This is an attribute (not a group), meaning that 
-                        # the object was None when deserializing it
-                        obj = None
-                    else:
-                        obj = klass()
-                        obj.deserialize(self)
                 seq.append(obj)
+            else:
+                pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
         return seq
 
     read_none = read_any
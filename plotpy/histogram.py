@@ -181,7 +181,7 @@ class HistogramItem(CurveItem):
         # Autoscale only if logscale/bins have changed
         if self.bins != self.old_bins or self.logscale != self.old_logscale:
             if self.plot():
-                self.plot().do_autoscale()
+                self.plot().do_autoscale(replot=False)
         self.old_bins = self.bins
         self.old_logscale = self.logscale
         
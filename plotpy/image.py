@@ -149,7 +149,8 @@ from math import fabs
 import numpy as np
 
 from plotpy.qt.QtGui import QColor, QImage
-from plotpy.qt.QtCore import QRectF, QPointF, QRect
+from plotpy.qt.QtCore import (QRectF, QPointF, QRect, QObject, QRunnable,
+                              QThreadPool, Signal)
 
 from plotpy.utils import assert_interfaces_valid, update_dataset
 from plotpy.py3compat import getcwd, is_text_string
@@ -187,6 +188,9 @@ except ImportError:
 LUT_SIZE = 1024
 LUT_MAX  = float(LUT_SIZE-1)
 
+#: Tolerance (in destination pixels) used when rounding export crop bounds
+EXPORT_ROI_EPS = 1e-6
+
 def _nanmin(data):
     if isinstance(data, np.ma.MaskedArray):
         data = data.data
@@ -204,6 +208,40 @@ def _nanmax(data):
         return data.max()
 
 
+def _summed_area_tables(data):
+    """
+    Return summed-area tables (sums and sums of squares) of image data:
+    ``sat[j, i]`` is the sum of ``data[:j, :i]``
+    
+    Return None if data is not supported (masked arrays, NaN values, ...)
+    """
+    if isinstance(data, np.ma.MaskedArray) or data.ndim != 2:
+        return None
+    kind = data.dtype.kind
+    if kind in 'iub' and data.dtype.itemsize <= 2:
+        # 8/16-bit integer data: exact computation (sums of squares of 
+        # 16-bit values can't overflow 64-bit accumulators before 2**31 
+        # pixels)
+        acc = np.int64
+    elif kind in 'iu':
+        # 32/64-bit integer data: sums of squares may overflow int64
+        acc = np.float64
+    elif kind == 'f':
+        if np.isnan(data).any():
+            return None
+        acc = np.float64
+    else:
+        return None
+    ni, nj = data.shape
+    tables = []
+    for values in (data, np.square(data, dtype=acc)):
+        sat = np.zeros((ni+1, nj+1), acc)
+        np.cumsum(values, axis=0, dtype=acc, out=sat[1:, 1:])
+        np.cumsum(sat[1:, 1:], axis=1, out=sat[1:, 1:])
+        tables.append(sat)
+    return tuple(tables)
+
+
 def pixelround(x, corner=None):
     """
     Return pixel index (int) from pixel coordinate (float)
@@ -277,8 +315,12 @@ class BaseImageItem(QwtPlotItem):
         self.setItemAttribute(QwtPlotItem.AutoScale)
         self.setItemAttribute(QwtPlotItem.Legend, True)
         self._filename = None # The file this image comes from
+        self._image_sequence = None
 
         self.histogram_cache = None
+        self._data_version = 0
+        self._use_prefix_sums = False
+        self._prefix_sums = None
         if data is not None:
             self.set_data(data)
         self.imageparam.update_image(self)
@@ -300,10 +342,100 @@ class BaseImageItem(QwtPlotItem):
                 fname = other_try
         return fname
 
+    def set_image_sequence(self, sequence):
+        """
+        Set image file sequence (:py:class:`plotpy.io.ImageSequence` object)
+        from which image files are read when loading data (the sequence 
+        caches decoded images and prefetches neighbour images)
+        
+        The previous sequence, if any, is closed (i.e. its cache is cleared 
+        and its prefetching thread is stopped)
+        """
+        old_sequence = self._image_sequence
+        if old_sequence is not None and old_sequence is not sequence:
+            old_sequence.close()
+        self._image_sequence = sequence
+
+    def get_image_sequence(self):
+        """Return image file sequence"""
+        return self._image_sequence
+
+    def read_image_file(self, fname, to_grayscale):
+        """Read image file *fname*: image is taken from the image file 
+        sequence if it contains this file (see `set_image_sequence`)"""
+        seq = self._image_sequence
+        if seq is not None and fname in seq\
+           and seq.to_grayscale == to_grayscale:
+            return seq.get_file(fname)
+        return io.imread(fname, to_grayscale=to_grayscale)
+
     def get_filter(self, filterobj, filterparam):
         """Provides a filter object over this image's content"""
         raise NotImplementedError
 
+    def __get_data(self):
+        data = self._data
+        if data is not None and not isinstance(data, np.ndarray)\
+           and hasattr(data, "materialize"):
+            # Deferred HDF5 dataset (see `plotpy.hdf5io.LazyArray`): 
+            # data is read on first access
+            data = self._data = data.materialize()
+        return data
+
+    def __set_data(self, data):
+        self._data = data
+
+    data = property(__get_data, __set_data,
+                    doc="Image data array (deferred HDF5 datasets, i.e. "
+                        "`plotpy.hdf5io.LazyArray` objects, are read on "
+                        "first access)")
+
+    def get_data_version(self):
+        """
+        Return data version number, which is incremented each time image
+        data is changed (using `set_data`) or when `data_changed` is called
+        """
+        return self._data_version
+
+    def data_changed(self):
+        """
+        Notify that image data has changed: this method has to be called
+        when data array has been modified in place, so that data-dependent
+        caches are invalidated
+        """
+        self._data_version += 1
+        self.histogram_cache = None
+        self._prefix_sums = None
+
+    def set_prefix_sums_enabled(self, state):
+        """
+        Enable/disable the use of summed-area tables (i.e. cumulative sums 
+        and sums of squares along both axes) to compute average cross sections
+        and statistics on rectangular areas
+        
+        Summed-area tables are computed once (when needed) after each data 
+        change: rectangle means and variances are then obtained in constant 
+        time and average profiles in O(width) or O(height), instead of O(area).
+        The memory cost is two 64-bit arrays of the size of the image.
+        """
+        self._use_prefix_sums = state
+        if not state:
+            self._prefix_sums = None
+
+    def get_prefix_sums(self):
+        """
+        Return summed-area tables (sums, sums of squares), 
+        or None if this feature is disabled or not supported by data
+        (see `set_prefix_sums_enabled`)
+        """
+        if not self._use_prefix_sums or self.data is None:
+            return None
+        if self._prefix_sums is None \
+           or self._prefix_sums[0] != self._data_version:
+            self._prefix_sums = (self._data_version,
+                                 _summed_area_tables(self.data))
+        return self._prefix_sums[1]
+
     def get_pixel_coordinates(self, xplot, yplot):
         """
         Return (image) pixel coordinates
@@ -467,7 +599,7 @@ class BaseImageItem(QwtPlotItem):
         if interp_mode in (INTERP_NEAREST, INTERP_LINEAR):
             self.interpolate = (interp_mode,)
         if interp_mode == INTERP_AA:
-            aa = np.ones((size, size), self.data.dtype)
+            aa = np.ones((size, size), self._data.dtype)
             self.interpolate = (interp_mode, aa)
 
     def get_interpolation(self):
@@ -611,7 +743,7 @@ class BaseImageItem(QwtPlotItem):
 
     def is_empty(self):
         """Return True if item data is empty"""
-        return self.data is None or self.data.size == 0
+        return self._data is None or self._data.size == 0
 
     def set_selectable(self, state):
         """Set item selectable state"""
@@ -716,11 +848,33 @@ class BaseImageItem(QwtPlotItem):
         else:
             return ydata
 
+    def __get_prefix_sums_rect(self, ix0, iy0, ix1, iy1):
+        """Return summed-area tables and index rectangle clipped to image 
+        bounds, or None if summed-area tables can't be used"""
+        tables = self.get_prefix_sums()
+        if tables is None:
+            return
+        ni, nj = self.data.shape
+        ix1, iy1 = min([ix1, nj]), min([iy1, ni])
+        if ix1 <= ix0 or iy1 <= iy0:
+            return
+        return tables, (ix0, iy0, ix1, iy1)
+
     def get_stats(self, x0, y0, x1, y1):
         """Return formatted string with stats on image rectangular area
         (output should be compatible with AnnotatedShape.get_infos)"""
         ix0, iy0, ix1, iy1 = self.get_closest_index_rect(x0, y0, x1, y1)
         data = self.data[iy0:iy1, ix0:ix1]
+        res = self.__get_prefix_sums_rect(ix0, iy0, ix1, iy1)
+        if res is None:
+            mean, std = data.mean(), data.std()
+        else:
+            (sat, sat2), (ix0, iy0, ix1, iy1) = res
+            size = float((ix1-ix0)*(iy1-iy0))
+            total, total2 = [t[iy1, ix1]-t[iy0, ix1]-t[iy1, ix0]+t[iy0, ix0]
+                             for t in (sat, sat2)]
+            mean = total/size
+            std = np.sqrt(max([total2/size-mean**2, 0.]))
         xfmt = self.imageparam.xformat
         yfmt = self.imageparam.yformat
         zfmt = self.imageparam.zformat
@@ -734,8 +888,8 @@ class BaseImageItem(QwtPlotItem):
                             "%s ≤ y ≤ %s" % (yfmt % y0, yfmt % y1),
                             "%s ≤ z ≤ %s" % (zfmt % data.min(),
                                               zfmt % data.max()),
-                            "‹z› = " + zfmt % data.mean(),
-                            "σ(z) = " + zfmt % data.std(),
+                            "‹z› = " + zfmt % mean,
+                            "σ(z) = " + zfmt % std,
                             ])
 
     def get_xsection(self, y0, apply_lut=False):
@@ -753,14 +907,26 @@ class BaseImageItem(QwtPlotItem):
     def get_average_xsection(self, x0, y0, x1, y1, apply_lut=False):
         """Return average cross section along x-axis"""
         ix0, iy0, ix1, iy1 = self.get_closest_index_rect(x0, y0, x1, y1)
-        ydata = self.data[iy0:iy1, ix0:ix1].mean(axis=0)
+        res = self.__get_prefix_sums_rect(ix0, iy0, ix1, iy1)
+        if res is None:
+            ydata = self.data[iy0:iy1, ix0:ix1].mean(axis=0)
+        else:
+            (sat, _sat2), (ix0, iy0, ix1, iy1) = res
+            sums = sat[iy1, ix0:ix1+1]-sat[iy0, ix0:ix1+1]
+            ydata = np.diff(sums)/float(iy1-iy0)
         return (self.get_x_values(ix0, ix1),
                 self.__process_cross_section(ydata, apply_lut))
 
     def get_average_ysection(self, x0, y0, x1, y1, apply_lut=False):
         """Return average cross section along y-axis"""
         ix0, iy0, ix1, iy1 = self.get_closest_index_rect(x0, y0, x1, y1)
-        ydata = self.data[iy0:iy1, ix0:ix1].mean(axis=1)
+        res = self.__get_prefix_sums_rect(ix0, iy0, ix1, iy1)
+        if res is None:
+            ydata = self.data[iy0:iy1, ix0:ix1].mean(axis=1)
+        else:
+            (sat, _sat2), (ix0, iy0, ix1, iy1) = res
+            sums = sat[iy0:iy1+1, ix1]-sat[iy0:iy1+1, ix0]
+            ydata = np.diff(sums)/float(ix1-ix0)
         return (self.get_y_values(iy0, iy1),
                 self.__process_cross_section(ydata, apply_lut))
 
@@ -829,8 +995,9 @@ class RawImageItem(BaseImageItem):
                                           func=reader.read_unicode))
             self.load_data()
         else:
+            # Image data is read on first access with lazy readers
             data = reader.read(group_name='Zdata', func=reader.read_array)
-            self.set_data(data)
+            self.set_data(data, lut_range=lut_range)
         self.set_lut_range(lut_range)
         self.setZ(reader.read('z'))
         self.imageparam = self.get_default_param()
@@ -843,9 +1010,17 @@ class RawImageItem(BaseImageItem):
         Load data from *filename* and eventually apply specified lut_range
         *filename* has been set using method 'set_filename'
         """
-        data = io.imread(self.get_filename(), to_grayscale=True)
+        data = self.read_image_file(self.get_filename(), to_grayscale=True)
         self.set_data(data, lut_range=lut_range)
 
+    def load_frame(self, index, lut_range=None):
+        """
+        Load image *index* of image file sequence (see `set_image_sequence`)
+        and eventually apply specified lut_range
+        """
+        self.set_filename(self._image_sequence.filenames[index])
+        self.load_data(lut_range=lut_range)
+
     def set_data(self, data, lut_range=None):
         """
         Set Image item data
@@ -859,15 +1034,15 @@ class RawImageItem(BaseImageItem):
             _min, _max = _nanmin(data), _nanmax(data)
 
         self.data = data
-        self.histogram_cache = None
+        self.data_changed()
         self.update_bounds()
         self.update_border()
         self.set_lut_range([_min, _max])
 
     def update_bounds(self):
-        if self.data is None:
+        if self._data is None:
             return
-        self.bounds = QRectF(0, 0, self.data.shape[1], self.data.shape[0])
+        self.bounds = QRectF(0, 0, self._data.shape[1], self._data.shape[0])
 
     #---- IBasePlotItem API ---------------------------------------------------
     def types(self):
@@ -974,7 +1149,7 @@ class ImageItem(RawImageItem):
         if xmin is None:
             xmin = 0.
         if xmax is None:
-            xmax = self.data.shape[1]
+            xmax = self._data.shape[1]
         return xmin, xmax
 
     def get_ydata(self):
@@ -983,7 +1158,7 @@ class ImageItem(RawImageItem):
         if ymin is None:
             ymin = 0.
         if ymax is None:
-            ymax = self.data.shape[0]
+            ymax = self._data.shape[0]
         return ymin, ymax
 
     def set_xdata(self, xmin=None, xmax=None):
@@ -993,7 +1168,7 @@ class ImageItem(RawImageItem):
         self.ymin, self.ymax = ymin, ymax
 
     def update_bounds(self):
-        if self.data is None:
+        if self._data is None:
             return
         (xmin, xmax), (ymin, ymax) = self.get_xdata(), self.get_ydata()
         self.bounds = QRectF(QPointF(xmin, ymin), QPointF(xmax, ymax))
@@ -1123,7 +1298,7 @@ class QuadGridItem(RawImageItem):
             _min, _max = _nanmin(data), _nanmax(data)
 
         self.data = data
-        self.histogram_cache = None
+        self.data_changed()
         if X is not None:
             assert Y is not None
             self.X = X
@@ -1238,7 +1413,7 @@ class TrImageItem(RawImageItem):
     #--- RawImageItem API -----------------------------------------------------
     def set_data(self, data, lut_range=None):
         RawImageItem.set_data(self, data, lut_range)
-        ni, nj = self.data.shape
+        ni, nj = self._data.shape
         self.points = np.array([[0,  0, nj, nj],
                                 [0, ni, ni,  0],
                                 [1,  1,  1,  1]], float)
@@ -1333,11 +1508,14 @@ class TrImageItem(RawImageItem):
 
         mat = self.tr*( translate(xs0, ys0)*scale(xscale, yscale) )
 
+        # Crop bounds are rounded outwards, with a tolerance on floating 
+        # point errors: exporting by tiles (see `assemble_imageitems`) gives 
+        # exactly the same bounds as exporting at once
         x0, y0, x1, y1 = self.get_crop_coordinates()
-        xd0 = max([xd0, xd0+int((x0-xs0)/xscale)])
-        yd0 = max([yd0, yd0+int((y0-ys0)/xscale)])
-        xd1 = min([xd1, xd1+int((x1-xs1)/xscale)])
-        yd1 = min([yd1, yd1+int((y1-ys1)/xscale)])
+        xd0 = max([xd0, xd0+int(np.floor((x0-xs0)/xscale+EXPORT_ROI_EPS))])
+        yd0 = max([yd0, yd0+int(np.floor((y0-ys0)/yscale+EXPORT_ROI_EPS))])
+        xd1 = min([xd1, xd1+int(np.ceil((x1-xs1)/xscale-EXPORT_ROI_EPS))])
+        yd1 = min([yd1, yd1+int(np.ceil((y1-ys1)/yscale-EXPORT_ROI_EPS))])
         dst_rect = xd0, yd0, xd1, yd1
 
         interp = self.interpolate if apply_interpolation else (INTERP_NEAREST,)
@@ -1388,14 +1566,34 @@ class TrImageItem(RawImageItem):
 assert_interfaces_valid(TrImageItem)
 
 
+#: Size (in bytes) of destination tiles used by `assemble_imageitems` 
+#: when assembling images into a caller-provided `output` array
+ASSEMBLE_TILE_SIZE = 1 << 26
+
+def get_assembled_image_shape(destw, desth):
+    """Return shape of the array returned by `assemble_imageitems` 
+    for destination size (destw, desth)"""
+    align = 1  #XXX: byte alignment is disabled until further notice!
+    aligned_destw = int(align*((int(destw)+align-1)/align))
+    aligned_desth = int(desth*aligned_destw/destw)
+    return aligned_desth, aligned_destw
+
 def assemble_imageitems(items, src_qrect, destw, desth, align=None,
                         add_images=False, apply_lut=False,
                         apply_interpolation=False,
-                        original_resolution=False):
+                        original_resolution=False, output=None,
+                        tile_rows=None):
     """
     Assemble together image items in qrect (`QRectF` object)
     and return resulting pixel data
     
+    If `output` is not None, pixel data is written in this array (e.g. 
+    a memory-mapped array, shape: (desth, destw)) which is returned.
+    If `tile_rows` is not None (default if `output` is specified: 
+    tiles of :py:data:`ASSEMBLE_TILE_SIZE` bytes), images are exported 
+    by horizontal tiles of `tile_rows` rows, so that temporary arrays 
+    are not larger than one tile.
+    
     .. warning::
 
         Does not support `XYImageItem` objects
@@ -1404,19 +1602,20 @@ def assemble_imageitems(items, src_qrect, destw, desth, align=None,
     if align is not None:
         print("plotpy.image.assemble_imageitems: since v2.2, "\
                             "the `align` option is ignored", file=sys.stderr)
-    align = 1  #XXX: byte alignment is disabled until further notice!
-    aligned_destw = int(align*((int(destw)+align-1)/align))
-    aligned_desth = int(desth*aligned_destw/destw)
+    aligned_desth, aligned_destw = get_assembled_image_shape(destw, desth)
+
+    if tile_rows is None and output is not None:
+        tile_rows = max(ASSEMBLE_TILE_SIZE//(4*aligned_destw), 1)
+    tiles = tile_rows is not None
+    if not tiles:
+        tile_rows = aligned_desth
+    if output is None:
+        try:
+            output = np.zeros((aligned_desth, aligned_destw), np.float32)
+        except ValueError:
+            raise MemoryError
+    assert output.shape == (aligned_desth, aligned_destw)
 
-    try:
-        output = np.zeros((aligned_desth, aligned_destw), np.float32)
-    except ValueError:
-        raise MemoryError
-    if not add_images:
-        dst_image = output
-
-    dst_rect = (0, 0, aligned_destw, aligned_desth)
-    
     src_rect = list(src_qrect.getCoords())
     # The source QRect is generally coming from a rectangle shape which is 
     # adjusted to fit a given ROI on the image. So the rectangular area is 
@@ -1430,16 +1629,42 @@ def assemble_imageitems(items, src_qrect, destw, desth, align=None,
     src_rect[2] -= .5*pixel_width
     src_rect[3] -= .5*pixel_height
 
-    for it in sorted(items, key=lambda obj: -obj.z()):
-        if it.isVisible() and src_qrect.intersects(it.boundingRect()):
+    items = [it for it in sorted(items, key=lambda obj: -obj.z())
+             if it.isVisible() and src_qrect.intersects(it.boundingRect())]
+    # Source height of a destination pixel (with original resolution, 
+    # `TrImageItem` objects are exported using their own pixel size)
+    dst_dy = (src_rect[3]-src_rect[1])/float(aligned_desth)
+    item_dys = []
+    for it in items:
+        if original_resolution and isinstance(it, TrImageItem):
+            item_dys.append(it.get_transform()[4])
+        else:
+            item_dys.append(dst_dy)
+
+    for row0 in range(0, aligned_desth, tile_rows):
+        row1 = min(row0+tile_rows, aligned_desth)
+        if tiles:
+            tile = np.zeros((row1-row0, aligned_destw), np.float32)
+        else:
+            tile = output
+        dst_rect = (0, 0, aligned_destw, row1-row0)
+        if not add_images:
+            dst_image = tile
+        for it, item_dy in zip(items, item_dys):
+            tile_src_rect = list(src_rect)
+            if tiles:
+                tile_src_rect[1] = src_rect[1]+row0*item_dy
+                tile_src_rect[3] = src_rect[1]+row1*item_dy
             if add_images:
-                dst_image = np.zeros_like(output)
-            it.export_roi(src_rect=src_rect, dst_rect=dst_rect,
+                dst_image = np.zeros_like(tile)
+            it.export_roi(src_rect=tile_src_rect, dst_rect=dst_rect,
                           dst_image=dst_image, apply_lut=apply_lut,
                           apply_interpolation=apply_interpolation,
                           original_resolution=original_resolution)
             if add_images:
-                output += dst_image
+                tile += dst_image
+        if tiles:
+            output[row0:row1] = tile
     return output
 
 def get_plot_qrect(plot, p0, p1):
@@ -1527,12 +1752,15 @@ def get_image_in_shape(obj, norm_range=False, item_type=None,
 
 def get_image_from_plot(plot, p0, p1, destw=None, desth=None, add_images=False,
                         apply_lut=False, apply_interpolation=False,
-                        original_resolution=False):
+                        original_resolution=False, output=None,
+                        tile_rows=None):
     """
     Return pixel data of a rectangular plot area (image items only)
     p0, p1: resp. top-left and bottom-right points (`QPointF` objects)
     apply_lut: apply contrast settings
     add_images: add superimposed images (instead of replace by the foreground)
+    output, tile_rows: destination array and tile size 
+    (see :py:func:`plotpy.image.assemble_imageitems`)
 
     .. warning::
 
@@ -1548,7 +1776,8 @@ def get_image_from_plot(plot, p0, p1, destw=None, desth=None, add_images=False,
     return assemble_imageitems(items, qrect, destw, desth,# align=4,
                                add_images=add_images, apply_lut=apply_lut,
                                apply_interpolation=apply_interpolation,
-                               original_resolution=original_resolution)
+                               original_resolution=original_resolution,
+                               output=output, tile_rows=tile_rows)
 
 
 #==============================================================================
@@ -1562,6 +1791,20 @@ def to_bins(x):
     bx[-1] = x[-1]+(x[-1]-x[-2])/2
     return bx
 
+def _xy_index_map(edges, start, step, size):
+    """
+    Return destination -> source index map along one axis of a non-uniform
+    image (see `XYImageItem`): source pixel index of each one of the *size*
+    destination pixels (-1 if pixel falls outside image)
+
+    Destination pixel coordinate *x* lies in source pixel *i* if
+    edges[i] < x <= edges[i+1], as in the axis walk done in `_scale_xy`
+    """
+    coords = start+np.arange(size)*step
+    index = edges.searchsorted(coords).astype(np.int32)-1
+    index[index >= edges.size-1] = -1
+    return index
+
 class XYImageItem(RawImageItem):
     """
     Construct an image item with non-linear X/Y axes
@@ -1586,6 +1829,7 @@ class XYImageItem(RawImageItem):
         super(XYImageItem, self).__init__(data, param)
         self.x = None
         self.y = None
+        self._index_maps = None
         if x is not None and y is not None:
             self.set_xy(x, y)
 
@@ -1627,19 +1871,30 @@ class XYImageItem(RawImageItem):
     def deserialize(self, reader):
         """Deserialize object from HDF5 reader"""
         super(XYImageItem, self).deserialize(reader)
-        x = reader.read(group_name='Xdata', func=reader.read_array)
-        y = reader.read(group_name='Ydata', func=reader.read_array)
+        x = reader.read(group_name='Xdata', func=reader.read_ndarray)
+        y = reader.read(group_name='Ydata', func=reader.read_ndarray)
         self.set_xy(x, y)
 
     #---- Public API ----------------------------------------------------------
-    def set_xy(self, x, y):
-        ni, nj = self.data.shape
-        x = np.array(x, float)
-        y = np.array(y, float)
-        if not np.all(np.diff(x) >= 0):
-            raise ValueError("x must be an increasing 1D array")
-        if not np.all(np.diff(y) >= 0):
-            raise ValueError("y must be an increasing 1D array")
+    def set_xy(self, x, y, assume_sorted=False):
+        """
+        Set X/Y axes (pixel centers or pixel bounds)
+        
+            * x, y: increasing 1D NumPy arrays
+            * assume_sorted: if True, the caller guarantees that x and y are
+              increasing: arrays are then neither copied nor checked
+        """
+        ni, nj = self._data.shape
+        if assume_sorted:
+            x = np.asarray(x, float)
+            y = np.asarray(y, float)
+        else:
+            x = np.array(x, float)
+            y = np.array(y, float)
+            if not np.all(np.diff(x) >= 0):
+                raise ValueError("x must be an increasing 1D array")
+            if not np.all(np.diff(y) >= 0):
+                raise ValueError("y must be an increasing 1D array")
         if x.shape[0] == nj:
             self.x = to_bins(x)
         elif x.shape[0] == nj+1:
@@ -1656,15 +1911,36 @@ class XYImageItem(RawImageItem):
                              % (ni, ni+1))
         self.bounds = QRectF(QPointF(self.x[0], self.y[0]),
                              QPointF(self.x[-1], self.y[-1]))
+        self._index_maps = None
         self.update_border()
 
+    def get_index_maps(self, src_rect):
+        """
+        Return destination -> source index maps for X and Y axes
+        (see `_scale_xy`)
+        
+        Index maps only depend on axes, on the plot scale maps and on the 
+        offscreen size: they are cached and reused as long as none of these
+        changes (i.e. LUT, colormap and data updates don't invalidate them)
+        """
+        H, W = self._offscreen.shape
+        key = (tuple(src_rect), (H, W), self._data.shape)
+        if self._index_maps is None or self._index_maps[0] != key:
+            x1, y1, x2, y2 = src_rect
+            xmap = _xy_index_map(self.x, x1, (x2-x1)/W, W)
+            ymap = _xy_index_map(self.y, y1, (y2-y1)/H, H)
+            self._index_maps = key, xmap, ymap
+        _key, xmap, ymap = self._index_maps
+        return xmap, ymap
+
     #--- BaseImageItem API ----------------------------------------------------
     def get_filter(self, filterobj, filterparam):
         """Provides a filter object over this image's content"""
         return XYImageFilterItem(self, filterobj, filterparam)
 
     def draw_image(self, painter, canvasRect, src_rect, dst_rect, xMap, yMap):
-        xytr = (self.x, self.y, src_rect)
+        xmap, ymap = self.get_index_maps(src_rect)
+        xytr = (self.x, self.y, src_rect, xmap, ymap)
         dst_rect = tuple([int(i) for i in dst_rect])
         dest = _scale_xy(self.data, xytr, self._offscreen, dst_rect,
                          self.lut, self.interpolate)
@@ -1762,18 +2038,30 @@ class RGBImageItem(ImageItem):
         Load data from *filename*
         *filename* has been set using method 'set_filename'
         """
-        data = io.imread(self.get_filename(), to_grayscale=False)
+        data = self.read_image_file(self.get_filename(), to_grayscale=False)
         self.set_data(data)
 
-    def set_data(self, data):
+    def set_data(self, data, lut_range=None):
+        """
+        Set RGB(A) image data
+        
+            * data: 3D NumPy array (height x width x channels)
+            * lut_range: ignored (no LUT for RGB images)
+        """
         H, W, NC = data.shape
         self.orig_data = data
         self.data = np.empty((H, W), np.uint32)
+        self.data_changed()
         self.recompute_alpha_channel()
         self.update_bounds()
         self.update_border()
         self.lut = None
 
+    def get_prefix_sums(self):
+        """Reimplement BaseImageItem method: summed-area tables are not 
+        supported (data is made of packed ARGB values, not intensities)"""
+        return None
+
     #---- IBasePlotItem API ---------------------------------------------------
     def types(self):
         return (IImageItemType, ITrackableItemType, ISerializableType)
@@ -1950,6 +2238,7 @@ class MaskedImageItem(ImageItem):
 
     def _mask_changed(self):
         """Emit the :py:data:`plotpy.baseplot.BasePlot.SIG_MASK_CHANGED` signal"""
+        self.data_changed()
         plot = self.plot()
         if plot is not None:
             plot.SIG_MASK_CHANGED.emit(self)
@@ -2079,6 +2368,33 @@ class MaskedImageItem(ImageItem):
 #==============================================================================
 # Image filter
 #==============================================================================
+class FilterNotifier(QObject):
+    """Object notifying the GUI thread that a filter computation is done"""
+    #: Signal emitted when a worker has finished computing a filter
+    #: (arguments: computation key, result -- None if filter has failed)
+    SIG_FILTER_DONE = Signal("PyQt_PyObject", "PyQt_PyObject")
+
+
+class FilterRunnable(QRunnable):
+    """Filter computation task, to be run in a `QThreadPool`"""
+    def __init__(self, notifier, key, filter, x, y, data):
+        QRunnable.__init__(self)
+        self.notifier = notifier
+        self.key = key
+        self.filter = filter
+        self.args = x, y, data
+
+    def run(self):
+        x, y, data = self.args
+        try:
+            result = x, y, self.filter(x, y, data)
+        except Exception as error:
+            print("plotpy.image.ImageFilterItem: filter computation failed "\
+                  "(%s)" % error, file=sys.stderr)
+            result = None
+        self.notifier.SIG_FILTER_DONE.emit(self.key, result)
+
+
 #TODO: Implement get_filter methods for image items other than XYImageItem!
 class ImageFilterItem(BaseImageItem):
     """
@@ -2102,6 +2418,16 @@ class ImageFilterItem(BaseImageItem):
         self.image = image
         self.filter = filter
 
+        # Filter results cache: (key, (x, y, data)), see `get_filter_key`
+        self._filter_cache = None
+        self._filter_version = 0
+        # Worker pool computation state
+        self.threaded = False
+        self._filter_notifier = None
+        self._filter_pending = None
+        self._filter_running = False
+        self._filter_request = None
+
         self.imagefilterparam = param
         self.imagefilterparam.update_imagefilter(self)
 
@@ -2113,6 +2439,7 @@ class ImageFilterItem(BaseImageItem):
             * image: :py:class:`plotpy.image.RawImageItem` instance
         """
         self.image = image
+        self.clear_filter_cache()
 
     def set_filter(self, filter):
         """
@@ -2121,6 +2448,94 @@ class ImageFilterItem(BaseImageItem):
             * filter: function (x, y, data) --> data
         """
         self.filter = filter
+        self.filter_changed()
+
+    def filter_changed(self):
+        """
+        Notify that filter settings have changed: this method has to be 
+        called when the filter function depends on parameters which have 
+        been modified, so that cached filter results are invalidated
+        """
+        self._filter_version += 1
+        self.clear_filter_cache()
+
+    def set_threaded(self, state):
+        """
+        Enable/disable filter computation in a worker thread pool
+        
+        When enabled, the filter is computed in the background and the source
+        image data is displayed until the result is available (the plot is
+        then replotted): this is recommended for expensive filters
+        """
+        self.threaded = state
+        if state and self._filter_notifier is None:
+            self._filter_notifier = FilterNotifier()
+            self._filter_notifier.SIG_FILTER_DONE.connect(self._filter_done)
+
+    def clear_filter_cache(self):
+        """Clear filter results cache"""
+        self._filter_cache = None
+        self._filter_pending = None
+
+    def get_filter_key(self, x0, y0, x1, y1):
+        """
+        Return the key identifying a filter computation: source image and
+        data version, filter area, filter function and filter version 
+        (see `filter_changed`)
+        """
+        return (id(self.image), self.image.get_data_version(),
+                (x0, y0, x1, y1), self.filter, self._filter_version)
+
+    def get_filtered_data(self, x0, y0, x1, y1):
+        """
+        Return filtered image data in rectangular area (x0, y0, x1, y1):
+        tuple (x, y, data), as returned by source image `get_data` method
+        
+        Results are cached until source image data, filter area or filter
+        function are changed. In threaded mode, source image data is returned 
+        while filter computation is in progress.
+        """
+        key = self.get_filter_key(x0, y0, x1, y1)
+        if self._filter_cache is not None and self._filter_cache[0] == key:
+            return self._filter_cache[1]
+        x, y, data = self.image.get_data(x0, y0, x1, y1)
+        if self.threaded:
+            if self._filter_pending != key:
+                self._filter_pending = key
+                self._submit_filter(key, x, y, data.copy())
+            return x, y, data
+        result = x, y, self.filter(x, y, data)
+        self._filter_cache = key, result
+        return result
+
+    def _submit_filter(self, key, x, y, data):
+        """Submit filter computation to worker pool: only one computation
+        is running at a time, the latest request is queued"""
+        if self._filter_running:
+            self._filter_request = key, x, y, data
+            return
+        self._filter_running = True
+        task = FilterRunnable(self._filter_notifier, key, self.filter,
+                              x, y, data)
+        QThreadPool.globalInstance().start(task)
+
+    def _filter_done(self, key, result):
+        """Filter computation is done"""
+        self._filter_running = False
+        if key == self._filter_pending:
+            if result is None:
+                # Filter has failed: computation will be submitted again 
+                # next time filtered data is requested
+                self._filter_pending = None
+            else:
+                self._filter_cache = key, result
+                plot = self.plot()
+                if plot is not None:
+                    plot.replot()
+        if self._filter_request is not None:
+            request, self._filter_request = self._filter_request, None
+            if request[0] == self._filter_pending:
+                self._submit_filter(*request)
 
     #---- QwtPlotItem API ------------------------------------------------------
     def boundingRect(self):
@@ -2142,6 +2557,7 @@ class ImageFilterItem(BaseImageItem):
                        itemparams.get("ImageFilterParam"),
                        visible_only=True)
         self.imagefilterparam.update_imagefilter(self)
+        self.filter_changed()
         BaseImageItem.set_item_parameters(self, itemparams)
 
     def move_local_point_to(self, handle, pos, ctrl=None):
@@ -2234,8 +2650,7 @@ class XYImageFilterItem(ImageFilterItem):
         if not dstRect.intersects(canvasRect):
             return
 
-        x, y, data = self.image.get_data(x0, y0, x1, y1)
-        new_data = self.filter(x, y, data)
+        x, y, new_data = self.get_filtered_data(x0, y0, x1, y1)
         self.data = new_data
         if self.use_source_cmap:
             lut = self.image.lut
@@ -2300,6 +2715,7 @@ class Histogram2DItem(BaseImageItem):
         self._x = X
         self._y = Y
         self._z = Z
+        self.data_changed()
         self.bounds = QRectF(QPointF(X.min(), Y.min()),
                              QPointF(X.max(), Y.max()))
         self.update_border()
@@ -2331,6 +2747,7 @@ class Histogram2DItem(BaseImageItem):
                 self.data[self.data==val] = np.nan
             else:
                 self.data[self.data_tmp==0.0] = np.nan
+        self.data_changed()
         if self.histparam.auto_lut:
             nmin = _nanmin(self.data)
             nmax = _nanmax(self.data)
@@ -2579,6 +2996,30 @@ class ImagePlot(CurvePlot):
                 self.do_autoscale()
             if parent is not None:
                 parent.setUpdatesEnabled(True)
+
+    def add_items(self, items, z=None, autoscale=True):
+        """
+        Add several *plot item* instances to this *plot widget*
+
+            * items: list of :py:data:`qwt.QwtPlotItem` objects implementing 
+              the :py:data:`plotpy.interfaces.IBasePlotItem` interface
+            * z: first item's z order (None -> z = max(self.get_items())+1)
+              autoscale: True -> rescale plot (once) to fit images bounds
+        """
+        CurvePlot.add_items(self, items, z)
+        images = [item for item in items if isinstance(item, BaseImageItem)]
+        if images:
+            parent = self.parent()
+            if parent is not None:
+                parent.setUpdatesEnabled(False)
+            for item in reversed(images):
+                if IColormapImageItemType in item.types():
+                    self.update_colormap_axis(item)
+                    break
+            if autoscale:
+                self.do_autoscale()
+            if parent is not None:
+                parent.setUpdatesEnabled(True)
     
     def set_active_item(self, item):
         """Override base set_active_item to change the grid's
@@ -2595,14 +3036,23 @@ class ImagePlot(CurvePlot):
 
     def do_autoscale(self, replot=True, axis_id=None):
         """Do autoscale on all axes"""
-        CurvePlot.do_autoscale(self, replot=False, axis_id=axis_id)
-        self.updateAxes()
-        if self.lock_aspect_ratio:
-            self.replot()
-            self.apply_aspect_ratio(full_scale=True)
-        if replot:
-            self.replot()
-        self.SIG_PLOT_AXIS_CHANGED.emit(self)
+        manager = self.manager
+        if manager is not None:
+            # Axis limits are changed twice: synchronized plots are only 
+            # updated with the final limits
+            manager.begin_axis_synchronization()
+        try:
+            CurvePlot.do_autoscale(self, replot=False, axis_id=axis_id)
+            self.updateAxes()
+            if self.lock_aspect_ratio:
+                self.replot()
+                self.apply_aspect_ratio(full_scale=True)
+            if replot:
+                self.replot()
+            self.SIG_PLOT_AXIS_CHANGED.emit(self)
+        finally:
+            if manager is not None:
+                manager.end_axis_synchronization()
 
     def get_axesparam_class(self, item):
         """Return AxesParam dataset class associated to item's type"""
@@ -15,22 +15,39 @@ The `io` module provides input/output helper functions:
     * :py:func:`plotpy.io.imread`: load an image (.png, .tiff, 
       .dicom, etc.) and return its data as a NumPy array
     * :py:func:`plotpy.io.imwrite`: save an array to an image file
+    * :py:func:`plotpy.io.imread_many`: load several images concurrently
+    * :py:func:`plotpy.io.imread_raw`: memory-map a raw binary image file
+    * :py:class:`plotpy.io.ImageSequence`: image file sequence with cache 
+      and background prefetching
     * :py:func:`plotpy.io.load_items`: load plot items from HDF5
     * :py:func:`plotpy.io.save_items`: save plot items to HDF5
+    * :py:func:`plotpy.io.pickle_items`: save plot items with pickle,
+      arrays being optionally stored in a memory-mapped sidecar file
+    * :py:func:`plotpy.io.unpickle_items`: load plot items saved 
+      with :py:func:`plotpy.io.pickle_items`
 
 Reference
 ~~~~~~~~~
 
 .. autofunction:: imread
 .. autofunction:: imwrite
+.. autofunction:: imread_many
+.. autofunction:: imread_iter
+.. autofunction:: imread_raw
+.. autoclass:: ImageSequence
+   :members:
 .. autofunction:: load_items
 .. autofunction:: save_items
+.. autofunction:: pickle_items
+.. autofunction:: unpickle_items
 """
 
 from __future__ import print_function
 
 import sys
 import re
+import struct
+import weakref
 import os.path as osp
 import numpy as np
 
@@ -40,17 +57,38 @@ from plotpy.py3compat import is_text_string, to_text_string
 from plotpy.config import _
 
     
-def scale_data_to_dtype(data, dtype):
+#: Size (in bytes) of temporary arrays used by `scale_data_to_dtype`
+SCALE_CHUNK_SIZE = 1 << 24
+
+def scale_data_to_dtype(data, dtype, out=None):
     """Scale array `data` to fit datatype `dtype` dynamic range
     
-    WARNING: modifies data in place"""
+    Data is scaled by chunks (rows of first dimension), so that temporary 
+    arrays are not larger than :py:data:`SCALE_CHUNK_SIZE` bytes.
+    Result is written in `out` array if specified (e.g. a memory-mapped 
+    array): `out` shape must be equal to `data` shape."""
     info = np.iinfo(dtype)
-    dmin = data.min()
-    dmax = data.max()
-    data -= dmin
-    data *= float(info.max-info.min)/(dmax-dmin)
-    data += float(info.min)
-    return np.array(data, dtype)
+    dmin = float(data.min())
+    dmax = float(data.max())
+    if dmax > dmin:
+        factor = float(info.max-info.min)/(dmax-dmin)
+    else:
+        factor = 0.
+    if out is None:
+        out = np.empty(data.shape, dtype)
+    if data.ndim == 0 or data.size == 0:
+        out[...] = info.min
+        return out
+    rowsize = data[:1].size*np.dtype(np.float64).itemsize
+    step = max(SCALE_CHUNK_SIZE//max(rowsize, 1), 1)
+    for i0 in range(0, data.shape[0], step):
+        chunk = np.array(data[i0:i0+step], dtype=np.float64)
+        chunk -= dmin
+        chunk *= factor
+        chunk += float(info.min)
+        np.clip(chunk, info.min, info.max, out=chunk)
+        out[i0:i0+step] = chunk
+    return out
         
 def eliminate_outliers(data, percent=2., bins=256):
     """Eliminate data histogram outliers"""
@@ -69,15 +107,18 @@ class FileType(object):
         * `read_func`, `write_func` : I/O callbacks,
         * `extensions`: filename extensions (with a dot!) or filenames,
         (list, tuple or space-separated string)
-        * `data_types`: supported data types"""        
+        * `data_types`: supported data types
+        * `mmap_func`: read callback returning a memory-mapped array 
+        (`numpy.memmap`), optional"""        
     def __init__(self, name, extensions, read_func=None, write_func=None,
-                 data_types=None, requires_template=False):
+                 data_types=None, requires_template=False, mmap_func=None):
         self.name = name
         if is_text_string(extensions):
             extensions = extensions.split()
         self.extensions = [osp.splitext(' '+ext)[1] for ext in extensions]
         self.read_func = read_func
         self.write_func = write_func
+        self.mmap_func = mmap_func
         self.data_types = data_types
         self.requires_template = requires_template
     
@@ -122,7 +163,8 @@ class ImageIOHandler(object):
         return filters
     
     def add(self, name, extensions, read_func=None, write_func=None,
-            import_func=None, data_types=None, requires_template=None):
+            import_func=None, data_types=None, requires_template=None,
+            mmap_func=None):
         if import_func is not None:
             try:
                 import_func()
@@ -131,7 +173,8 @@ class ImageIOHandler(object):
         assert read_func is not None or write_func is not None
         ftype = FileType(name, extensions, read_func=read_func,
                          write_func=write_func, data_types=data_types,
-                         requires_template=requires_template)
+                         requires_template=requires_template,
+                         mmap_func=mmap_func)
         self.filetypes.append(ftype)
     
     def _get_filetype(self, ext):
@@ -142,9 +185,14 @@ class ImageIOHandler(object):
         else:
             raise RuntimeError("Unsupported file type: '%s'" % ext)
     
-    def get_readfunc(self, ext):
-        """Return read function associated to file extension `ext`"""
+    def get_readfunc(self, ext, mmap=False):
+        """Return read function associated to file extension `ext`
+        
+        If `mmap` is True, return the memory-mapping read function if 
+        there is one (fall back to the default read function otherwise)"""
         ftype = self._get_filetype(ext)
+        if mmap and ftype.mmap_func is not None:
+            return ftype.mmap_func
         if ftype.read_func is None:
             raise RuntimeError("Unsupported file type (read): '%s'" % ext)
         else:
@@ -253,53 +301,141 @@ def _import_dcm():
         import dicom as dicomio  # analysis:ignore
     logger.setLevel(logging.WARNING)
 
-def _imread_dcm(filename):
-    """Open DICOM image with pydicom and return a NumPy array"""
-    try:
-        # pydicom 1.0
-        from pydicom import dicomio
-    except ImportError:
-        # pydicom 0.9
-        import dicom as dicomio
-    dcm = dicomio.read_file(filename, force=True)
-    # **********************************************************************
-    # The following is necessary until pydicom numpy support is improved:
-    # (after that, a simple: 'arr = dcm.PixelArray' will work the same)
+def _get_dcm_attr(dcm, names, default=None):
+    """Return DICOM attribute value, trying attribute `names` in turn
+    (attribute names depend on pydicom version)"""
+    for name in names:
+        if hasattr(dcm, name):
+            return getattr(dcm, name)
+    return default
+
+def _get_dcm_dtype(dcm):
+    """Return DICOM image pixel data type"""
     format_str = '%sint%s' % (('u', '')[dcm.PixelRepresentation],
                               dcm.BitsAllocated)
     try:
-        dtype = np.dtype(format_str)
+        return np.dtype(format_str)
     except TypeError:
         raise TypeError("Data type not understood by NumPy: "
                         "PixelRepresentation=%d, BitsAllocated=%d" % (
                         dcm.PixelRepresentation, dcm.BitsAllocated))
-    arr = np.fromstring(dcm.PixelData, dtype)
-    try:
-        # pydicom 0.9.3:
-        dcm_is_little_endian = dcm.isLittleEndian
-    except AttributeError:
-        # pydicom 0.9.4:
-        dcm_is_little_endian = dcm.is_little_endian
-    if dcm_is_little_endian != (sys.byteorder == 'little'):
-        arr.byteswap(True)
-    if hasattr(dcm, 'NumberofFrames') and dcm.NumberofFrames > 1:
-        if dcm.SamplesperPixel > 1:
-            arr = arr.reshape(dcm.SamplesperPixel, dcm.NumberofFrames,
-                              dcm.Rows, dcm.Columns)
+
+def _get_dcm_shape(dcm):
+    """Return DICOM image array shape"""
+    frames = int(_get_dcm_attr(dcm, ('NumberOfFrames', 'NumberofFrames'), 1))
+    samples = int(_get_dcm_attr(dcm, ('SamplesPerPixel', 'SamplesperPixel'),
+                                1))
+    if frames > 1:
+        if samples > 1:
+            return (samples, frames, dcm.Rows, dcm.Columns)
         else:
-            arr = arr.reshape(dcm.NumberofFrames, dcm.Rows, dcm.Columns)
+            return (frames, dcm.Rows, dcm.Columns)
     else:
-        if dcm.SamplesperPixel > 1:
+        if samples > 1:
             if dcm.BitsAllocated == 8:
-                arr = arr.reshape(dcm.SamplesperPixel, dcm.Rows, dcm.Columns)
+                return (samples, dcm.Rows, dcm.Columns)
             else:
                 raise NotImplementedError("This code only handles "
                             "SamplesPerPixel > 1 if Bits Allocated = 8")
         else:
-            arr = arr.reshape(dcm.Rows, dcm.Columns)
+            return (dcm.Rows, dcm.Columns)
+
+def _is_dcm_native_byteorder(dcm):
+    """Return True if DICOM data byte order is the native byte order"""
+    try:
+        # pydicom 0.9.3:
+        dcm_is_little_endian = dcm.isLittleEndian
+    except AttributeError:
+        # pydicom 0.9.4:
+        dcm_is_little_endian = dcm.is_little_endian
+    return dcm_is_little_endian == (sys.byteorder == 'little')
+
+def _imread_dcm(filename):
+    """Open DICOM image with pydicom and return a NumPy array"""
+    try:
+        # pydicom 1.0
+        from pydicom import dicomio
+    except ImportError:
+        # pydicom 0.9
+        import dicom as dicomio
+    dcm = dicomio.read_file(filename, force=True)
+    # **********************************************************************
+    # The following is necessary until pydicom numpy support is improved:
+    # (after that, a simple: 'arr = dcm.PixelArray' will work the same)
+    arr = np.frombuffer(dcm.PixelData, _get_dcm_dtype(dcm))
+    if _is_dcm_native_byteorder(dcm):
+        # Array sharing memory with pixel data (bytes) is read-only
+        arr = arr.copy()
+    else:
+        arr = arr.byteswap()
+    arr = arr.reshape(_get_dcm_shape(dcm))
     # **********************************************************************
     return arr
 
+#: DICOM explicit value representations with a 32-bit value length
+DCM_LONG_VRS = (b'OB', b'OD', b'OF', b'OL', b'OV', b'OW', b'SQ', b'SV', b'UC',
+                b'UN', b'UR', b'UT', b'UV')
+
+def _get_dcm_value_offset(filename, header_offset, tag, length=None,
+                          little_endian=True, implicit_vr=False):
+    """Return file position of DICOM data element value from position of 
+    element header `header_offset`: header is read and checked against 
+    element `tag` (e.g. 0x7fe00010) and value `length` (if not None).
+    Return None if header does not match"""
+    endian = '<' if little_endian else '>'
+    with open(filename, 'rb') as fd:
+        fd.seek(header_offset)
+        header = fd.read(12)
+    if len(header) < 8:
+        return
+    group, element = struct.unpack(endian+'HH', header[:4])
+    if (group << 16 | element) != tag:
+        return
+    if implicit_vr:
+        size, value_length = 8, struct.unpack(endian+'I', header[4:8])[0]
+    elif header[4:6] in DCM_LONG_VRS:
+        if len(header) < 12:
+            return
+        size, value_length = 12, struct.unpack(endian+'I', header[8:12])[0]
+    else:
+        size, value_length = 8, struct.unpack(endian+'H', header[6:8])[0]
+    if length is not None and value_length != length:
+        return
+    return header_offset+size
+
+def _imread_dcm_mmap(filename):
+    """Open DICOM image with pydicom and return a memory-mapped NumPy array
+    
+    Pixel data is not read: it is mapped from file (copy-on-write mode).
+    Compressed pixel data, non-native byte order and pydicom 0.9 are not 
+    supported by this function: `_imread_dcm` is then used instead."""
+    try:
+        # pydicom 1.0
+        from pydicom import dicomio
+    except ImportError:
+        # pydicom 0.9
+        return _imread_dcm(filename)
+    # Elements larger than `defer_size` are not read (only their position)
+    dcm = dicomio.read_file(filename, force=True, defer_size=1024)
+    elem = dcm.get_item(0x7fe00010)
+    if elem is None or not _is_dcm_native_byteorder(dcm):
+        return _imread_dcm(filename)
+    # Deferred raw element: `value_tell` is the value position
+    offset = getattr(elem, 'value_tell', None)
+    header_offset = getattr(elem, 'file_tell', None)
+    if offset is None and header_offset is not None:
+        # Deferred element: `file_tell` is the element header position
+        implicit_vr = _get_dcm_attr(dcm, ('is_implicit_VR', ), False)
+        offset = _get_dcm_value_offset(filename, header_offset, 0x7fe00010,
+                                       getattr(elem, 'length', None),
+                                       dcm.is_little_endian, implicit_vr)
+    if offset is None or getattr(elem, 'is_undefined_length', False)\
+       or getattr(elem, 'length', None) == 0xFFFFFFFF:
+        # Encapsulated (compressed) pixel data
+        return _imread_dcm(filename)
+    return np.memmap(filename, dtype=_get_dcm_dtype(dcm), mode='c',
+                     offset=offset, shape=_get_dcm_shape(dcm))
+
 def _imwrite_dcm(filename, arr, template=None):
     """Save a numpy array `arr` into a DICOM image file `filename`
     based on DICOM structure `template`"""
@@ -326,18 +462,119 @@ def _imwrite_dcm(filename, arr, template=None):
     template.save_as(filename)
 
 
+#==============================================================================
+# Raw binary files I/O functions
+#==============================================================================
+def _imread_npy_mmap(filename):
+    """Memory-map NumPy array file (copy-on-write mode)"""
+    return np.load(filename, mmap_mode='c')
+
+def imread_raw(filename, dtype, shape, offset=0, order='C'):
+    """Return a memory-mapped NumPy array (copy-on-write mode) from raw 
+    binary file `filename` (data type `dtype`, array shape `shape`, 
+    data starting at byte `offset`): data is read from disk on access"""
+    return np.memmap(filename, dtype=dtype, mode='c', offset=offset,
+                     shape=shape, order=order)
+
+
 #==============================================================================
 # Text files Private I/O functions
 #==============================================================================
-def _imread_txt(filename):
-    """Open text file image and return a NumPy array"""
-    for delimiter in ('\t', ',', ' ', ';'):
+#: Size (in bytes) of text chunks parsed at once by `_imread_txt_chunks`
+TXT_CHUNK_SIZE = 1 << 24
+
+#: True if `np.loadtxt` is implemented in C (NumPy >= 1.23): it is then 
+#: faster than parsing text chunks with `np.fromstring`
+LOADTXT_IS_FAST = tuple(map(int, re.match(r'(\d+)\.(\d+)',
+                                          np.__version__).groups())) >= (1, 23)
+
+def _sniff_txt_delimiter(line):
+    """Return delimiter guessed from text line (None: whitespaces)"""
+    for delimiter in ('\t', ',', ';'):
+        if delimiter in line:
+            return delimiter
+
+def _imread_txt_loadtxt(filename, delimiter):
+    """Open text file image with `np.loadtxt` (trying other delimiters 
+    if `delimiter` fails) and return a NumPy array"""
+    try:
+        return np.loadtxt(filename, delimiter=delimiter)
+    except ValueError as error:
+        last_error = error
+    for other in ('\t', ',', ' ', ';'):
+        if other == delimiter:
+            continue
         try:
-            return np.loadtxt(filename, delimiter=delimiter)
+            return np.loadtxt(filename, delimiter=other)
         except ValueError:
-            continue
-    else:
-        raise
+            pass
+    raise last_error
+
+def _imread_txt_chunks(fd, delimiter, ncols, nrows):
+    """Parse text file `fd` by chunks (:py:data:`TXT_CHUNK_SIZE` bytes) 
+    into a preallocated array (`nrows`: estimated row count) and return it
+    
+    Return None if file can't be parsed this way (rows of different 
+    lengths, missing or non-numeric values)"""
+    import warnings
+    arr = np.empty(nrows*ncols, dtype=np.float64)
+    count = 0
+    while True:
+        lines = fd.readlines(TXT_CHUNK_SIZE)
+        if not lines:
+            break
+        text = ''.join(lines)
+        if '#' in text:
+            lines = [line.split('#', 1)[0] for line in lines]
+            text = '\n'.join(lines)
+        lines = [line for line in lines if line.strip()]
+        if delimiter is None:
+            if any([len(line.split()) != ncols for line in lines]):
+                return
+        else:
+            if any([line.count(delimiter) != ncols-1 for line in lines]):
+                return
+            text = text.replace(delimiter, ' ')
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            try:
+                values = np.fromstring(text, dtype=np.float64, sep=' ')
+            except (ValueError, DeprecationWarning):
+                return
+        if values.size != len(lines)*ncols:
+            # Missing (empty fields) or non-numeric values
+            return
+        if count+values.size > arr.size:
+            arr.resize(max(2*arr.size, count+values.size), refcheck=False)
+        arr[count:count+values.size] = values
+        count += values.size
+    arr.resize(count, refcheck=False)
+    # Same output shape as `np.loadtxt`
+    return np.squeeze(arr.reshape(count//ncols, ncols))
+
+def _imread_txt(filename):
+    """Open text file image and return a NumPy array
+    
+    Delimiter is guessed from the first data line. With NumPy < 1.23 
+    (pure Python `np.loadtxt`), file is parsed by chunks with 
+    `np.fromstring` (see `_imread_txt_chunks`). Otherwise, or if file 
+    can't be parsed this way, it is read with `np.loadtxt` (trying 
+    other delimiters if the guessed one fails)."""
+    delimiter = None
+    with open(filename, 'r') as fd:
+        for line in fd:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                delimiter = _sniff_txt_delimiter(line)
+                if not LOADTXT_IS_FAST:
+                    ncols = len(line.split(delimiter))
+                    nrows = max(osp.getsize(filename)//(len(line)+1), 1)
+                    fd.seek(0)
+                    arr = _imread_txt_chunks(fd, delimiter, ncols, nrows)
+                    if arr is not None:
+                        return arr
+                break
+    return _imread_txt_loadtxt(filename, delimiter)
 
 def _imwrite_txt(filename, arr):
     """Write `arr` NumPy array to text file `filename`"""
@@ -365,11 +602,13 @@ iohandler.add(_("8-bit images"), '*.jpg *.gif',
               read_func=_imread_pil, write_func=_imwrite_pil,
               data_types=(np.uint8,))
 iohandler.add(_("NumPy arrays"), '*.npy',
-              read_func=np.load, write_func=np.save)
+              read_func=np.load, write_func=np.save,
+              mmap_func=_imread_npy_mmap)
 iohandler.add(_("Text files"), '*.txt *.csv *.asc',
               read_func=_imread_txt, write_func=_imwrite_txt)
 iohandler.add(_("DICOM files"), '*.dcm', read_func=_imread_dcm,
               write_func=_imwrite_dcm, import_func=_import_dcm,
+              mmap_func=_imread_dcm_mmap,
               data_types=(np.int8, np.uint8, np.int16, np.uint16),
               requires_template=True)
 
@@ -377,24 +616,87 @@ iohandler.add(_("DICOM files"), '*.dcm', read_func=_imread_dcm,
 #==============================================================================
 # Generic image read/write functions
 #==============================================================================
-def imread(fname, ext=None, to_grayscale=False):
+def imread(fname, ext=None, to_grayscale=False, mmap=False):
     """Return a NumPy array from an image filename `fname`.
     
     If `to_grayscale` is True, convert RGB images to grayscale
     The `ext` (optional) argument is a string that specifies the file extension
     which defines the input format: when not specified, the input format is 
-    guessed from filename."""
+    guessed from filename.
+    If `mmap` is True and if the file format supports it (NumPy arrays, 
+    uncompressed DICOM images), return a memory-mapped array (`numpy.memmap`,
+    copy-on-write mode): data is then read from disk only when accessed."""
     if not is_text_string(fname):
         fname = to_text_string(fname) # in case filename is a QString instance
     if ext is None:
         _base, ext = osp.splitext(fname)
-    arr = iohandler.get_readfunc(ext)(fname)
+    arr = iohandler.get_readfunc(ext, mmap=mmap)(fname)
     if to_grayscale and arr.ndim == 3:
         # Converting to grayscale
         return arr[..., :4].mean(axis=2)
     else:
         return arr
 
+def _imread_task(args):
+    """Read image (function run by `imread_iter` workers)"""
+    fname, ext, to_grayscale, mmap = args
+    return imread(fname, ext=ext, to_grayscale=to_grayscale, mmap=mmap)
+
+def imread_iter(filenames, workers=None, processes=False,
+                progress_callback=None, ext=None, to_grayscale=False,
+                mmap=False):
+    """Load image files `filenames` concurrently and yield NumPy arrays
+    (in the same order as `filenames`)
+    
+    `workers` is the number of threads (or processes if `processes` is True)
+    loading images (None: number of CPUs, 1: images are loaded sequentially
+    in the calling thread).
+    `progress_callback`: if not None, this function is called with 
+    an integer argument (progress: 0 --> 100) each time an image has been 
+    loaded. Function returns the `cancel` state (True: progress dialog 
+    has been canceled, False otherwise).
+    See :py:func:`plotpy.io.imread` for other arguments.
+    
+    If an image can't be loaded, the exception is raised when reaching
+    the corresponding file."""
+    filenames = [fname if is_text_string(fname) else to_text_string(fname)
+                 for fname in filenames]
+    count = len(filenames)
+    tasks = [(fname, ext, to_grayscale, mmap) for fname in filenames]
+    if workers == 1 or count < 2:
+        pool = None
+        results = (_imread_task(task) for task in tasks)
+    else:
+        if processes:
+            from multiprocessing import Pool
+        else:
+            from multiprocessing.pool import ThreadPool as Pool
+        pool = Pool(workers)
+        results = pool.imap(_imread_task, tasks)
+    try:
+        for idx, arr in enumerate(results):
+            yield arr
+            if progress_callback is not None:
+                if progress_callback(int(100*float(idx+1)/count)):
+                    break
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+def imread_many(filenames, workers=None, processes=False,
+                progress_callback=None, ext=None, to_grayscale=False,
+                mmap=False):
+    """Load image files `filenames` concurrently and return the list of 
+    NumPy arrays (in the same order as `filenames`; if loading is canceled 
+    through `progress_callback`, the list contains only the images loaded
+    so far)
+    
+    See :py:func:`plotpy.io.imread_iter` for arguments."""
+    return list(imread_iter(filenames, workers=workers, processes=processes,
+                            progress_callback=progress_callback, ext=ext,
+                            to_grayscale=to_grayscale, mmap=mmap))
+
 def imwrite(fname, arr, ext=None, dtype=None, max_range=None, **kwargs):
     """Save a NumPy array to an image filename `fname`.
     
@@ -403,17 +705,208 @@ def imwrite(fname, arr, ext=None, dtype=None, max_range=None, **kwargs):
     which defines the input format: when not specified, the input format is 
     guessed from filename.
     If `max_range` is True, array data is scaled to fit the `dtype` (or data 
-    type itself if `dtype` is None) dynamic range
-    Warning: option `max_range` changes data in place"""
+    type itself if `dtype` is None) dynamic range (data is scaled by chunks,
+    and NumPy arrays are directly scaled into the output file)"""
     if not is_text_string(fname):
         fname = to_text_string(fname) # in case filename is a QString instance
     if ext is None:
         _base, ext = osp.splitext(fname)
     if max_range:
-        arr = scale_data_to_dtype(arr, arr.dtype if dtype is None else dtype)
+        dtype = arr.dtype if dtype is None else dtype
+        if ext.lower() == '.npy' and not kwargs:
+            # Scaling data directly into the memory-mapped output file
+            out = np.lib.format.open_memmap(fname, mode='w+', dtype=dtype,
+                                            shape=arr.shape)
+            scale_data_to_dtype(arr, dtype, out=out)
+            out.flush()
+            return
+        arr = scale_data_to_dtype(arr, dtype)
     iohandler.get_writefunc(ext)(fname, arr, **kwargs)
 
 
+#==============================================================================
+# Image file sequences
+#==============================================================================
+class ImageSequence(object):
+    """
+    Image file sequence with a LRU cache of decoded images and background
+    prefetching of neighbour images:
+        * filenames: image filenames
+        * to_grayscale: convert RGB images to grayscale
+        * max_bytes: cache size limit (bytes)
+        * prefetch: number of images to prefetch on each side of the 
+          last requested image (0: no prefetching)
+    
+    Images are prefetched in a background thread, nearest images first,
+    so that stepping through the sequence does not require reading files.
+    The thread only holds a weak reference to the sequence while waiting: 
+    it stops when the sequence is closed or garbage collected. A closed 
+    sequence still returns images, without caching nor prefetching.
+    """
+    def __init__(self, filenames, to_grayscale=True, max_bytes=256*1024**2,
+                 prefetch=2):
+        import threading
+        from collections import OrderedDict
+        self.filenames = [fname if is_text_string(fname)
+                          else to_text_string(fname) for fname in filenames]
+        self.to_grayscale = to_grayscale
+        self.max_bytes = max_bytes
+        self.prefetch = prefetch
+        self._indexes = dict([(fname, idx)
+                              for idx, fname in enumerate(self.filenames)])
+        self._cache = OrderedDict()
+        self._nbytes = 0
+        self._loading = set()
+        self._pending = []
+        self._current = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = None
+        if prefetch > 0:
+            condition = self._condition
+            def wake_up(_ref):
+                # Sequence has been garbage collected: stopping thread
+                with condition:
+                    condition.notify_all()
+            selfref = weakref.ref(self, wake_up)
+            self._thread = threading.Thread(target=self.__prefetch_loop,
+                                            args=(selfref,))
+            self._thread.daemon = True
+            self._thread.start()
+
+    def __len__(self):
+        return len(self.filenames)
+
+    def __contains__(self, filename):
+        return filename in self._indexes
+
+    def __getitem__(self, index):
+        return self.get(index)
+
+    def index(self, filename):
+        """Return index of image file *filename*"""
+        return self._indexes[filename]
+
+    def get_file(self, filename):
+        """Return image data of file *filename*"""
+        return self.get(self.index(filename))
+
+    def get(self, index):
+        """Return image data of image *index*: image is read from cache 
+        (or from file if not in cache) and neighbour images are prefetched"""
+        if index < 0:
+            index += len(self.filenames)
+        with self._condition:
+            self._current = index
+            self.__schedule_prefetch(index)
+            while index in self._loading:
+                # Image is currently being prefetched
+                self._condition.wait()
+            data = self._cache.get(index)
+            if data is not None:
+                self.__touch(index)
+                return data
+            self._loading.add(index)
+        try:
+            data = imread(self.filenames[index],
+                          to_grayscale=self.to_grayscale)
+        finally:
+            with self._condition:
+                self._loading.discard(index)
+                self._condition.notify_all()
+        with self._condition:
+            if not self._closed:
+                self.__store(index, data)
+        return data
+
+    def clear_cache(self):
+        """Clear image cache"""
+        with self._condition:
+            self._cache.clear()
+            self._nbytes = 0
+
+    def close(self):
+        """Stop prefetching thread and clear cache"""
+        with self._condition:
+            self._closed = True
+            self._pending = []
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.clear_cache()
+
+    #---- Private API (called with condition lock acquired) -------------------
+    def __touch(self, index):
+        """Mark image *index* as most recently used"""
+        data = self._cache.pop(index)
+        self._cache[index] = data
+
+    def __store(self, index, data):
+        """Store image in cache, discarding least recently used images"""
+        if index in self._cache:
+            return
+        self._cache[index] = data
+        self._nbytes += data.nbytes
+        while self._nbytes > self.max_bytes and len(self._cache) > 1:
+            # Never discarding the last requested image
+            old_index = next(iter(self._cache))
+            if old_index == self._current:
+                self.__touch(old_index)
+                old_index = next(iter(self._cache))
+                if old_index == self._current:
+                    break
+            self._nbytes -= self._cache.pop(old_index).nbytes
+
+    def __schedule_prefetch(self, index):
+        """Schedule prefetching of images around *index* (nearest first)"""
+        pending = []
+        for offset in range(1, self.prefetch+1):
+            for idx in (index+offset, index-offset):
+                if 0 <= idx < len(self.filenames)\
+                   and idx not in self._cache:
+                    pending.append(idx)
+        self._pending = pending
+        self._condition.notify_all()
+
+    @staticmethod
+    def __prefetch_loop(selfref):
+        """Prefetching thread main loop: the sequence is weakly referenced 
+        (*selfref*) while waiting, so that it may be garbage collected"""
+        self = selfref()
+        if self is None:
+            return
+        condition = self._condition
+        while True:
+            with condition:
+                while not self._pending and not self._closed:
+                    self = None
+                    if selfref() is None:
+                        # Sequence has just been garbage collected
+                        return
+                    condition.wait()
+                    self = selfref()
+                    if self is None:
+                        return
+                if self._closed:
+                    return
+                index = self._pending.pop(0)
+                if index in self._cache or index in self._loading:
+                    continue
+                self._loading.add(index)
+            try:
+                data = imread(self.filenames[index],
+                              to_grayscale=self.to_grayscale)
+            except Exception:
+                # Error will be raised when requesting this image
+                data = None
+            with condition:
+                self._loading.discard(index)
+                if data is not None and not self._closed:
+                    self.__store(index, data)
+                condition.notify_all()
+
+
 #==============================================================================
 # Deprecated functions
 #==============================================================================
@@ -428,10 +921,10 @@ def imagefile_to_array(filename, to_grayscale=False):
 def array_to_imagefile(arr, filename, mode=None, max_range=False):
     """
     Save a numpy array `arr` into an image file `filename`
-    Warning: option 'max_range' changes data in place
     """
     print("io.array_to_imagefile is deprecated: use io.imwrite instead", file=sys.stderr)
-    return imwrite(filename, arr, mode=mode, max_range=max_range)
+    kwargs = {} if mode is None else dict(mode=mode)
+    return imwrite(filename, arr, max_range=max_range, **kwargs)
 
 
 #==============================================================================
@@ -536,6 +1029,65 @@ def load_items(reader):
         items.append(item)
     return items
 
+#: Alignment of array buffers in sidecar files (bytes)
+BUFFER_ALIGNMENT = 64
+
+def pickle_items(items, iofile, buffers=None):
+    """Save items using the :py:mod:`pickle` protocol:
+        * items: serializable plot items
+        * iofile: file object
+        * buffers: sidecar filename (optional)
+    
+    If *buffers* is not None, array data is not pickled in *iofile* but 
+    written without any intermediate copy to the sidecar file *buffers*
+    (out-of-band buffers, pickle protocol 5: requires Python 3.8+). 
+    The sidecar file is memory-mapped when loading items 
+    (see :py:func:`plotpy.io.unpickle_items`)."""
+    import pickle
+    if buffers is None:
+        pickle.dump(items, iofile)
+        return
+    if pickle.HIGHEST_PROTOCOL < 5:
+        raise NotImplementedError("Out-of-band buffers require "
+                                  "pickle protocol 5 (Python 3.8+)")
+    layout = []
+    with open(buffers, 'wb') as bfile:
+        def buffer_callback(buf):
+            try:
+                raw = buf.raw()
+            except BufferError:
+                # Non-contiguous buffer: pickled in-band
+                return True
+            offset = bfile.tell()
+            padding = -offset % BUFFER_ALIGNMENT
+            if padding:
+                bfile.write(b'\0'*padding)
+                offset += padding
+            bfile.write(raw)
+            layout.append((offset, raw.nbytes))
+            return False
+        data = pickle.dumps(items, protocol=5,
+                            buffer_callback=buffer_callback)
+    pickle.dump((layout, data), iofile, protocol=5)
+
+def unpickle_items(iofile, buffers=None):
+    """Load items saved with :py:func:`plotpy.io.pickle_items`:
+        * iofile: file object
+        * buffers: sidecar filename (optional)
+    
+    Sidecar file is memory-mapped (copy-on-write mode): array data 
+    of returned items is read from disk only when accessed."""
+    import pickle
+    if buffers is None:
+        return pickle.load(iofile)
+    layout, data = pickle.load(iofile)
+    if layout:
+        mmap = np.memmap(buffers, dtype=np.uint8, mode='c')
+        bufs = [mmap[offset:offset+size] for offset, size in layout]
+    else:
+        bufs = []
+    return pickle.loads(data, buffers=bufs)
+
 
 if __name__ == '__main__':
     # Test if items can all be constructed from their Python module
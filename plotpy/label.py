@@ -297,6 +297,7 @@ class LabelItem(AbstractLabelItem):
     def __init__(self, text=None, labelparam=None):
         self.text_string = '' if text is None else text
         self.text = QTextDocument()
+        self._text_key = None
         super(LabelItem, self).__init__(labelparam)
     
     def __reduce__(self):
@@ -325,7 +326,14 @@ class LabelItem(AbstractLabelItem):
     def set_text(self, text=None):
         if text is not None:
             self.text_string = text
-        self.text.setHtml("<div>%s</div>" % self.text_string)
+        html = "<div>%s</div>" % self.text_string
+        # Parsing HTML and laying out the document is expensive: this is 
+        # done only if text or style has changed (labels like DataInfoLabel 
+        # are updated each time they are drawn)
+        key = (html, self.text.defaultStyleSheet())
+        if key != self._text_key:
+            self._text_key = key
+            self.text.setHtml(html)
         
     def set_text_style(self, font=None, color=None):
         if font is not None:
@@ -367,6 +375,7 @@ class LegendBoxItem(AbstractLabelItem):
     def __init__(self, labelparam=None):
         self.font = None
         self.color = None
+        self._text_cache = {}
         super(LegendBoxItem, self).__init__(labelparam)
         # saves the last computed sizes
         self.sizes = 0.0, 0.0, 0.0, 0.0
@@ -379,14 +388,22 @@ class LegendBoxItem(AbstractLabelItem):
         if plot is None:
             return []
         text_items = []
+        text_cache = {}
         for item in plot.get_items():
             if not isinstance(item, CurveItem) or not self.include_item(item):
                 continue
-            text = QTextDocument()
-            text.setDefaultFont(self.font)
-            text.setDefaultStyleSheet('div { color: %s; }' % self.color)
-            text.setHtml("<div>%s</div>" % item.curveparam.label)
+            label = item.curveparam.label
+            text = self._text_cache.get(label)
+            if text is None:
+                text = QTextDocument()
+                text.setDefaultFont(self.font)
+                text.setDefaultStyleSheet('div { color: %s; }' % self.color)
+                text.setHtml("<div>%s</div>" % label)
+            text_cache[label] = text
             text_items.append((text, item.pen(), item.brush(), item.symbol()))
+        # Legend documents are kept until next call (only those which are
+        # still in use) to avoid laying out texts each time legend is drawn
+        self._text_cache = text_cache
         return text_items
 
     def include_item(self, item):
@@ -412,6 +429,7 @@ class LegendBoxItem(AbstractLabelItem):
             self.font = font
         if color is not None:
             self.color = color
+        self._text_cache = {}
 
     def get_text_rect(self):
         items = self.get_legend_items()
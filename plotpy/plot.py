@@ -153,6 +153,10 @@ class PlotManager(object):
         self.default_plot = None
         self.default_toolbar = None
         self.synchronized_plots = {}
+        # Axis synchronization transaction (see begin_axis_synchronization):
+        self._axis_sync_level = 0
+        self._axis_sync_sources = []
+        self._axis_sync_applying = False
         self.groups = {} # Action groups for grouping QActions
         # Keep track of the registration sequence (plots, panels, tools):
         self._first_tool_flag = True
@@ -645,18 +649,64 @@ class PlotManager(object):
                 if item not in synclist:
                     synclist.append(item)
 
+    def begin_axis_synchronization(self):
+        """
+        Begin axis synchronization transaction: axis changes of synchronized
+        plots are gathered until `end_axis_synchronization` is called, then
+        applied at once (each affected plot is replotted only once).
+        Transactions may be nested.
+        """
+        self._axis_sync_level += 1
+
+    def end_axis_synchronization(self):
+        """End axis synchronization transaction 
+        (see `begin_axis_synchronization`)"""
+        assert self._axis_sync_level > 0, "no synchronization in progress"
+        self._axis_sync_level -= 1
+        if self._axis_sync_level == 0:
+            self.apply_axis_synchronization()
+
     def plot_axis_changed(self, plot):
+        """Plot axis limits have changed: update synchronized plots"""
         plot_id = plot.plot_id
-        if plot_id not in self.synchronized_plots:
+        if plot_id not in self.synchronized_plots or self._axis_sync_applying:
+            # Plots updated by the synchronization itself must not
+            # trigger a new synchronization
             return
-        for (axis, other_plot_id) in self.synchronized_plots[plot_id]:
-            scalediv = plot.axisScaleDiv(axis)
-            map = plot.canvasMap(axis)
-            other = self.get_plot(other_plot_id)
-            lb = scalediv.lowerBound()
-            ub = scalediv.upperBound()
-            other.setAxisScale(axis, lb, ub)
-            other.replot()
+        if plot in self._axis_sync_sources:
+            self._axis_sync_sources.remove(plot)
+        self._axis_sync_sources.append(plot)
+        if self._axis_sync_level == 0:
+            self.apply_axis_synchronization()
+
+    def apply_axis_synchronization(self):
+        """Apply pending axis changes to synchronized plots"""
+        sources, self._axis_sync_sources = self._axis_sync_sources, []
+        # Gathering updates: plot_id -> {axis: (lb, ub)}, the most recently
+        # changed plot wins when several plots share the same axis
+        updates = {}
+        for plot in sources:
+            synclist = self.synchronized_plots[plot.plot_id]
+            plot_updates = updates.get(plot.plot_id, {})
+            limits = {}
+            for axis, other_plot_id in synclist:
+                plot_updates.pop(axis, None)
+                if axis not in limits:
+                    limits[axis] = plot.get_axis_limits(axis)
+                updates.setdefault(other_plot_id, {})[axis] = limits[axis]
+        self._axis_sync_applying = True
+        try:
+            for other_plot_id, axes in updates.items():
+                other = self.get_plot(other_plot_id)
+                changed = False
+                for axis, (lb, ub) in axes.items():
+                    if other.get_axis_limits(axis) != (lb, ub):
+                        other.setAxisScale(axis, lb, ub)
+                        changed = True
+                if changed:
+                    other.replot()
+        finally:
+            self._axis_sync_applying = False
         
 assert_interfaces_valid(PlotManager)
 
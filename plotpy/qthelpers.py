@@ -308,18 +308,23 @@ def exec_images_open_dialog(parent, basedir='', app_name=None,
                                 io.iohandler.get_filters('load', dtype=dtype))
     sys.stdin, sys.stdout, sys.stderr = saved_in, saved_out, saved_err
     filenames = [to_text_string(fname) for fname in list(filenames)]
-    for filename in filenames:
-        try:
-            data = io.imread(filename, to_grayscale=to_grayscale)
-        except Exception as msg:
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(parent,
-                 _('Error') if app_name is None else app_name,
-                 (_("%s could not be opened:") % osp.basename(filename))+\
-                 "\n"+str(msg))
-            return
-        yield filename, data
+    # Images are loaded concurrently (in the order of `filenames`)
+    arrays = io.imread_iter(filenames, to_grayscale=to_grayscale)
+    try:
+        for filename in filenames:
+            try:
+                data = next(arrays)
+            except Exception as msg:
+                import traceback
+                traceback.print_exc()
+                QMessageBox.critical(parent,
+                     _('Error') if app_name is None else app_name,
+                     (_("%s could not be opened:") % osp.basename(filename))+\
+                     "\n"+str(msg))
+                return
+            yield filename, data
+    finally:
+        arrays.close()
     
 
 if __name__ == "__main__":
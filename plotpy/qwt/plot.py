@@ -20,7 +20,7 @@ QwtPlotItem
 """
 
 from .qt.QtGui import (QWidget, QFont, QSizePolicy, QFrame, QApplication,
-                          QRegion, QPainter, QPalette)
+                          QRegion, QPainter, QPalette, QPicture)
 from .qt.QtCore import Qt, Signal, QEvent, QSize, QRectF
 
 from .text import QwtText, QwtTextLabel
@@ -28,6 +28,7 @@ from .scale_widget import QwtScaleWidget
 from .scale_draw import QwtScaleDraw
 from .scale_engine import QwtLinearScaleEngine
 from .plot_canvas import QwtPlotCanvas
+from .painter import QwtPainter
 from .scale_div import QwtScaleDiv
 from .scale_map import QwtScaleMap
 from .graphic import QwtGraphic
@@ -35,6 +36,7 @@ from .legend import QwtLegendData
 from .interval import QwtInterval
 
 import numpy as np
+import bisect
 
 
 def qwtEnableLegendItems(plot, on):
@@ -68,16 +70,39 @@ def qwtSetTabOrder(first, second, with_children):
 
 
 class ItemList(list):
+    """
+    List of plot items, kept sorted in increasing z-order
+    
+    Items z values are mirrored in a sorted list, so that the insertion 
+    (or removal) position of an item is found by bisection instead of 
+    sorting the whole list.
+    """
+    def __init__(self):
+        super(ItemList, self).__init__()
+        self._zlist = []
+
     def sortItems(self):
         self.sort(key=lambda item: item.z())
+        self._zlist = [item.z() for item in self]
 
     def insertItem(self, obj):
-        self.append(obj)
-        self.sortItems()
+        z = obj.z()
+        # Items sharing the same z value are kept in insertion order
+        index = bisect.bisect_right(self._zlist, z)
+        self.insert(index, obj)
+        self._zlist.insert(index, z)
         
     def removeItem(self, obj):
-        self.remove(obj)
-        self.sortItems()
+        z = obj.z()
+        start = bisect.bisect_left(self._zlist, z)
+        stop = bisect.bisect_right(self._zlist, z)
+        for index in range(start, stop):
+            if self[index] is obj:
+                break
+        else:
+            index = self.index(obj)
+        del self[index]
+        del self._zlist[index]
 
 
 class QwtPlotDict_PrivateData(object):
@@ -1305,7 +1330,48 @@ class QwtPlot(QFrame, QwtPlotDict):
             :py:meth:`QwtPlotItem.getCanvasMarginHint()`
         """
         maps = [self.canvasMap(axisId) for axisId in self.validAxes]
-        self.drawItems(painter, self.__data.canvas.contentsRect(), maps)
+        canvas = self.__data.canvas
+        canvasRect = canvas.contentsRect()
+        if not canvas.testPaintAttribute(QwtPlotCanvas.LayeredBackingStore):
+            self.drawItems(painter, canvasRect, maps)
+            return
+        itemList = self.itemList()
+        staticItems = []
+        for index, item in enumerate(itemList):
+            if self.isOverlayItem(item):
+                overlayItems = itemList[index:]
+                break
+            if item.isVisible():
+                staticItems.append(item)
+        else:
+            overlayItems = []
+        key = (tuple([id(item) for item in staticItems]),
+               canvasRect.getRect(), (canvas.width(), canvas.height()))
+        layer = canvas.staticLayer(key)
+        if layer is None:
+            layer = QwtPainter.backingStore(canvas, canvas.size())
+            layer.fill(Qt.transparent)
+            layerPainter = QPainter(layer)
+            layerPainter.setClipRect(canvasRect)
+            self.drawItemList(layerPainter, canvasRect, maps, staticItems)
+            layerPainter.end()
+            canvas.setStaticLayer(layer, key, staticItems)
+        painter.drawPixmap(0, 0, layer)
+        self.drawItemList(painter, canvasRect, maps, overlayItems)
+    
+    def isOverlayItem(self, item):
+        """
+        :param .plot.QwtPlotItem item: Plot item
+        :return: True if item has to be painted on the canvas overlay layer
+        
+        The default implementation returns False (all items are painted on 
+        the static layer).
+
+        .. seealso::
+        
+            :py:data:`.plot_canvas.QwtPlotCanvas.LayeredBackingStore`
+        """
+        return False
     
     def drawItems(self, painter, canvasRect, maps):
         """
@@ -1322,15 +1388,29 @@ class QwtPlot(QFrame, QwtPlotDict):
             frame styles ( f.e `QFrame.Box` ) and it might be necessary to 
             fix the margins manually using `QWidget.setContentsMargins()`
         """
-        for item in self.itemList():
+        self.drawItemList(painter, canvasRect, maps, self.itemList())
+    
+    def drawItemList(self, painter, canvasRect, maps, items):
+        """
+        Draw plot items
+        
+        :param QPainter painter: Painter used for drawing
+        :param QRectF canvasRect: Bounding rectangle where to paint
+        :param list maps: `QwtPlot.axisCnt` maps, mapping between plot and paint device coordinates
+        :param list items: Plot items, sorted in increasing z-order
+        """
+        for item in items:
             if item and item.isVisible():
                 painter.save()
                 painter.setRenderHint(QPainter.Antialiasing,
                           item.testRenderHint(QwtPlotItem.RenderAntialiased))
                 painter.setRenderHint(QPainter.HighQualityAntialiasing,
                           item.testRenderHint(QwtPlotItem.RenderAntialiased))
-                item.draw(painter, maps[item.xAxis()], maps[item.yAxis()],
-                          canvasRect)
+                xMap, yMap = maps[item.xAxis()], maps[item.yAxis()]
+                if item.testItemAttribute(QwtPlotItem.RenderCache):
+                    item.drawCached(painter, xMap, yMap, canvasRect)
+                else:
+                    item.draw(painter, xMap, yMap, canvasRect)
                 painter.restore()
 
     def canvasMap(self, axisId):
@@ -1612,6 +1692,7 @@ class QwtPlotItem_PrivateData(object):
         self.yAxis = QwtPlot.yLeft
         self.legendIconSize = QSize(8, 8)
         self.title = None # QwtText
+        self.renderCache = None
 
 
 class QwtPlotItem(object):
@@ -1642,6 +1723,12 @@ class QwtPlotItem(object):
     Depending on the `QwtPlotItem.ItemAttribute` flags, an item is included
     into autoscaling or has an entry on the legend.
     
+    When the `QwtPlotItem.RenderCache` attribute is set, the item output 
+    is recorded (as a `QPicture`) and replayed on the following paints, 
+    until scale maps or canvas rectangle change or until `itemChanged()` 
+    (or `invalidateRenderCache()`) is called: this requires every 
+    modification of the item to be notified this way.
+    
     Before misusing the existing item classes it might be better to
     implement a new type of plot item
     ( don't implement a watermark as spectrogram ).
@@ -1673,6 +1760,7 @@ class QwtPlotItem(object):
     Legend = 0x01
     AutoScale = 0x02
     Margins = 0x04
+    RenderCache = 0x08
     
     # enum ItemInterest
     ScaleInterest = 0x01
@@ -2001,9 +2089,49 @@ class QwtPlotItem(object):
         
             :py:meth:`QwtPlot.legendChanged()`, :py:meth:`QwtPlot.autoRefresh()`
         """
+        self.invalidateRenderCache()
         if self.__data.plot:
             self.__data.plot.autoRefresh()
     
+    def invalidateRenderCache(self):
+        """
+        Invalidate the render cache, without refreshing the parent plot
+        (see `QwtPlotItem.RenderCache` attribute)
+        
+        This is meant for modifications which are followed by an explicit 
+        replot of the parent plot.
+
+        .. seealso::
+        
+            :py:meth:`itemChanged()`, :py:meth:`drawCached()`
+        """
+        self.__data.renderCache = None
+    
+    def drawCached(self, painter, xMap, yMap, canvasRect):
+        """
+        Draw the item, replaying its render cache if it is still valid
+        (see `QwtPlotItem.RenderCache` attribute)
+
+        :param QPainter painter: Painter
+        :param .scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param .scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas in painter coordinates
+        """
+        key = (xMap.s1(), xMap.s2(), xMap.p1(), xMap.p2(),
+               type(xMap.transformation()),
+               yMap.s1(), yMap.s2(), yMap.p1(), yMap.p2(),
+               type(yMap.transformation()),
+               QRectF(canvasRect).getRect(), int(painter.renderHints()))
+        cache = self.__data.renderCache
+        if cache is None or cache[0] != key:
+            picture = QPicture()
+            recorder = QPainter(picture)
+            recorder.setRenderHints(painter.renderHints())
+            self.draw(recorder, xMap, yMap, canvasRect)
+            recorder.end()
+            cache = self.__data.renderCache = (key, picture)
+        painter.drawPicture(0, 0, cache[1])
+    
     def legendChanged(self):
         """
         Update the legend of the parent plot.
@@ -310,6 +310,9 @@ class QwtPlotCanvas_PrivateData(object):
         self.borderRadius = 0
         self.paintAttributes = 0
         self.backingStore = None
+        self.staticLayer = None
+        self.staticLayerKey = None
+        self.staticLayerItems = set()
         self.styleSheet = StyleSheet()
         self.styleSheet.hasBorder = False
 
@@ -380,6 +383,19 @@ class QwtPlotCanvas(QFrame):
                 :py:meth:`replot()`, :py:meth:`QWidget.repaint()`, 
                 :py:meth:`QWidget.update()`
                 
+        * `QwtPlotCanvas.LayeredBackingStore`:
+        
+            Split plot items in two layers: a static layer, cached in a 
+            pixmap, and an overlay layer, painted on top of it (see 
+            :py:meth:`.plot.QwtPlot.isOverlayItem()`).
+            
+            Items are painted in increasing z-order: the static layer 
+            contains the visible items below the first overlay item, 
+            and the overlay layer contains all other items.
+            The static layer is repainted only when invalidated (see 
+            :py:meth:`replot()`) or when its item list has changed, so that 
+            overlay items may be repainted alone (see :py:meth:`updateOverlay()`).
+    
     Focus indicators:
     
         * `QwtPlotCanvas.NoFocusIndicator`:
@@ -413,6 +429,7 @@ class QwtPlotCanvas(QFrame):
     Opaque = 2
     HackStyledBackground = 4
     ImmediatePaint = 8
+    LayeredBackingStore = 16
     
     # enum FocusIndicator
     NoFocusIndicator, CanvasFocusIndicator, ItemFocusIndicator = list(range(3))
@@ -477,6 +494,9 @@ class QwtPlotCanvas(QFrame):
         elif attribute == self.Opaque:
             if on:
                 self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        elif attribute == self.LayeredBackingStore:
+            if not on:
+                self.invalidateStaticLayer()
         elif attribute in (self.HackStyledBackground, self.ImmediatePaint):
             pass
         
@@ -500,9 +520,62 @@ class QwtPlotCanvas(QFrame):
         return self.__data.backingStore
     
     def invalidateBackingStore(self):
-        """Invalidate the internal backing store"""
+        """Invalidate the internal backing store (and the static layer)"""
         if self.__data.backingStore:
             self.__data.backingStore = QPixmap()
+        self.invalidateStaticLayer()
+    
+    def staticLayer(self, key):
+        """
+        :param key: Static layer key (e.g. tuple of static item ids)
+        :return: Cached static layer, None if it was invalidated or if         *key* has changed
+        
+        .. seealso::
+        
+            :py:meth:`setStaticLayer()`
+        """
+        if self.__data.staticLayerKey == key:
+            return self.__data.staticLayer
+        return None
+    
+    def setStaticLayer(self, layer, key, items):
+        """
+        Set the static layer cache
+        
+        :param QPixmap layer: Static layer pixmap (painted static items)
+        :param key: Static layer key (e.g. tuple of static item ids)
+        :param list items: Static items
+        """
+        self.__data.staticLayer = layer
+        self.__data.staticLayerKey = key
+        self.__data.staticLayerItems = set([id(item) for item in items])
+    
+    def invalidateStaticLayer(self):
+        """Invalidate the static layer cache"""
+        self.__data.staticLayer = None
+        self.__data.staticLayerKey = None
+        self.__data.staticLayerItems = set()
+    
+    def isStaticLayerItem(self, item):
+        """
+        :param .plot.QwtPlotItem item: Plot item
+        :return: True if item is painted in the cached static layer
+        """
+        return id(item) in self.__data.staticLayerItems
+    
+    def updateOverlay(self):
+        """
+        Repaint the canvas reusing the cached static layer, if any
+        (only overlay items are repainted)
+        
+        .. seealso::
+        
+            :py:meth:`replot()`
+        """
+        if self.testPaintAttribute(self.ImmediatePaint):
+            self.repaint(self.contentsRect())
+        else:
+            self.update(self.contentsRect())
     
     def setFocusIndicator(self, focusIndicator):
         """
@@ -228,11 +228,13 @@ class QwtPointArrayData(QwtSeriesData):
 
         :return: Bounding rectangle
         """
-        xmin = self.__x.min()
-        xmax = self.__x.max()
-        ymin = self.__y.min()
-        ymax = self.__y.max()
-        return QRectF(xmin, ymin, xmax-xmin, ymax-ymin)
+        if self._boundingRect.width() < 0:
+            xmin = self.__x.min()
+            xmax = self.__x.max()
+            ymin = self.__y.min()
+            ymax = self.__y.max()
+            self._boundingRect = QRectF(xmin, ymin, xmax-xmin, ymax-ymin)
+        return QRectF(self._boundingRect)
     
     def size(self):
         """
@@ -26,11 +26,17 @@ from .math import qwtRadians
 
 from .qt.QtGui import QPalette, QFontMetrics, QTransform
 from .qt.QtCore import (Qt, qFuzzyCompare, QLocale, QRectF, QPointF, QRect,
-                           QPoint)
+                           QPoint, QSizeF)
 
 import numpy as np
 
 
+#: Tick label sizes, shared by all scale draws:
+#: (font key, text, render flags, minimum layout) -> size
+LABELSIZECACHE = {}
+LABELSIZECACHE_MAXSIZE = 4096
+
+
 class QwtAbstractScaleDraw_PrivateData(object):
     def __init__(self):
         self.spacing = 4
@@ -416,9 +422,32 @@ class QwtAbstractScaleDraw(object):
             lbl = QwtText(self.label(value))
             lbl.setRenderFlags(0)
             lbl.setLayoutAttribute(QwtText.MinimumLayout)
-            lbl.textSize(font)
             self.__data.labelCache[value] = lbl
         return lbl
+    
+    def tickLabelSize(self, font, value):
+        """
+        Return the size of the label representing a value
+
+        Contrary to labels (see `tickLabel()`), label sizes are cached 
+        with respect to label font and text: zooming or panning (i.e. 
+        changing the scale division) does not require to measure again 
+        labels which have already been displayed.
+        
+        :param QFont font: Font
+        :param float value: Value
+        :return: Tick label size
+        """
+        global LABELSIZECACHE
+        lbl = self.tickLabel(font, value)
+        key = (lbl.usedFont(font).key(), lbl.text(), lbl.renderFlags(),
+               lbl.testLayoutAttribute(QwtText.MinimumLayout))
+        size = LABELSIZECACHE.get(key)
+        if size is None:
+            if len(LABELSIZECACHE) >= LABELSIZECACHE_MAXSIZE:
+                LABELSIZECACHE.clear()
+            size = LABELSIZECACHE.setdefault(key, lbl.textSize(font))
+        return QSizeF(size)
         
     def invalidateCache(self):
         """
@@ -917,7 +946,7 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
         if lbl is None or lbl.isEmpty():
             return
         pos = self.labelPosition(value)
-        labelSize = lbl.textSize(painter.font())
+        labelSize = self.tickLabelSize(painter.font(), value)
         transform = self.labelTransformation(pos, labelSize)
         painter.save()
         painter.setWorldTransform(transform, True)
@@ -943,7 +972,7 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
         if lbl.isEmpty():
             return QRect()
         pos = self.labelPosition(value)
-        labelSize = lbl.textSize(font)
+        labelSize = self.tickLabelSize(font, value)
         transform = self.labelTransformation(pos, labelSize)
         return transform.mapRect(QRect(QPoint(0, 0), labelSize.toSize()))
     
@@ -1000,7 +1029,7 @@ class QwtScaleDraw(QwtAbstractScaleDraw):
         if not lbl or lbl.isEmpty():
             return QRectF(0., 0., 0., 0.)
         pos = self.labelPosition(value)
-        labelSize = lbl.textSize(font)
+        labelSize = self.tickLabelSize(font, value)
         transform = self.labelTransformation(pos, labelSize)
         br = transform.mapRect(QRectF(QPointF(0, 0), labelSize))
         br.translate(-pos.x(), -pos.y())
@@ -329,13 +329,17 @@ class QwtScaleEngine(object):
         :param .interval.QwtInterval interval: Interval
         :return: Stripped tick list
         """
-        if not interval.isValid() or not ticks:
+        if not interval.isValid() or not len(ticks):
             return []
         if self.contains(interval, ticks[0]) and\
            self.contains(interval, ticks[-1]):
             return ticks
-        return [tick for tick in ticks
-                if self.contains(interval, tick)]
+        # Vectorized version of `self.contains(interval, tick)`:
+        eps = abs(1.e-6*interval.width())
+        values = np.array(ticks, dtype=float)
+        outside = np.logical_or(interval.minValue()-values > eps,
+                                values-interval.maxValue() > eps)
+        return values[~outside].tolist()
     
     def buildInterval(self, value):
         """
@@ -547,9 +551,12 @@ class QwtLinearScaleEngine(QwtScaleEngine):
             self.buildMinorTicks(ticks, maxMinorSteps, stepSize)
         for i in range(QwtScaleDiv.NTickTypes):
             ticks[i] = self.strip(ticks[i], interval)
-            for j in range(len(ticks[i])):
-                if qwtFuzzyCompare(ticks[i][j], 0., stepSize) == 0:
-                    ticks[i][j] = 0.
+            if ticks[i]:
+                # Vectorized version of `qwtFuzzyCompare(tick, 0., stepSize)`
+                values = np.array(ticks[i], dtype=float)
+                eps = abs(1.e-6*stepSize)
+                values[~np.logical_or(-values > eps, values > eps)] = 0.
+                ticks[i] = values.tolist()
         return ticks
     
     def buildMajorTicks(self, interval, stepSize):
@@ -563,11 +570,8 @@ class QwtLinearScaleEngine(QwtScaleEngine):
         numTicks = min([round(interval.width()/stepSize)+1, 10000])
         if np.isnan(numTicks):
             numTicks = 0
-        ticks = [interval.minValue()]
-        for i in range(1, int(numTicks-1)):
-            ticks += [interval.minValue()+i*stepSize]
-        ticks += [interval.maxValue()]
-        return ticks
+        inner = interval.minValue()+np.arange(1, int(numTicks-1))*stepSize
+        return [interval.minValue()]+inner.tolist()+[interval.maxValue()]
     
     def buildMinorTicks(self, ticks, maxMinorSteps, stepSize):
         """
@@ -581,19 +585,23 @@ class QwtLinearScaleEngine(QwtScaleEngine):
         if minStep == 0.:
             return
         numTicks = int(np.ceil(abs(stepSize/minStep))-1)
+        majorTicks = ticks[QwtScaleDiv.MajorTick]
+        if numTicks < 1 or not majorTicks:
+            return
         medIndex = -1
         if numTicks % 2:
             medIndex = numTicks/2
-        for val in ticks[QwtScaleDiv.MajorTick]:
-            for k in range(numTicks):
-                val += minStep
-                alignedValue = val
-                if qwtFuzzyCompare(val, 0., stepSize) == 0:
-                    alignedValue = 0.
-                if k == medIndex:
-                    ticks[QwtScaleDiv.MediumTick] += [alignedValue]
-                else:
-                    ticks[QwtScaleDiv.MinorTick] += [alignedValue]
+        # Row i: major tick i followed by its minor ticks, the latter being 
+        # computed by cumulative sums (i.e. `val += minStep`)
+        values = np.empty((len(majorTicks), numTicks+1), dtype=float)
+        values[:, 0] = majorTicks
+        values[:, 1:] = minStep
+        values = np.cumsum(values, axis=1)[:, 1:]
+        eps = abs(1.e-6*stepSize)
+        values[~np.logical_or(-values > eps, values > eps)] = 0.
+        isMedium = np.arange(numTicks) == medIndex
+        ticks[QwtScaleDiv.MediumTick] += values[:, isMedium].ravel().tolist()
+        ticks[QwtScaleDiv.MinorTick] += values[:, ~isMedium].ravel().tolist()
     
     def align(self, interval, stepSize):
         """
@@ -795,11 +803,8 @@ class QwtLogScaleEngine(QwtScaleEngine):
         lxmax = np.log(interval.maxValue())
         lstep = (lxmax-lxmin)/float(numTicks-1)
 
-        ticks = [interval.minValue()]
-        for i in range(1, numTicks-1):
-            ticks += [np.exp(lxmin+float(i)*lstep)]
-        ticks += [interval.maxValue()]
-        return ticks
+        inner = np.exp(lxmin+np.arange(1, numTicks-1, dtype=float)*lstep)
+        return [interval.minValue()]+inner.tolist()+[interval.maxValue()]
 
     def buildMinorTicks(self, ticks, maxMinorSteps, stepSize):
         """
@@ -810,6 +815,9 @@ class QwtLogScaleEngine(QwtScaleEngine):
         :param float stepSize: Step size
         """
         logBase = self.base()
+        majorTicks = np.array(ticks[QwtScaleDiv.MajorTick], dtype=float)
+        if majorTicks.size == 0:
+            return
         
         if stepSize < 1.1:
             minStep = self.divideInterval(stepSize, maxMinorSteps+1)
@@ -822,20 +830,23 @@ class QwtLogScaleEngine(QwtScaleEngine):
             if numSteps > 2 and numSteps % 2 == 0:
                 mediumTickIndex = numSteps/2
             
-            for v in ticks[QwtScaleDiv.MajorTick]:
-                s = logBase/numSteps
-                if s >= 1.:
-                    if not qFuzzyCompare(s, 1.):
-                        ticks[QwtScaleDiv.MinorTick] += [v*s]
-                    for j in range(2, numSteps):
-                        ticks[QwtScaleDiv.MinorTick] += [v*j*s]
-                else:
-                    for j in range(1, numSteps):
-                        tick = v + j*v*(logBase-1)/numSteps
-                        if j == mediumTickIndex:
-                            ticks[QwtScaleDiv.MediumTick] += [tick]
-                        else:
-                            ticks[QwtScaleDiv.MinorTick] += [tick]
+            # Row i: minor ticks following major tick i
+            v = majorTicks[:, np.newaxis]
+            s = logBase/numSteps
+            if s >= 1.:
+                j = list(range(2, numSteps))
+                if not qFuzzyCompare(s, 1.):
+                    j.insert(0, 1)
+                j = np.array(j, dtype=float)
+                ticks[QwtScaleDiv.MinorTick] += (v*j*s).ravel().tolist()
+            else:
+                j = np.arange(1, numSteps)
+                values = v + j*v*(logBase-1)/numSteps
+                isMedium = j == mediumTickIndex
+                ticks[QwtScaleDiv.MediumTick] +=\
+                    values[:, isMedium].ravel().tolist()
+                ticks[QwtScaleDiv.MinorTick] +=\
+                    values[:, ~isMedium].ravel().tolist()
                             
         else:
             minStep = self.divideInterval(stepSize, maxMinorSteps)
@@ -859,13 +870,17 @@ class QwtLogScaleEngine(QwtScaleEngine):
             
             minFactor = max([np.power(logBase, minStep), float(logBase)])
             
-            for tick in ticks[QwtScaleDiv.MajorTick]:
-                for j in range(numTicks):
-                    tick *= minFactor
-                    if j == mediumTickIndex:
-                        ticks[QwtScaleDiv.MediumTick] += [tick]
-                    else:
-                        ticks[QwtScaleDiv.MinorTick] += [tick]
+            # Row i: major tick i followed by its minor ticks, the latter 
+            # being computed by cumulative products (i.e. `tick *= minFactor`)
+            values = np.empty((majorTicks.size, numTicks+1), dtype=float)
+            values[:, 0] = majorTicks
+            values[:, 1:] = minFactor
+            values = np.cumprod(values, axis=1)[:, 1:]
+            isMedium = np.arange(numTicks) == mediumTickIndex
+            ticks[QwtScaleDiv.MediumTick] +=\
+                values[:, isMedium].ravel().tolist()
+            ticks[QwtScaleDiv.MinorTick] +=\
+                values[:, ~isMedium].ravel().tolist()
 
     def align(self, interval, stepSize):
         """
@@ -45,6 +45,7 @@ QwtRichTextEngine
 
 import numpy as np
 import struct
+from collections import OrderedDict
 
 from .qt.QtGui import (QPainter, QFrame, QSizePolicy, QPalette, QFont,
                           QFontMetrics, QApplication, QColor, QWidget,
@@ -176,6 +177,36 @@ class QwtTextEngine(object):
 
 ASCENTCACHE = {}
 
+
+class QwtText_LRUCache(object):
+    """
+    Least recently used cache, used by text engines to store text sizes
+    and laid out documents (keys are built from text, flags and font)
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.__items = OrderedDict()
+    
+    def __len__(self):
+        return len(self.__items)
+    
+    def get(self, key):
+        value = self.__items.pop(key, None)
+        if value is not None:
+            self.__items[key] = value
+        return value
+    
+    def set(self, key, value):
+        self.__items.pop(key, None)
+        self.__items[key] = value
+        while len(self.__items) > self.maxsize:
+            self.__items.popitem(last=False)
+        return value
+    
+    def clear(self):
+        self.__items.clear()
+
+
 def qwtScreenResolution():
     screenResolution = QSize()
     if not screenResolution.isValid():
@@ -203,10 +234,13 @@ class QwtPlainTextEngine(QwtTextEngine):
     `QwtPlainTextEngine` renders texts using the basic `Qt` classes
     `QPainter` and `QFontMetrics`.
     """
+    SIZE_CACHE_MAXSIZE = 1024
+    
     def __init__(self):
         self.qrectf_max = QRectF(0, 0, QWIDGETSIZE_MAX, QWIDGETSIZE_MAX)
         self._fm_cache = {}
         self._fm_cache_f = {}
+        self._size_cache = QwtText_LRUCache(self.SIZE_CACHE_MAXSIZE)
     
     def fontmetrics(self, font):
         fid = font.toString()
@@ -234,10 +268,14 @@ class QwtPlainTextEngine(QwtTextEngine):
         :param float width: Width
         :return: Calculated height
         """
-        fm = self.fontmetrics_f(font)
-        rect = fm.boundingRect(QRectF(0, 0, width, QWIDGETSIZE_MAX),
-                               flags, text)
-        return rect.height()
+        key = (text, int(flags), font.key(), width)
+        height = self._size_cache.get(key)
+        if height is None:
+            fm = self.fontmetrics_f(font)
+            rect = fm.boundingRect(QRectF(0, 0, width, QWIDGETSIZE_MAX),
+                                   flags, text)
+            height = self._size_cache.set(key, rect.height())
+        return height
     
     def textSize(self, font, flags, text):
         """
@@ -248,9 +286,13 @@ class QwtPlainTextEngine(QwtTextEngine):
         :param str text: Text to be rendered
         :return: Calculated size
         """
-        fm = self.fontmetrics_f(font)
-        rect = fm.boundingRect(self.qrectf_max, flags, text)
-        return rect.size()
+        key = (text, int(flags), font.key())
+        size = self._size_cache.get(key)
+        if size is None:
+            fm = self.fontmetrics_f(font)
+            rect = fm.boundingRect(self.qrectf_max, flags, text)
+            size = self._size_cache.set(key, rect.size())
+        return QSizeF(size)
     
     def effectiveAscent(self, font):
         global ASCENTCACHE
@@ -333,9 +375,36 @@ class QwtRichTextEngine(QwtTextEngine):
 
     `QwtRichTextEngine` renders `Qt` rich texts using the classes
     of the Scribe framework of `Qt`.
+    
+    Text sizes and laid out documents are cached (least recently used 
+    entries are discarded first): drawing or measuring the same text 
+    again does not require to parse and lay it out again.
     """
+    SIZE_CACHE_MAXSIZE = 1024
+    DOCUMENT_CACHE_MAXSIZE = 64
+    
     def __init__(self):
-        pass
+        self._size_cache = QwtText_LRUCache(self.SIZE_CACHE_MAXSIZE)
+        self._doc_cache = QwtText_LRUCache(self.DOCUMENT_CACHE_MAXSIZE)
+    
+    def document(self, font, flags, text):
+        """
+        Return the rich text document used to render text
+        
+        Documents are cached: the returned document must not be modified,
+        except for its page size.
+
+        :param QFont font: Font of the text
+        :param int flags: Bitwise OR of the flags like in for QPainter::drawText
+        :param str text: Text to be rendered
+        :return: Document (`QwtRichTextDocument` instance)
+        """
+        key = (text, int(flags), font.key())
+        doc = self._doc_cache.get(key)
+        if doc is None:
+            doc = self._doc_cache.set(key,
+                                      QwtRichTextDocument(text, flags, font))
+        return doc
     
     def heightForWidth(self, font, flags, text, width):
         """
@@ -347,9 +416,14 @@ class QwtRichTextEngine(QwtTextEngine):
         :param float width: Width
         :return: Calculated height
         """
-        doc = QwtRichTextDocument(text, flags, font)
-        doc.setPageSize(QSizeF(width, QWIDGETSIZE_MAX))
-        return doc.documentLayout().documentSize().height()
+        key = (text, int(flags), font.key(), width)
+        height = self._size_cache.get(key)
+        if height is None:
+            doc = self.document(font, flags, text)
+            doc.setPageSize(QSizeF(width, QWIDGETSIZE_MAX))
+            height = doc.documentLayout().documentSize().height()
+            self._size_cache.set(key, height)
+        return height
     
     def textSize(self, font, flags, text):
         """
@@ -360,13 +434,19 @@ class QwtRichTextEngine(QwtTextEngine):
         :param str text: Text to be rendered
         :return: Calculated size
         """
-        doc = QwtRichTextDocument(text, flags, font)
-        option = doc.defaultTextOption()
-        if option.wrapMode() != QTextOption.NoWrap:
-            option.setWrapMode(QTextOption.NoWrap)
-            doc.setDefaultTextOption(option)
-            doc.adjustSize()
-        return doc.size()
+        key = (text, int(flags), font.key())
+        size = self._size_cache.get(key)
+        if size is None:
+            if flags & Qt.TextWordWrap:
+                # Measuring the unwrapped text requires a specific document
+                unwrapped = Qt.AlignmentFlag(int(flags) &
+                                             ~int(Qt.TextWordWrap))
+                doc = QwtRichTextDocument(text, unwrapped, font)
+            else:
+                doc = self.document(font, flags, text)
+                doc.adjustSize()
+            size = self._size_cache.set(key, doc.size())
+        return QSizeF(size)
     
     def draw(self, painter, rect, flags, text):
         """
@@ -377,7 +457,7 @@ class QwtRichTextEngine(QwtTextEngine):
         :param int flags: Bitwise OR of the flags like in for QPainter::drawText()
         :param str text: Text to be rendered
         """
-        txt = QwtRichTextDocument(text, flags, painter.font())
+        txt = self.document(painter.font(), flags, text)
         painter.save()
         unscaledRect = QRectF(rect)
         if painter.font().pixelSize() < 0:
@@ -391,7 +471,6 @@ class QwtRichTextEngine(QwtTextEngine):
                 painter.setWorldTransform(transform, True)
                 invtrans, _ok = transform.inverted()
                 unscaledRect = invtrans.mapRect(rect)
-        txt.setDefaultFont(painter.font())
         txt.setPageSize(QSizeF(unscaledRect.width(), QWIDGETSIZE_MAX))
         layout = txt.documentLayout()
         height = layout.documentSize().height()
@@ -926,12 +1005,12 @@ class QwtText(object):
         """
         font = QFont(self.usedFont(defaultFont), self._desktopwidget)
         if not self.__layoutCache.textSize.isValid() or\
-           self.__layoutCache.font is not font:
+           self.__layoutCache.font != font:
             self.__layoutCache.textSize =\
                 self.__data.textEngine.textSize(font, self.__data.renderFlags,
                                                 self.__data.text)
             self.__layoutCache.font = font
-        sz = self.__layoutCache.textSize
+        sz = QSizeF(self.__layoutCache.textSize)
         if self.__data.layoutAttributes & self.MinimumLayout:
             (left, right, top, bottom
              ) = self.__data.textEngine.textMargins(font)
@@ -593,7 +593,7 @@ class PolygonShape(AbstractShape):
         self.shapeparam = ShapeParam(_("Shape"), icon="rectangle.png")
         reader.read('shapeparam', instance=self.shapeparam)
         self.shapeparam.update_shape(self)
-        self.points = reader.read(group_name='points', func=reader.read_array)
+        self.points = reader.read(group_name='points', func=reader.read_ndarray)
         self.setZ(reader.read('z'))
     
     #----Public API-------------------------------------------------------------
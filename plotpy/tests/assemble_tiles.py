@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Image assembling test: images assembled tile by tile (e.g. large snapshots
+written in a memory-mapped file) must match images assembled at once"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import tempfile
+import numpy as np
+
+from plotpy.qt.QtCore import QRectF
+from plotpy.builder import make
+from plotpy.image import assemble_imageitems, get_assembled_image_shape
+
+
+def check_items(items, qrect, destw, desth, original_resolution=False):
+    """Compare tiled and untiled assembled images"""
+    kwargs = dict(original_resolution=original_resolution,
+                  apply_interpolation=False)
+    ref = assemble_imageitems(items, qrect, destw, desth, **kwargs)
+    for tile_rows in (1, 7, 16):
+        tiled = assemble_imageitems(items, qrect, destw, desth,
+                                    tile_rows=tile_rows, **kwargs)
+        assert np.array_equal(ref, tiled), "tile_rows=%d" % tile_rows
+    shape = get_assembled_image_shape(destw, desth)
+    output = np.memmap(tempfile.TemporaryFile(), dtype=np.float32,
+                       mode='w+', shape=shape)
+    assemble_imageitems(items, qrect, destw, desth, output=output,
+                        tile_rows=5, **kwargs)
+    assert np.array_equal(ref, output)
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    data = np.random.rand(60, 80)
+    image = make.image(data, interpolation='nearest')
+    check_items([image], QRectF(10., 5., 50., 40.), 50, 40)
+    check_items([image], QRectF(10.5, 5.5, 50., 40.), 100, 80)
+    for dx, dy in ((1., 1.), (.7, 1.3), (2.5, .4)):
+        trimage = make.trimage(data, x0=20., y0=15., dx=dx, dy=dy,
+                               interpolation='nearest')
+        qrect = trimage.boundingRect().adjusted(3.3, 2.1, -4.7, -1.9)
+        check_items([trimage], qrect, 61, 47)
+        check_items([trimage], qrect, 61, 47, original_resolution=True)
+    print("Image assembling: OK")
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Axis synchronization test: axis changes gathered in a synchronization
+transaction are applied once, with the final axis limits"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.baseplot import BasePlot
+from plotpy.plot import PlotManager
+from plotpy.image import ImagePlot
+from plotpy.builder import make
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    manager = PlotManager(None)
+    plot1, plot2 = ImagePlot(), ImagePlot()
+    manager.add_plot(plot1, "1")
+    manager.add_plot(plot2, "2")
+    manager.synchronize_axis(BasePlot.X_BOTTOM, ["1", "2"])
+    manager.synchronize_axis(BasePlot.Y_LEFT, ["1", "2"])
+    applied = []
+    apply_sync = manager.apply_axis_synchronization
+    def apply_axis_synchronization():
+        applied.append(True)
+        apply_sync()
+    manager.apply_axis_synchronization = apply_axis_synchronization
+
+    # Image plot autoscale changes limits twice: synchronized once
+    plot1.add_item(make.image(np.random.rand(40, 60)))
+    del applied[:]
+    plot1.set_axis_limits("bottom", 0., 1.)
+    plot1.do_autoscale()
+    assert len(applied) == 1, applied
+    for axis in ("bottom", "left"):
+        assert plot2.get_axis_limits(axis) == plot1.get_axis_limits(axis)
+
+    # Nested transaction: applied when leaving the outermost one
+    del applied[:]
+    manager.begin_axis_synchronization()
+    manager.begin_axis_synchronization()
+    for vmax in (10., 20., 30.):
+        plot2.set_axis_limits("bottom", 5., vmax)
+        plot2.SIG_PLOT_AXIS_CHANGED.emit(plot2)
+    manager.end_axis_synchronization()
+    assert not applied
+    manager.end_axis_synchronization()
+    assert len(applied) == 1
+    assert plot1.get_axis_limits("bottom") == (5., 30.)
+    print("Axis synchronization: OK")
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Bulk item insertion/removal test: a single notification is emitted and
+plot items are kept sorted by z order"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.curve import CurvePlot
+from plotpy.builder import make
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    plot = CurvePlot()
+    notifications = []
+    plot.SIG_ITEMS_CHANGED.connect(lambda plot: notifications.append(plot))
+    x = np.linspace(0, 10, 50)
+    curves = [make.curve(x, x*index) for index in range(100)]
+    count = len(plot.get_items())   # Grid
+
+    plot.add_items(curves[:50])
+    assert len(notifications) == 1
+    z0 = curves[0].z()
+    assert z0 > plot.grid.z()
+    assert [item.z() for item in curves[:50]] == list(range(z0, z0+50))
+    plot.add_items(curves[50:], z=0)
+    assert len(notifications) == 2
+    assert curves[50].z() == 0 and curves[99].z() == 49
+    # Qwt item list is sorted by z order (stable for equal z values)
+    zlist = [item.z() for item in plot.itemList()]
+    assert zlist == sorted(zlist)
+    assert len(plot.get_items()) == count+100
+
+    # Removing items: nothing is removed if one item is not in plot
+    del notifications[:]
+    try:
+        plot.del_items(curves[:10]+[make.curve(x, x)])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown item should raise ValueError")
+    assert len(plot.get_items()) == count+100 and not notifications
+    plot.del_items(curves[::2])
+    assert len(notifications) == 1
+    remaining = plot.get_items()
+    assert len(remaining) == count+50
+    assert all([item in remaining for item in curves[1::2]])
+    zlist = [item.z() for item in plot.itemList()]
+    assert zlist == sorted(zlist)
+
+    # Already attached items are not moved
+    zbefore = [item.z() for item in curves[1::2]]
+    plot.add_items(curves[1:3]+[curves[1]], z=1000)
+    assert [item.z() for item in curves[1::2]] == zbefore
+    assert curves[2].z() == 1000
+    assert len(plot.get_items()) == count+51
+
+    # A batch of items is replotted only once
+    plot.setAutoReplot(True)
+    many = [make.curve(x, x*index) for index in range(1000)]
+    requested = plot.replot_stats["requested"]
+    plot.add_items(many)
+    assert plot.replot_stats["requested"] <= requested+1
+    requested = plot.replot_stats["requested"]
+    plot.del_items(many)
+    assert plot.replot_stats["requested"] <= requested+1
+    assert plot.autoReplot()
+    print("Bulk item insertion/removal: OK")
+
+if __name__ == "__main__":
+    test()
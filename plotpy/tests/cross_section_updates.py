@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Cross section updates test: bursts of marker/shape changes are coalesced
+into a single cross section update, for the last changed object, and hidden
+cross section panels are updated when shown"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import time
+import gc
+import weakref
+
+from plotpy.qt.QtGui import QApplication
+from plotpy.cross_section import XCrossSectionPlot
+
+
+class Marker(object):
+    """Marker stand-in"""
+    def __init__(self, plot=None):
+        self._plot = plot
+
+    def plot(self):
+        return self._plot
+
+
+def wait_for(condition):
+    """Process events until *condition* is true (5s timeout)"""
+    t0 = time.time()
+    while not condition() and time.time()-t0 < 5.:
+        time.sleep(.01)
+        QApplication.processEvents()
+
+
+def test_hidden_panel():
+    """Test that hidden panel is updated when shown"""
+    plot = XCrossSectionPlot()
+    updates = []
+    update_plot = plot.update_plot
+    def recording_update_plot(obj=None, refresh=True):
+        updates.append((obj, refresh))
+        update_plot(obj, refresh)
+    plot.update_plot = recording_update_plot
+    marker = Marker(plot)
+    plot.update_plot(marker)
+    assert not plot.isVisible() and len(updates) == 1
+    plot.show()
+    wait_for(lambda: len(updates) > 1)
+    assert updates[1:] == [(None, True)], updates
+    # Panel is up to date: showing it again does not update it
+    plot.hide()
+    plot.show()
+    QApplication.processEvents()
+    time.sleep(2*plot.UPDATE_INTERVAL/1000.)
+    QApplication.processEvents()
+    assert len(updates) == 2, updates
+    plot.close()
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    plot = XCrossSectionPlot()
+    updates = []
+    plot.update_plot = lambda obj=None, refresh=True: \
+                       updates.append((obj, refresh))
+
+    # Burst of changes: only the last object is updated, once
+    markers = [Marker() for _index in range(10)]
+    for marker in markers:
+        plot.marker_changed(marker)
+    assert not updates
+    wait_for(lambda: updates)
+    assert updates == [(markers[-1], True)], updates
+
+    # Pending update may be processed immediately
+    del updates[:]
+    plot.schedule_update(markers[0], refresh=True)
+    plot.schedule_update(None, refresh=False)
+    plot.process_pending_update()
+    assert updates == [(markers[0], True)], updates
+    plot.process_pending_update()
+    assert len(updates) == 1
+
+    # Pending update does not keep the scheduled object alive
+    del updates[:]
+    marker = Marker()
+    ref = weakref.ref(marker)
+    plot.schedule_update(marker)
+    del marker
+    gc.collect()
+    assert ref() is None
+    plot.process_pending_update()
+    assert updates == [(None, True)], updates
+
+    test_hidden_panel()
+    print("Cross section updates: OK")
+
+if __name__ == "__main__":
+    test()
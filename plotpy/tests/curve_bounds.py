@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Curve bounding rectangle test: bounding rectangles are cached until data
+or axis scales change, and autoscale covers all curves"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.curve import CurvePlot
+from plotpy.builder import make
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    plot = CurvePlot()
+    x = np.linspace(1, 10, 100)
+    curve = make.curve(x, x**2)
+    plot.add_item(curve)
+    calls = []
+    compute_bounds = curve.compute_bounds
+    def counting_compute_bounds():
+        calls.append(True)
+        return compute_bounds()
+    curve.compute_bounds = counting_compute_bounds
+
+    rect = curve.boundingRect()
+    assert (rect.left(), rect.right()) == (1., 10.)
+    assert (rect.top(), rect.bottom()) == (1., 100.)
+    curve.boundingRect()
+    assert len(calls) == 1
+    # Data has changed
+    curve.set_data(x, -x)
+    rect = curve.boundingRect()
+    assert len(calls) == 2 and (rect.top(), rect.bottom()) == (-10., -1.)
+    # Explicit invalidation
+    curve.invalidate_bounds()
+    curve.boundingRect()
+    assert len(calls) == 3
+    # Axis scale has changed
+    ncalls = len(calls)
+    plot.set_axis_scale(curve.yAxis(), "log")
+    curve.boundingRect()
+    assert len(calls) == ncalls+1
+    plot.set_axis_scale(curve.yAxis(), "lin")
+
+    # Autoscale covers all curves
+    curve2 = make.curve(x-20, x*10)
+    plot.add_item(curve2)
+    plot.do_autoscale()
+    xmin, xmax = plot.get_axis_limits(curve.xAxis())
+    assert xmin <= -19 and xmax >= 10
+    ymin, ymax = plot.get_axis_limits(curve.yAxis())
+    assert ymin <= -10 and ymax >= 100
+    print("Curve bounding rectangle: OK")
+
+if __name__ == "__main__":
+    test()
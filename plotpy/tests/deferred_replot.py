@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Deferred replot test: successive replots are coalesced, and reading axis
+limits does not force the pending replot"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.qt.QtGui import QApplication
+from plotpy.curve import CurvePlot
+from plotpy.builder import make
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    plot = CurvePlot()
+    plot.set_deferred_replot(True)
+    x = np.linspace(0, 10, 100)
+    plot.add_item(make.curve(x, np.sin(x)))
+    plot.show()
+    QApplication.processEvents()
+    plot.reset_replot_stats()
+
+    # Axis limits are up to date, without performing the pending replot
+    for index in range(5):
+        plot.set_axis_limits("bottom", index, 20+index)
+        plot.replot()
+        assert plot.get_axis_limits("bottom") == (index, 20+index)
+    plot.set_axis_limits("left", -3., 3.)
+    assert plot.get_axis_limits("left") == (-3., 3.)
+    stats = plot.get_replot_stats()
+    assert stats["performed"] == 0 and stats["requested"] == 5, stats
+    QApplication.processEvents()
+    stats = plot.get_replot_stats()
+    assert stats["performed"] == 1 and stats["coalesced"] == 4, stats
+    assert plot.get_axis_limits("bottom") == (4, 24)
+
+    # Immediate replot mode
+    plot.set_deferred_replot(False)
+    plot.reset_replot_stats()
+    plot.replot()
+    plot.replot()
+    assert plot.get_replot_stats()["performed"] == 2
+    plot.close()
+    print("Deferred replot: OK")
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""DICOM memory-mapping test: pixel data value position is computed from
+the data element header (explicit/implicit VR), which must match the
+element tag and value length"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import os
+import struct
+import tempfile
+
+from plotpy.io import _get_dcm_value_offset
+
+TAG = 0x7fe00010
+
+
+def check_header(header, expected, length=4, **kwargs):
+    """Write header after a few bytes and check value position"""
+    fd, fname = tempfile.mkstemp(suffix=".dcm")
+    try:
+        os.write(fd, b"\0"*10+header+b"\1\2\3\4")
+        os.close(fd)
+        offset = _get_dcm_value_offset(fname, 10, TAG, length, **kwargs)
+        assert offset == expected, (header, offset)
+    finally:
+        os.remove(fname)
+
+
+def test():
+    """Test"""
+    # Explicit VR little endian, OW: 12-byte header
+    check_header(struct.pack('<HH2s2xI', 0x7fe0, 0x0010, b'OW', 4), 22)
+    # Explicit VR big endian, OB: 12-byte header
+    check_header(struct.pack('>HH2s2xI', 0x7fe0, 0x0010, b'OB', 4), 22,
+                 little_endian=False)
+    # Explicit VR with a 16-bit value length: 8-byte header
+    check_header(struct.pack('<HH2sH', 0x7fe0, 0x0010, b'US', 4), 18)
+    # Implicit VR: 8-byte header
+    check_header(struct.pack('<HHI', 0x7fe0, 0x0010, 4), 18,
+                 implicit_vr=True)
+    # Unknown length is not checked
+    check_header(struct.pack('<HHI', 0x7fe0, 0x0010, 4), 18, length=None,
+                 implicit_vr=True)
+    # Header does not match: wrong tag, wrong length or wrong position
+    check_header(struct.pack('<HH2s2xI', 0x7fe0, 0x0008, b'OW', 4), None)
+    check_header(struct.pack('<HH2s2xI', 0x7fe0, 0x0010, b'OW', 4), None,
+                 length=6)
+    check_header(b"\0\0"+struct.pack('<HH2s2xI', 0x7fe0, 0x0010, b'OW', 4),
+                 None)
+    print("DICOM pixel data offset: OK")
+
+if __name__ == "__main__":
+    test()
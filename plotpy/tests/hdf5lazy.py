@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""HDF5 lazy reading test: `read_array` returns deferred datasets, image
+items keep them until data is accessed, other plot items hold actual arrays"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+# WARNING:
+# This script requires read/write permissions on current directory
+
+import os
+import numpy as np
+
+from plotpy.hdf5io import HDF5Reader, HDF5Writer, LazyArray
+from plotpy.builder import make
+from plotpy import io
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    fname = "hdf5lazy.h5"
+    x = np.linspace(-5, 5, 200)
+    items = [make.curve(x, np.sin(x)),
+             make.image(np.random.rand(50, 40)),
+             make.xyimage(np.arange(40.), np.arange(50.),
+                          np.random.rand(50, 40)),
+             make.error(x, np.cos(x), None, .1*np.ones_like(x))]
+    writer = HDF5Writer(fname)
+    io.save_items(writer, items)
+    with writer.group('array'):
+        writer.write_array(np.arange(10.))
+    writer.close()
+    try:
+        reader = HDF5Reader(fname, lazy=True)
+        restored = io.load_items(reader)
+        with reader.group('array'):
+            array = reader.read_array()
+            ndarray = reader.read_ndarray()
+        assert isinstance(array, LazyArray) and array.shape == (10,)
+        assert isinstance(ndarray, np.ndarray)
+        assert np.array_equal(array[2:4], ndarray[2:4])
+        # Conversion to NumPy array
+        assert array.__array__(copy=False) is array.materialize()
+        assert array.__array__(copy=True) is not array.materialize()
+        assert array.__array__(np.float32).dtype == np.float32
+        try:
+            array.__array__(np.float32, copy=False)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("dtype conversion requires a copy")
+        reader.close()
+        curve, image, xyimage, error = restored
+        # Image data is read on first access (even after reader is closed)
+        for item in (image, xyimage):
+            assert isinstance(item._data, LazyArray)
+            assert not item._data.is_materialized()
+            assert not item.is_empty()
+        assert image.boundingRect().width() == 40
+        arrays = list(curve.get_data())+[image.data, xyimage.data, xyimage.x,
+                                         xyimage.y]+list(error.get_data()[:2])
+        for arr in arrays:
+            assert isinstance(arr, np.ndarray)
+        assert np.array_equal(curve.get_data()[1], np.sin(x))
+        assert isinstance(curve.boundingRect().width(), float)
+    finally:
+        os.remove(fname)
+    print("HDF5 lazy reading: OK")
+
+if __name__ == "__main__":
+    test()
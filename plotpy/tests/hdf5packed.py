@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""HDF5 packed attributes test: plot items written with packed attributes
+(shared attributes tables) must be restored as with plain attributes"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+# WARNING:
+# This script requires read/write permissions on current directory
+
+import os
+import h5py
+import numpy as np
+
+from plotpy.hdf5io import HDF5Reader, HDF5Writer, PACKED_ATTRS
+from plotpy.builder import make
+from plotpy.image import ImageItem
+from plotpy import io
+
+
+def write_read(fname, items, packed):
+    """Write and read items, return restored items"""
+    writer = HDF5Writer(fname, packed=packed)
+    io.save_items(writer, items)
+    writer.write(u"Titlé", "title")
+    writer.write_object_list([None, items[0]], "objects")
+    writer.close()
+    reader = HDF5Reader(fname)
+    try:
+        restored = io.load_items(reader)
+        title = reader.read("title", func=reader.read_unicode)
+        objects = reader.read_object_list("objects", type(items[0]))
+    finally:
+        reader.close()
+    assert title == u"Titlé"
+    assert objects[0] is None
+    assert np.array_equal(objects[1].get_data()[1], items[0].get_data()[1])
+    return restored
+
+
+def test_layout(fname):
+    """Test packed file layout"""
+    small, large = np.arange(12.).reshape(6, 2), np.arange(1000.)
+    floats = list(np.arange(3000.))                  # 24 kB
+    many = list(np.arange(10000.))                   # 80 kB
+    ids = [b"%036d" % index for index in range(2000)]
+    for packed in (False, True):
+        writer = HDF5Writer(fname, packed=packed)
+        with writer.group("arrays"):
+            writer.write(small, "small")
+            writer.write(large, "large")
+        with writer.group("sequences"):
+            writer.write(floats, "floats")
+            writer.write(many, "many")
+            writer.write(ids, "ids")
+        writer.close()
+        h5 = h5py.File(fname, "r")
+        try:
+            assert isinstance(h5["arrays/large"], h5py.Dataset)
+            if packed:
+                # Small arrays and sequences are packed with attributes
+                assert "small" not in h5["arrays"]
+                assert "sequences" not in h5
+            else:
+                # Sequences are stored as attributes unless HDF5 can't store
+                # them this way (64 kB object header limit)
+                assert isinstance(h5["arrays/small"], h5py.Dataset)
+                assert "floats" in h5["sequences"].attrs
+                assert "ids" in h5["sequences"].attrs
+                assert isinstance(h5["sequences/many"], h5py.Dataset)
+        finally:
+            h5.close()
+        for lazy in (False, True):
+            reader = HDF5Reader(fname, lazy=lazy)
+            try:
+                with reader.group("arrays"):
+                    assert np.array_equal(reader.read("small",
+                                          func=reader.read_array), small)
+                    assert np.array_equal(reader.read("small",
+                                          func=reader.read_ndarray), small)
+                    assert np.array_equal(reader.read("large",
+                                          func=reader.read_ndarray), large)
+                with reader.group("sequences"):
+                    assert reader.read("floats",
+                                       func=reader.read_sequence) == floats
+                    assert reader.read("many",
+                                       func=reader.read_sequence) == many
+                    assert [bytes(value) if isinstance(value, bytes)
+                            else value.encode() for value in
+                            reader.read("ids", func=reader.read_sequence)]\
+                           == ids
+            finally:
+                reader.close()
+
+
+def test_exceptions(fname):
+    """Test that packed attributes are written when an exception occurs"""
+    try:
+        with HDF5Writer(fname, packed=True) as writer:
+            writer.write(1.5, "value")
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert writer.h5 is None
+    with HDF5Reader(fname) as reader:
+        assert reader.read("value") == 1.5
+    # File is closed even if buffered attributes can't be written
+    writer = HDF5Writer(fname, packed=True)
+    with writer.group("invalid"):
+        writer.write_any(object())
+    try:
+        writer.close()
+    except TypeError:
+        pass
+    assert writer.h5 is None and not writer._pending_attrs
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    fname = "hdf5packed.h5"
+    try:
+        test_layout(fname)
+        test_exceptions(fname)
+    finally:
+        if os.path.exists(fname):
+            os.remove(fname)
+    x = np.linspace(-5, 5, 200)
+    items = [make.curve(x, np.sin(x), title=u"Sinüs", color="r"),
+             make.image(np.random.rand(50, 40), title="Image"),
+             make.error(x, np.cos(x), None, .1*np.ones_like(x))]
+    items += [make.curve(x, x*i, title="Curve %d" % i) for i in range(20)]
+    try:
+        plain = write_read(fname, items, packed=False)
+        packed = write_read(fname, items, packed=True)
+        h5 = h5py.File(fname, "r")
+        try:
+            assert PACKED_ATTRS in h5
+        finally:
+            h5.close()
+    finally:
+        os.remove(fname)
+    for item, item_plain, item_packed in zip(items, plain, packed):
+        assert type(item_packed) is type(item)
+        assert item_packed.title().text() == item_plain.title().text()
+        if isinstance(item, ImageItem):
+            assert np.array_equal(item_packed.data, item.data)
+        else:
+            for arr, arr_packed in zip(item.get_data(),
+                                       item_packed.get_data()):
+                assert np.array_equal(arr, arr_packed)
+    print("HDF5 packed attributes: OK")
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""HDF5 storage policy test: writer's storage policy applies to all arrays,
+unless overridden for a given array"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+# WARNING:
+# This script requires read/write permissions on current directory
+
+import os
+import h5py
+import numpy as np
+
+from plotpy.hdf5io import (HDF5Reader, HDF5Writer, GZIP_STORAGE,
+                           CONTIGUOUS_STORAGE)
+
+
+def test():
+    """Test"""
+    fname = "hdf5storage.h5"
+    data = np.random.rand(200, 300)
+    writer = HDF5Writer(fname, storage=GZIP_STORAGE)
+    writer.write(data, "default")
+    with writer.group("contiguous"):
+        writer.write_array(data, storage=CONTIGUOUS_STORAGE)
+    writer.close()
+    try:
+        h5 = h5py.File(fname, "r")
+        try:
+            assert h5["default"].compression == "gzip"
+            assert h5["contiguous"].compression is None
+            assert h5["contiguous"].chunks is None
+        finally:
+            h5.close()
+        reader = HDF5Reader(fname)
+        for name in ("default", "contiguous"):
+            with reader.group(name):
+                assert np.array_equal(reader.read_array(), data)
+        reader.close()
+    finally:
+        os.remove(fname)
+    print("HDF5 storage policy: OK")
+
+if __name__ == "__main__":
+    test()
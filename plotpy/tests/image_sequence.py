@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Image file sequence test: caching, prefetching and release of resources
+(prefetching thread must stop when the sequence is no longer referenced)"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import os.path as osp
+import tempfile
+import shutil
+import time
+import gc
+import weakref
+import numpy as np
+
+from plotpy import io
+from plotpy.builder import make
+
+
+def wait_for(condition, timeout=5.):
+    """Wait until condition() is True"""
+    t0 = time.time()
+    while not condition() and time.time()-t0 < timeout:
+        time.sleep(.01)
+    return condition()
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    tmpdir = tempfile.mkdtemp()
+    try:
+        filenames = []
+        for index in range(8):
+            fname = osp.join(tmpdir, "frame%02d.npy" % index)
+            np.save(fname, np.ones((64, 64))*index)
+            filenames.append(fname)
+
+        seq = io.ImageSequence(filenames, prefetch=2)
+        assert seq.get(3)[0, 0] == 3
+        # Neighbour images are prefetched
+        cache = seq._cache
+        assert wait_for(lambda: all([idx in cache for idx in (1, 2, 4, 5)]))
+        thread = seq._thread
+        ref = weakref.ref(seq)
+        del seq
+        gc.collect()
+        assert ref() is None
+        assert wait_for(lambda: not thread.is_alive())
+
+        # Image item: previous sequence is closed when replaced
+        item = make.image(filename=filenames[0])
+        seq1 = io.ImageSequence(filenames)
+        item.set_image_sequence(seq1)
+        item.load_frame(6)
+        assert item.data[0, 0] == 6
+        thread = seq1._thread
+        item.set_image_sequence(io.ImageSequence(filenames))
+        assert not thread.is_alive()
+        item.load_frame(7)
+        assert item.data[0, 0] == 7
+        del item
+        gc.collect()
+    finally:
+        shutil.rmtree(tmpdir)
+    print("Image sequence: OK")
+
+if __name__ == "__main__":
+    test()
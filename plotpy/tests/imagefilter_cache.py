@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Image filter cache test: filter results are cached until source data,
+filter area or filter settings change, and a failed threaded computation
+is submitted again"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.qt.QtCore import QThreadPool
+from plotpy.qt.QtGui import QApplication
+from plotpy.builder import make
+
+
+class ScaleFilter(object):
+    """Parametrized filter counting its calls"""
+    def __init__(self, factor):
+        self.factor = factor
+        self.calls = 0
+        self.failures = 0
+
+    def __call__(self, x, y, data):
+        self.calls += 1
+        if self.failures > 0:
+            self.failures -= 1
+            raise ValueError("filter failure")
+        return data*self.factor
+
+
+def wait_for_filter():
+    """Wait for worker pool and process filter notification"""
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    x = np.linspace(-5, 5, 100)
+    y = np.linspace(-5, 5, 80)
+    data = np.random.rand(len(y), len(x))
+    image = make.xyimage(x, y, data)
+    flt = ScaleFilter(2.)
+    item = make.imagefilter(-2., 2., -2., 2., image, filter=flt)
+
+    # Synchronous mode: results are cached
+    _x, _y, fdata = item.get_filtered_data(-2., -2., 2., 2.)
+    item.get_filtered_data(-2., -2., 2., 2.)
+    assert flt.calls == 1
+    # Filter settings have changed
+    flt.factor = 3.
+    item.filter_changed()
+    _x, _y, fdata3 = item.get_filtered_data(-2., -2., 2., 2.)
+    assert flt.calls == 2 and np.allclose(fdata3, fdata*1.5)
+    # Source data has changed
+    image.data_changed()
+    item.get_filtered_data(-2., -2., 2., 2.)
+    assert flt.calls == 3
+
+    # Threaded mode: failed computation is submitted again
+    item.set_threaded(True)
+    item.filter_changed()
+    flt.failures = 1
+    item.get_filtered_data(-2., -2., 2., 2.)
+    wait_for_filter()
+    assert flt.calls == 4
+    item.get_filtered_data(-2., -2., 2., 2.)
+    wait_for_filter()
+    assert flt.calls == 5
+    _x, _y, tdata = item.get_filtered_data(-2., -2., 2., 2.)
+    assert flt.calls == 5 and np.allclose(tdata, fdata3)
+    print("Image filter cache: OK")
+
+if __name__ == "__main__":
+    test()
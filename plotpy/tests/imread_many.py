@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Concurrent image loading test: images are returned in the order of file
+names, loading may be canceled and errors are raised on the failing file"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import os.path as osp
+import tempfile
+import shutil
+import numpy as np
+
+from plotpy import io
+
+
+def test():
+    """Test"""
+    tmpdir = tempfile.mkdtemp()
+    try:
+        filenames = []
+        for index in range(12):
+            fname = osp.join(tmpdir, "image%02d.npy" % index)
+            np.save(fname, np.ones((32, 48))*index)
+            filenames.append(fname)
+        for workers in (1, 4, None):
+            arrays = io.imread_many(filenames, workers=workers)
+            assert [arr[0, 0] for arr in arrays] == list(range(12))
+
+        # Canceling after the third image
+        progress = []
+        def callback(value):
+            progress.append(value)
+            return len(progress) == 3
+        arrays = io.imread_many(filenames, workers=4,
+                                progress_callback=callback)
+        assert len(arrays) == 3 and progress == [8, 16, 25], progress
+
+        # Invalid file: images before it are yielded, then error is raised
+        fname = osp.join(tmpdir, "invalid.npy")
+        with open(fname, "wb") as fd:
+            fd.write(b"invalid")
+        loaded = []
+        try:
+            for arr in io.imread_iter(filenames[:2]+[fname], workers=2):
+                loaded.append(arr)
+        except Exception:
+            pass
+        else:
+            raise AssertionError("invalid file should not be readable")
+        assert len(loaded) == 2
+    finally:
+        shutil.rmtree(tmpdir)
+    print("Concurrent image loading: OK")
+
+if __name__ == "__main__":
+    test()
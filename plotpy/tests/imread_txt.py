@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Text image reader test: delimiter guessing and invalid files"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import os
+import os.path as osp
+import tempfile
+import shutil
+import numpy as np
+
+from plotpy import io
+
+
+def check_invalid(fname, text):
+    """Invalid text files must raise ValueError"""
+    with open(fname, 'w') as fd:
+        fd.write(text)
+    try:
+        io.imread(fname)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("%r should not be readable" % text)
+
+
+def check_reader(tmpdir):
+    """Check text image reader"""
+    data = np.random.rand(20, 30)
+    for delimiter in ('\t', ',', ';', ' '):
+        fname = osp.join(tmpdir, "image.txt")
+        np.savetxt(fname, data, delimiter=delimiter,
+                   header="comment line")
+        assert np.allclose(io.imread(fname), data)
+        os.remove(fname)
+    fname = osp.join(tmpdir, "image.txt")
+    with open(fname, 'w') as fd:
+        fd.write("# Header\n\n1 2 3 # Comment\n4 5 6\n\n")
+    assert np.array_equal(io.imread(fname), [[1, 2, 3], [4, 5, 6]])
+    with open(fname, 'w') as fd:
+        fd.write("1,2,3\n")
+    assert np.array_equal(io.imread(fname), [1, 2, 3])
+    fname = osp.join(tmpdir, "image.csv")
+    check_invalid(fname, "1 2 3\n4\n5 6\n")    # Ragged rows
+    check_invalid(fname, "1 2 3\n4 5\n6 7 8 9\n")
+    check_invalid(fname, "1,,3\n4,5,6\n")      # Missing value
+    check_invalid(fname, "1,2,3\n4,a,6\n")     # Non-numeric value
+
+
+def test():
+    """Test"""
+    tmpdir = tempfile.mkdtemp()
+    saved = io.LOADTXT_IS_FAST, io.TXT_CHUNK_SIZE
+    try:
+        check_reader(tmpdir)
+        # Chunked parser (used with NumPy < 1.23), with small chunks so that
+        # preallocated array has to be enlarged
+        io.LOADTXT_IS_FAST, io.TXT_CHUNK_SIZE = False, 1000
+        check_reader(tmpdir)
+        calls = []
+        read_chunks = io._imread_txt_chunks
+        def counting_read_chunks(*args):
+            result = read_chunks(*args)
+            calls.append(result is not None)
+            return result
+        io._imread_txt_chunks = counting_read_chunks
+        try:
+            check_reader(tmpdir)
+        finally:
+            io._imread_txt_chunks = read_chunks
+        # Valid files are parsed by chunks, invalid ones are not
+        assert calls == [True]*6+[False]*4, calls
+    finally:
+        io.LOADTXT_IS_FAST, io.TXT_CHUNK_SIZE = saved
+        shutil.rmtree(tmpdir)
+    print("Text image reader: OK")
+
+if __name__ == "__main__":
+    test()
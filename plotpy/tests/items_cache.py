@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Plot item lists cache test: cached type-filtered and z-sorted item lists
+must follow item insertion, removal and z-order changes"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.image import ImagePlot
+from plotpy.interfaces import ICurveItemType, IImageItemType
+from plotpy.builder import make
+
+
+def check_items(plot):
+    """Compare cached item lists with lists computed from scratch"""
+    items = plot.items
+    zsorted = sorted(items, reverse=True, key=lambda item: item.z())
+    assert plot.get_items(z_sorted=True) == zsorted
+    for item_type in (ICurveItemType, IImageItemType):
+        assert plot.get_items(item_type=item_type) ==\
+               [item for item in items if item_type in item.types()]
+        assert plot.get_items(z_sorted=True, item_type=item_type) ==\
+               [item for item in zsorted if item_type in item.types()]
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    plot = ImagePlot()
+    x = np.linspace(0, 10, 50)
+    curves = [make.curve(x, x*index) for index in range(5)]
+    images = [make.image(np.random.rand(20, 30)) for _index in range(3)]
+    plot.add_items(curves)
+    check_items(plot)
+    for image in images:
+        plot.add_item(image)
+        check_items(plot)
+    # Returned lists are copies
+    plot.get_items(item_type=ICurveItemType).pop()
+    assert len(plot.get_items(item_type=ICurveItemType)) == 5
+    # Z-order changes
+    curves[0].setZ(100)
+    check_items(plot)
+    assert plot.get_items(z_sorted=True)[0] is curves[0]
+    plot.move_down([curves[0]])
+    check_items(plot)
+    # Removal
+    plot.del_items([curves[1], images[0]])
+    check_items(plot)
+    assert curves[1] not in plot.get_items(item_type=ICurveItemType)
+    print("Plot item lists cache: OK")
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Layered canvas test: static items (curves, images, ...) are cached in a
+canvas layer, so that shapes may be repainted alone"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.qt.QtGui import QPainter, QPixmap
+from plotpy.curve import CurvePlot
+from plotpy.builder import make
+from plotpy.transitional import QwtPlotCanvas
+
+
+def count_draw_calls(item, calls):
+    """Count *item* draw calls in *calls* dictionary"""
+    draw = item.draw
+    def counting_draw(*args):
+        calls[item] = calls.get(item, 0)+1
+        return draw(*args)
+    item.draw = counting_draw
+
+
+def paint(plot):
+    """Paint plot canvas on a pixmap"""
+    canvas = plot.canvas()
+    pixmap = QPixmap(canvas.size())
+    painter = QPainter(pixmap)
+    plot.drawCanvas(painter)
+    painter.end()
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    plot = CurvePlot()
+    plot.resize(400, 300)
+    canvas = plot.canvas()
+    assert canvas.testPaintAttribute(QwtPlotCanvas.LayeredBackingStore)
+    x = np.linspace(0, 10, 100)
+    curve = make.curve(x, np.sin(x))
+    marker = make.marker(position=(5, 0))
+    rect = make.rectangle(1, -.5, 3, .5)
+    plot.add_items([curve, marker, rect])
+    assert not plot.isOverlayItem(curve) and plot.isOverlayItem(marker)
+    calls = {}
+    for item in (curve, marker, rect):
+        count_draw_calls(item, calls)
+
+    paint(plot)
+    assert calls == {curve: 1, marker: 1, rect: 1}
+    assert canvas.isStaticLayerItem(curve)
+    assert not canvas.isStaticLayerItem(marker)
+    # Static layer is reused when repainting shapes
+    plot.replot_overlay([marker])
+    paint(plot)
+    assert calls == {curve: 1, marker: 2, rect: 2}
+    # A changed static item triggers a full replot
+    plot.replot_overlay([curve])
+    paint(plot)
+    assert calls == {curve: 2, marker: 3, rect: 3}
+    plot.replot()
+    paint(plot)
+    assert calls[curve] == 3
+    # Static item list has changed
+    curve.setVisible(False)
+    paint(plot)
+    assert calls[curve] == 3 and not canvas.isStaticLayerItem(curve)
+    curve.setVisible(True)
+    paint(plot)
+    assert calls[curve] == 4
+    # Canvas resize
+    plot.resize(500, 400)
+    plot.updateLayout()
+    paint(plot)
+    assert calls[curve] == 5
+    # Items above the first overlay item are painted on the overlay layer
+    curve.setZ(rect.z()+1)
+    paint(plot)
+    assert not canvas.isStaticLayerItem(curve)
+    paint(plot)
+    assert calls[curve] == 7
+    # Without layered backing store, every item is painted
+    canvas.setPaintAttribute(QwtPlotCanvas.LayeredBackingStore, False)
+    curve.setZ(0)
+    paint(plot)
+    paint(plot)
+    assert calls[curve] == 9 and not canvas.isStaticLayerItem(curve)
+    print("Layered canvas: OK")
+
+if __name__ == "__main__":
+    test()
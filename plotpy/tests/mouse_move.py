@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Mouse move compression test: mouse move events received faster than the
+mouse move interval are compressed, without changing event order"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import time
+
+from plotpy.qt.QtCore import Qt, QEvent, QPointF
+from plotpy.qt.QtGui import QMouseEvent, QApplication
+from plotpy.config import CONF
+from plotpy.curve import CurvePlot
+from plotpy.events import StatefulEventFilter
+
+
+def mouse_event(evt_type, x, button=Qt.NoButton):
+    """Return mouse event at position (x, 0)"""
+    return QMouseEvent(evt_type, QPointF(x, 0), button, button,
+                       Qt.NoModifier)
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    plot = CurvePlot()
+    evfilter = StatefulEventFilter(plot)
+    assert evfilter.get_mouse_move_interval() ==\
+           CONF.get("plot", "mouse_move/interval")
+    received = []
+    def record(name):
+        return lambda _filter, event: received.append((name, event.pos().x()))
+    evfilter.add_event(0, evfilter.mouse_move(Qt.NoButton), record("move"), 0)
+    evfilter.add_event(0, evfilter.mouse_press(Qt.LeftButton),
+                       record("press"), 0)
+    def move(*xlist):
+        for x in xlist:
+            evfilter.eventFilter(plot, mouse_event(QEvent.MouseMove, x))
+
+    # First move is processed at once, the last of the following ones is
+    # processed before the next handled event
+    evfilter.set_mouse_move_interval(1000)
+    move(1, 2, 3, 4, 5)
+    assert received == [("move", 1)]
+    evfilter.eventFilter(plot, mouse_event(QEvent.MouseButtonPress, 10,
+                                           Qt.LeftButton))
+    assert received == [("move", 1), ("move", 5), ("press", 10)]
+    # Disabling compression processes the pending mouse move
+    del received[:]
+    move(11, 12)
+    assert received == []
+    evfilter.set_mouse_move_interval(0)
+    assert received == [("move", 12)]
+    move(13, 14)
+    assert received == [("move", 12), ("move", 13), ("move", 14)]
+    # Pending mouse move is processed once the interval has elapsed
+    del received[:]
+    evfilter.set_mouse_move_interval(50)
+    move(20, 21)
+    t0 = time.time()
+    while ("move", 21) not in received and time.time()-t0 < 5:
+        QApplication.processEvents()
+        time.sleep(.01)
+    assert received and received[-1] == ("move", 21), received
+    assert len(received) <= 2, received
+    assert evfilter.get_mouse_move_interval() == 50
+    print("Mouse move compression: OK")
+
+if __name__ == "__main__":
+    test()
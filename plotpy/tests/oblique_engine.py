@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Oblique cross section engine test: sampling only the footprint of the
+rotated rectangle must give the same section as sampling the whole image"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.builder import make
+from plotpy.geometry import translate, rotate
+from plotpy.image import _scale_tr, INTERP_LINEAR
+from plotpy.cross_section import ObliqueSectionEngine
+
+
+class FixedTransformEngine(ObliqueSectionEngine):
+    """Engine with a fixed destination size and transform"""
+    def __init__(self, width, height, mat):
+        super(FixedTransformEngine, self).__init__()
+        self.transform = width, height, mat
+
+    def get_transform(self, item, obj):
+        return self.transform
+
+
+def reference_image(data, width, height, mat):
+    """Oblique section image computed on the whole image"""
+    if isinstance(data, np.ma.MaskedArray):
+        data = np.ma.filled(data.astype(np.float32), np.nan)
+    dst_image = np.empty((height, width), np.float64)
+    _scale_tr(data, mat, dst_image, (0, 0, width, height),
+              (1., 0., np.nan), (INTERP_LINEAR,))
+    return dst_image
+
+
+def check_section(data, center, angle, width, height):
+    """Compare footprint and whole image sections"""
+    item = make.image(data)
+    mat = translate(*center)*rotate(-angle)*translate(-.5*width, -.5*height)
+    engine = FixedTransformEngine(width, height, mat)
+    dst_image = engine.compute_image(item, None)
+    ref = reference_image(data, width, height, mat)
+    assert np.allclose(dst_image, ref, equal_nan=True)
+    _x, profile = engine.get_section(item, dst_image)
+    with np.errstate(invalid='ignore'):
+        ref_profile = np.ma.fix_invalid(ref).mean(axis=1)
+    assert np.allclose(profile, np.ma.filled(ref_profile, np.nan),
+                       equal_nan=True)
+    # Destination buffer is reused
+    assert engine.compute_image(item, None) is dst_image
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    data = np.random.rand(200, 300)
+    check_section(data, (150., 100.), .3, 80, 20)
+    check_section(data, (20., 30.), 1.2, 100, 15)       # Partly outside
+    check_section(data.astype(np.uint16), (100., 80.), -.7, 60, 10)
+    masked = np.ma.array(data, mask=data > .8)
+    check_section(masked, (150., 100.), .5, 90, 25)
+    print("Oblique cross section engine: OK")
+
+if __name__ == "__main__":
+    test()
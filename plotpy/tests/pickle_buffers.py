@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Pickle out-of-band buffers test: plot items saved with array data in a
+sidecar file must be restored identically"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import os
+import os.path as osp
+import io as _io
+import pickle
+import shutil
+import tempfile
+import numpy as np
+
+from plotpy.builder import make
+from plotpy import io
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    if pickle.HIGHEST_PROTOCOL < 5:
+        print("Pickle out-of-band buffers: skipped (protocol 5 required)")
+        return
+    x = np.linspace(-5, 5, 1000)
+    data = np.random.rand(300, 200)
+    items = [make.curve(x, np.sin(x), title="Curve"),
+             make.image(data, title="Image"),
+             make.image(np.asfortranarray(data), title="Fortran image")]
+    tmpdir = tempfile.mkdtemp()
+    try:
+        buffers = osp.join(tmpdir, "items.buffers")
+        iofile = _io.BytesIO()
+        io.pickle_items(items, iofile, buffers=buffers)
+        # Array data is stored in sidecar file, not in pickled data
+        assert len(iofile.getvalue()) < data.nbytes
+        assert os.stat(buffers).st_size >= data.nbytes
+        iofile.seek(0)
+        curve, image, fimage = io.unpickle_items(iofile, buffers=buffers)
+        assert np.array_equal(curve.get_data()[1], np.sin(x))
+        assert np.array_equal(image.data, data)
+        assert np.array_equal(fimage.data, data)
+        # Without sidecar file, format is unchanged
+        iofile = _io.BytesIO()
+        io.pickle_items(items, iofile)
+        iofile.seek(0)
+        assert np.array_equal(pickle.load(iofile)[1].data, data)
+        del curve, image, fimage
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+    print("Pickle out-of-band buffers: OK")
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Summed-area tables test: statistics and average cross sections computed
+from summed-area tables must match those computed on data slices"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.image import ImageItem, _summed_area_tables
+
+
+def check_item(data):
+    """Compare results with and without summed-area tables"""
+    item = ImageItem(data)
+    args = (1, 2, data.shape[1]-3, data.shape[0]-1)
+    ref_x = item.get_average_xsection(*args)[1]
+    ref_y = item.get_average_ysection(*args)[1]
+    item.set_prefix_sums_enabled(True)
+    assert item.get_prefix_sums() is not None
+    assert np.allclose(item.get_average_xsection(*args)[1], ref_x)
+    assert np.allclose(item.get_average_ysection(*args)[1], ref_y)
+    # Data changed in place: tables have to be computed again
+    item.data[...] = data[::-1, ::-1]
+    item.data_changed()
+    xsection = item.get_average_xsection(*args)[1]
+    item.set_prefix_sums_enabled(False)
+    assert np.allclose(xsection, item.get_average_xsection(*args)[1])
+
+
+def check_overflow():
+    """Sums of squares of 32-bit integers must not overflow"""
+    data = np.array([[4e9, 10], [3e9, 5]], np.uint32)
+    sat, sat2 = _summed_area_tables(data)
+    assert sat2.dtype == np.float64
+    mean = sat[2, 2]/4.
+    std = np.sqrt(sat2[2, 2]/4.-mean**2)
+    assert np.allclose(std, data.astype(np.float64).std())
+    data = np.random.randint(0, 65536, (50, 40)).astype(np.uint16)
+    _sat, sat2 = _summed_area_tables(data)
+    assert sat2.dtype == np.int64
+    assert sat2[-1, -1] == (data.astype(np.int64)**2).sum()
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    for dtype in (np.uint8, np.int16, np.uint32, np.float32, np.float64):
+        data = (np.random.rand(60, 80)*200).astype(dtype)
+        check_item(data)
+    check_overflow()
+    print("Summed-area tables: OK")
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Item render cache test: item output is replayed until scale maps, canvas
+rectangle or item itself change"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.qt.QtGui import QPainter, QPixmap
+from plotpy.qt.QtCore import QLineF
+from plotpy.curve import CurvePlot, PolygonMapItem
+from plotpy.transitional import QwtPlotItem
+
+
+class LineItem(QwtPlotItem):
+    """Plot item drawing a diagonal line and counting draw calls"""
+    def __init__(self):
+        QwtPlotItem.__init__(self)
+        self.calls = 0
+
+    def draw(self, painter, xMap, yMap, canvasRect):
+        self.calls += 1
+        painter.drawLine(QLineF(xMap.transform(0.), yMap.transform(0.),
+                                xMap.transform(1.), yMap.transform(1.)))
+
+
+def paint(plot, items):
+    """Paint plot items on a pixmap"""
+    canvas = plot.canvas()
+    pixmap = QPixmap(canvas.size())
+    painter = QPainter(pixmap)
+    maps = [plot.canvasMap(axis_id) for axis_id in plot.validAxes]
+    plot.drawItemList(painter, canvas.contentsRect(), maps, items)
+    painter.end()
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    plot = CurvePlot()
+    plot.resize(400, 300)
+    cached, uncached = LineItem(), LineItem()
+    cached.setItemAttribute(QwtPlotItem.RenderCache)
+    cached.attach(plot)
+    uncached.attach(plot)
+    paint(plot, [cached, uncached])
+    paint(plot, [cached, uncached])
+    assert (cached.calls, uncached.calls) == (1, 2)
+    # Item has changed
+    cached.itemChanged()
+    paint(plot, [cached])
+    assert cached.calls == 2
+    cached.invalidateRenderCache()
+    paint(plot, [cached])
+    paint(plot, [cached])
+    assert cached.calls == 3
+    # Scale maps have changed
+    plot.set_axis_limits(cached.xAxis(), -5., 5.)
+    plot.replot()
+    paint(plot, [cached])
+    paint(plot, [cached])
+    assert cached.calls == 4
+    # Cache is disabled
+    cached.setItemAttribute(QwtPlotItem.RenderCache, False)
+    paint(plot, [cached])
+    assert cached.calls == 5
+
+    # Polygon maps are cached until modified
+    item = PolygonMapItem()
+    assert item.testItemAttribute(QwtPlotItem.RenderCache)
+    pts = np.array([[0., 0.], [1., 0.], [1., 1.], [0., 1.]])
+    item.set_data(pts, np.array([[0, 0]], np.int32),
+                  np.array([[0xff000000, 0x8000ff00]], np.uint32))
+    plot.add_item(item)
+    calls = []
+    draw = item.draw
+    def counting_draw(*args):
+        calls.append(True)
+        return draw(*args)
+    item.draw = counting_draw
+    paint(plot, [item])
+    paint(plot, [item])
+    assert len(calls) == 1
+    # Modifications invalidate the cache without replotting
+    plot.setAutoReplot(True)
+    requested = plot.replot_stats["requested"]
+    item.select()
+    paint(plot, [item])
+    assert len(calls) == 2
+    item.set_data(pts*2, *item.get_data()[1:])
+    paint(plot, [item])
+    assert len(calls) == 3
+    item.update_params()
+    item.unselect()
+    paint(plot, [item])
+    assert len(calls) == 4
+    assert plot.replot_stats["requested"] == requested
+    print("Item render cache: OK")
+
+if __name__ == "__main__":
+    test()
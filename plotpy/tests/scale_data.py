@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Data scaling test: data scaled by chunks to a data type dynamic range
+(e.g. with `imwrite(..., max_range=True)`) without being modified"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import os
+import tempfile
+import numpy as np
+
+from plotpy import io
+
+
+def reference(data, dtype):
+    """Data scaled at once"""
+    info = np.iinfo(dtype)
+    data = np.array(data, np.float64)
+    data -= data.min()
+    data *= float(info.max-info.min)/data.max()
+    data += info.min
+    return np.array(data, dtype)
+
+
+def test():
+    """Test"""
+    data = np.random.rand(300, 200)*1000.-300.
+    copy = data.copy()
+    saved_chunk_size = io.SCALE_CHUNK_SIZE
+    try:
+        for chunk_size in (saved_chunk_size, 10000, 1):
+            io.SCALE_CHUNK_SIZE = chunk_size
+            for dtype in (np.uint8, np.int16, np.uint16):
+                result = io.scale_data_to_dtype(data, dtype)
+                assert result.dtype == dtype
+                assert np.array_equal(result, reference(data, dtype))
+                out = np.zeros(data.shape, dtype)
+                assert io.scale_data_to_dtype(data, dtype, out=out) is out
+                assert np.array_equal(out, result)
+    finally:
+        io.SCALE_CHUNK_SIZE = saved_chunk_size
+    assert np.array_equal(data, copy)
+    # Constant data
+    result = io.scale_data_to_dtype(np.ones((10, 10)), np.uint8)
+    assert np.all(result == 0)
+
+    # Scaling directly into the output file
+    fd, fname = tempfile.mkstemp(suffix=".npy")
+    os.close(fd)
+    try:
+        io.imwrite(fname, data, dtype=np.uint16, max_range=True)
+        assert np.array_equal(np.load(fname), reference(data, np.uint16))
+    finally:
+        os.remove(fname)
+    assert np.array_equal(data, copy)
+    print("Data scaling: OK")
+
+if __name__ == "__main__":
+    test()
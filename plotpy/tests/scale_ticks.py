@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Scale ticks test: vectorized tick generation returns the same ticks as
+the sequential implementation and tick label sizes are cached"""
+
+from __future__ import print_function, division
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.qwt import scale_draw
+from plotpy.qwt.scale_div import QwtScaleDiv
+from plotpy.qwt.scale_engine import (QwtLinearScaleEngine, QwtLogScaleEngine,
+                                     qwtStepSize)
+from plotpy.qwt.math import qwtFuzzyCompare
+from plotpy.qt.QtCore import qFuzzyCompare
+from plotpy.qt.QtGui import QFont
+
+
+class LoopLinearScaleEngine(QwtLinearScaleEngine):
+    """Linear scale engine: reference (sequential) implementation"""
+    def strip(self, ticks, interval):
+        if not interval.isValid() or not ticks:
+            return []
+        return [tick for tick in ticks if self.contains(interval, tick)]
+
+    def buildTicks(self, interval, stepSize, maxMinorSteps):
+        ticks = [[] for _i in range(QwtScaleDiv.NTickTypes)]
+        boundingInterval = self.align(interval, stepSize)
+        ticks[QwtScaleDiv.MajorTick] = self.buildMajorTicks(boundingInterval,
+                                                            stepSize)
+        if maxMinorSteps > 0:
+            self.buildMinorTicks(ticks, maxMinorSteps, stepSize)
+        for i in range(QwtScaleDiv.NTickTypes):
+            ticks[i] = self.strip(ticks[i], interval)
+            for j in range(len(ticks[i])):
+                if qwtFuzzyCompare(ticks[i][j], 0., stepSize) == 0:
+                    ticks[i][j] = 0.
+        return ticks
+
+    def buildMajorTicks(self, interval, stepSize):
+        numTicks = min([round(interval.width()/stepSize)+1, 10000])
+        if np.isnan(numTicks):
+            numTicks = 0
+        ticks = [interval.minValue()]
+        for i in range(1, int(numTicks-1)):
+            ticks += [interval.minValue()+i*stepSize]
+        ticks += [interval.maxValue()]
+        return ticks
+
+    def buildMinorTicks(self, ticks, maxMinorSteps, stepSize):
+        minStep = qwtStepSize(stepSize, maxMinorSteps, self.base())
+        if minStep == 0.:
+            return
+        numTicks = int(np.ceil(abs(stepSize/minStep))-1)
+        medIndex = -1
+        if numTicks % 2:
+            medIndex = numTicks/2
+        for val in ticks[QwtScaleDiv.MajorTick]:
+            for k in range(numTicks):
+                val += minStep
+                alignedValue = val
+                if qwtFuzzyCompare(val, 0., stepSize) == 0:
+                    alignedValue = 0.
+                if k == medIndex:
+                    ticks[QwtScaleDiv.MediumTick] += [alignedValue]
+                else:
+                    ticks[QwtScaleDiv.MinorTick] += [alignedValue]
+
+
+class LoopLogScaleEngine(QwtLogScaleEngine):
+    """Logarithmic scale engine: reference (sequential) minor ticks"""
+    def buildMinorTicks(self, ticks, maxMinorSteps, stepSize):
+        logBase = self.base()
+        if stepSize < 1.1:
+            minStep = self.divideInterval(stepSize, maxMinorSteps+1)
+            if minStep == 0.:
+                return
+            numSteps = int(round(stepSize/minStep))
+            mediumTickIndex = -1
+            if numSteps > 2 and numSteps % 2 == 0:
+                mediumTickIndex = numSteps/2
+            for v in ticks[QwtScaleDiv.MajorTick]:
+                s = logBase/numSteps
+                if s >= 1.:
+                    if not qFuzzyCompare(s, 1.):
+                        ticks[QwtScaleDiv.MinorTick] += [v*s]
+                    for j in range(2, numSteps):
+                        ticks[QwtScaleDiv.MinorTick] += [v*j*s]
+                else:
+                    for j in range(1, numSteps):
+                        tick = v + j*v*(logBase-1)/numSteps
+                        if j == mediumTickIndex:
+                            ticks[QwtScaleDiv.MediumTick] += [tick]
+                        else:
+                            ticks[QwtScaleDiv.MinorTick] += [tick]
+        else:
+            minStep = self.divideInterval(stepSize, maxMinorSteps)
+            if minStep == 0.:
+                return
+            if minStep < 1.:
+                minStep = 1.
+            numTicks = int(round(stepSize/minStep))-1
+            if qwtFuzzyCompare((numTicks+1)*minStep, stepSize, stepSize) > 0:
+                numTicks = 0
+            if numTicks < 1:
+                return
+            mediumTickIndex = -1
+            if numTicks > 2 and numTicks % 2:
+                mediumTickIndex = numTicks/2
+            minFactor = max([np.power(logBase, minStep), float(logBase)])
+            for tick in ticks[QwtScaleDiv.MajorTick]:
+                for j in range(numTicks):
+                    tick *= minFactor
+                    if j == mediumTickIndex:
+                        ticks[QwtScaleDiv.MediumTick] += [tick]
+                    else:
+                        ticks[QwtScaleDiv.MinorTick] += [tick]
+
+
+def check_ticks(engine, reference, x1, x2, maxMajorSteps, maxMinorSteps):
+    """Compare scale divisions computed by *engine* and *reference*"""
+    div = engine.divideScale(x1, x2, maxMajorSteps, maxMinorSteps)
+    ref = reference.divideScale(x1, x2, maxMajorSteps, maxMinorSteps)
+    for tick_type in range(QwtScaleDiv.NTickTypes):
+        assert list(div.ticks(tick_type)) == list(ref.ticks(tick_type)),\
+               (x1, x2, maxMajorSteps, maxMinorSteps, tick_type)
+
+
+def test_engines():
+    """Test scale engines"""
+    rng = np.random.RandomState(0)
+    linear, linref = QwtLinearScaleEngine(), LoopLinearScaleEngine()
+    log, logref = QwtLogScaleEngine(), LoopLogScaleEngine()
+    for x1, x2 in ((0., 1.), (-1., 1.), (-3.7, 12.2), (1e-9, 2e-9),
+                   (5., -5.), (-1e6, 3e5)):
+        for maxMajorSteps in (2, 8, 20):
+            for maxMinorSteps in (0, 2, 5, 10):
+                check_ticks(linear, linref, x1, x2,
+                            maxMajorSteps, maxMinorSteps)
+    for _index in range(1000):
+        x1, x2 = np.sort(rng.uniform(-1e3, 1e3, 2))*10**rng.randint(-5, 5)
+        check_ticks(linear, linref, x1, x2, rng.randint(1, 15),
+                    rng.randint(0, 12))
+    for x1, x2 in ((1., 10.), (1e-3, 1e5), (2., 3.), (0.5, 1e20)):
+        for maxMajorSteps in (2, 8, 20):
+            for maxMinorSteps in (0, 2, 5, 10):
+                check_ticks(log, logref, x1, x2, maxMajorSteps, maxMinorSteps)
+    for _index in range(1000):
+        x1, x2 = np.sort(10**rng.uniform(-10, 10, 2))
+        check_ticks(log, logref, x1, x2, rng.randint(1, 15),
+                    rng.randint(0, 12))
+    # Strip
+    div = linear.divideScale(0., 1., 5, 0)
+    interval = div.interval()
+    assert linear.strip([-1., 0., .5, 1., 1.+1e-9, 2.], interval) ==\
+           [0., .5, 1., 1.+1e-9]
+    assert linear.strip([], interval) == []
+
+
+def test_label_size_cache():
+    """Test tick label size cache"""
+    font = QFont()
+    draw = scale_draw.QwtScaleDraw()
+    scale_draw.LABELSIZECACHE.clear()
+    size = draw.tickLabelSize(font, 1.5)
+    assert size == draw.tickLabel(font, 1.5).textSize(font)
+    assert len(scale_draw.LABELSIZECACHE) == 1
+    # Cached sizes are shared between scale draws, returned sizes are copies
+    other = scale_draw.QwtScaleDraw()
+    other_size = other.tickLabelSize(font, 1.5)
+    assert other_size == size and len(scale_draw.LABELSIZECACHE) == 1
+    other_size.setWidth(0)
+    assert draw.tickLabelSize(font, 1.5) == size
+    # Cache is bounded
+    saved_maxsize = scale_draw.LABELSIZECACHE_MAXSIZE
+    try:
+        scale_draw.LABELSIZECACHE_MAXSIZE = 10
+        for value in range(25):
+            draw.tickLabelSize(font, value)
+            assert len(scale_draw.LABELSIZECACHE) <= 10
+    finally:
+        scale_draw.LABELSIZECACHE_MAXSIZE = saved_maxsize
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    test_engines()
+    test_label_size_cache()
+    print("Scale ticks: OK")
+
+if __name__ == "__main__":
+    test()
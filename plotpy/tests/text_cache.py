@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Text cache test: text engines cache text sizes and rich text documents,
+labels parse their HTML text only when it has changed"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.qt.QtCore import Qt, QSizeF
+from plotpy.qt.QtGui import QFont
+from plotpy.qwt.text import (QwtText_LRUCache, QwtPlainTextEngine,
+                             QwtRichTextEngine, QwtRichTextDocument,
+                             QWIDGETSIZE_MAX)
+from plotpy.curve import CurvePlot
+from plotpy.builder import make
+
+
+def test_lru_cache():
+    """Test least recently used cache"""
+    cache = QwtText_LRUCache(3)
+    for key in "abc":
+        assert cache.set(key, key.upper()) == key.upper()
+    assert cache.get("a") == "A"    # "b" is now the least recently used
+    cache.set("d", "D")
+    assert len(cache) == 3 and cache.get("b") is None
+    assert [cache.get(key) for key in "acd"] == ["A", "C", "D"]
+    cache.set("a", "AA")
+    assert len(cache) == 3 and cache.get("a") == "AA"
+    cache.clear()
+    assert len(cache) == 0 and cache.get("a") is None
+
+
+def test_engines():
+    """Test text engines caches"""
+    font = QFont()
+    flags = int(Qt.AlignCenter)
+    plain = QwtPlainTextEngine()
+    size = plain.textSize(font, flags, "Plain text")
+    assert len(plain._size_cache) == 1
+    size.setWidth(0)
+    assert plain.textSize(font, flags, "Plain text") != size
+    assert len(plain._size_cache) == 1
+    plain.heightForWidth(font, flags, "Plain text", 100.)
+    bigfont = QFont(font)
+    bigfont.setPointSize(font.pointSize()*2)
+    assert plain.textSize(bigfont, flags, "Plain text").height() >\
+           plain.textSize(font, flags, "Plain text").height()
+    assert len(plain._size_cache) == 3
+
+    rich = QwtRichTextEngine()
+    text = "<b>Rich</b> text, <i>quite long to be wrapped</i>"
+    doc = rich.document(font, flags, text)
+    assert rich.document(font, flags, text) is doc
+    assert rich.document(bigfont, flags, text) is not doc
+    for flags in (int(Qt.AlignCenter), int(Qt.AlignLeft|Qt.TextWordWrap)):
+        reference = QwtRichTextDocument(text, Qt.AlignmentFlag(flags), font)
+        for width in (30., 300.):
+            reference.setPageSize(QSizeF(width, QWIDGETSIZE_MAX))
+            expected = reference.documentLayout().documentSize().height()
+            assert rich.heightForWidth(font, flags, text, width) == expected
+    assert len(rich._doc_cache) == 3
+    # Text size is the unwrapped text size, even if cached document page
+    # size has been changed by height-for-width computations
+    reference = QwtRichTextDocument(text, Qt.AlignCenter, font)
+    size = rich.textSize(font, int(Qt.AlignCenter), text)
+    assert size == reference.size()
+    size.setWidth(0)
+    assert rich.textSize(font, int(Qt.AlignCenter), text) == reference.size()
+    wrapped = rich.textSize(font, int(Qt.AlignCenter|Qt.TextWordWrap), text)
+    assert wrapped == reference.size()
+
+
+def test_labels():
+    """Test label and legend text caches"""
+    label = make.label("Label", "TL", (0, 0), "TL")
+    calls = []
+    set_html = label.text.setHtml
+    def counting_set_html(html):
+        calls.append(html)
+        set_html(html)
+    label.text.setHtml = counting_set_html
+    for _index in range(3):
+        label.set_text("Label <b>%d</b>" % 1)
+    assert len(calls) == 1
+    label.set_text("Label <b>%d</b>" % 2)
+    assert len(calls) == 2
+    label.set_text_style(color="red")
+    assert len(calls) == 3
+    assert label.text.toPlainText() == "Label 2"
+
+    plot = CurvePlot()
+    x = np.linspace(0, 10, 50)
+    plot.add_items([make.curve(x, x*index, title="Curve %d" % index)
+                    for index in range(3)])
+    legend = make.legend("TR")
+    plot.add_item(legend)
+    docs = [item[0] for item in legend.get_legend_items()]
+    assert len(docs) == 3
+    assert [item[0] for item in legend.get_legend_items()] == docs
+    legend.set_text_style(color="blue")
+    newdocs = [item[0] for item in legend.get_legend_items()]
+    assert not any([doc in docs for doc in newdocs])
+    plot.del_item(plot.get_items()[-2])
+    assert len(legend.get_legend_items()) == 2
+    assert len(legend._text_cache) == 2
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    test_lru_cache()
+    test_engines()
+    test_labels()
+    print("Text caches: OK")
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the CECILL License
+# (see plotpy/__init__.py for details)
+
+"""Non-uniform image index maps test: destination -> source index maps of
+`XYImageItem` objects are cached, and scaling with these maps gives the same
+result as scaling by walking along the image axes"""
+
+from __future__ import print_function
+
+SHOW = False # Show test in GUI-based test launcher
+
+import numpy as np
+
+from plotpy.builder import make
+from plotpy.image import (_scale_xy, _xy_index_map, INTERP_NEAREST,
+                          INTERP_LINEAR, INTERP_AA)
+
+
+def check_index_map(edges, start, step, index):
+    """Check that destination pixels fall within their source pixel"""
+    coords = start+np.arange(index.size)*step
+    inside = (coords > edges[0]) & (coords <= edges[-1])
+    assert np.all((index >= 0) == inside)
+    valid = index >= 0
+    assert np.all(edges[index[valid]] < coords[valid])
+    assert np.all(coords[valid] <= edges[index[valid]+1])
+
+
+def test_index_maps():
+    """Test index maps computation and caching"""
+    ni, nj = 30, 40
+    x = np.cumsum(np.random.rand(nj+1)+.1)
+    y = np.cumsum(np.random.rand(ni+1)+.1)
+    data = np.random.randint(0, 256, (ni, nj)).astype(np.uint16)
+    item = make.xyimage(x, y, data, interpolation="nearest")
+    H, W = 50, 80
+    item._offscreen = np.zeros((H, W), np.uint32)
+    src_rect = (x[0]-2., y[0]-1., x[-1]+3., y[-1]+2.)
+    xmap, ymap = item.get_index_maps(src_rect)
+    assert xmap.dtype == np.int32 and xmap.shape == (W, )
+    assert ymap.dtype == np.int32 and ymap.shape == (H, )
+    check_index_map(x, src_rect[0], (src_rect[2]-src_rect[0])/W, xmap)
+    check_index_map(y, src_rect[1], (src_rect[3]-src_rect[1])/H, ymap)
+    # Index maps are cached...
+    xmap2, ymap2 = item.get_index_maps(src_rect)
+    assert xmap2 is xmap and ymap2 is ymap
+    item.set_data(data*2)
+    assert item.get_index_maps(src_rect)[0] is xmap
+    # ...until axes, plot scales or offscreen size change
+    item.set_xy(x*2, y*2, assume_sorted=True)
+    assert item.get_index_maps(src_rect)[0] is not xmap
+    xmap = item.get_index_maps(src_rect)[0]
+    assert item.get_index_maps((0., 0., 1., 1.))[0] is not xmap
+    item._offscreen = np.zeros((H, W+1), np.uint32)
+    assert item.get_index_maps(src_rect)[0].shape == (W+1, )
+
+    # Destination pixels exactly on an edge belong to the previous pixel
+    edges = np.array([0., 1., 3., 4.])
+    index = _xy_index_map(edges, 0., .5, 10)
+    assert list(index) == [-1, 0, 0, 1, 1, 1, 1, 2, 2, -1]
+    check_index_map(edges, 0., .5, index)
+
+
+def test_scaling():
+    """Compare scaling with and without index maps"""
+    rng = np.random.RandomState(0)
+    ni, nj, H, W = 24, 32, 40, 60
+    # Integer pixel edges and power of two steps: the same destination
+    # coordinates are computed with and without index maps
+    x = np.cumsum(rng.randint(1, 5, nj+1)).astype(float)
+    y = np.cumsum(rng.randint(1, 5, ni+1)).astype(float)
+    cmap = np.arange(1024, dtype=np.uint32)
+    for dtype in (np.uint16, np.float64):
+        data = (rng.rand(ni, nj)*1000).astype(dtype)
+        if dtype is np.float64:
+            data[rng.rand(ni, nj) < .1] = np.nan
+        item = make.xyimage(x, y, data)
+        item._offscreen = np.zeros((H, W), np.uint32)
+        for src_rect in ((x[0]-4., y[0]-2., x[0]-4.+W*.5, y[0]-2.+H*2.),
+                         (x[0]+1., y[0], x[0]+1.+W*4., y[0]+H*.25)):
+            xmap, ymap = item.get_index_maps(src_rect)
+            for dst_rect in ((0, 0, W, H), (-5, 10, W+10, H-7),
+                             (W-3, H+2, 7, 5)):
+                for bg in (np.uint32(0xff00ff00), None):
+                    lut = (.5, 3., bg, cmap)
+                    for interp in ((INTERP_NEAREST, ), (INTERP_LINEAR, ),
+                                   (INTERP_AA, np.ones((3, 3), dtype))):
+                        dst1 = rng.randint(0, 2**31, (H, W)).astype(np.uint32)
+                        dst2 = dst1.copy()
+                        rect1 = _scale_xy(data, (x, y, src_rect), dst1,
+                                          dst_rect, lut, interp)
+                        rect2 = _scale_xy(data, (x, y, src_rect, xmap, ymap),
+                                          dst2, dst_rect, lut, interp)
+                        assert rect1 == rect2
+                        assert np.array_equal(dst1, dst2),\
+                               (dtype, src_rect, dst_rect, bg, interp[0])
+    # Index maps must match offscreen size
+    try:
+        _scale_xy(data, (x, y, src_rect, xmap[:-1], ymap), dst1, dst_rect,
+                  lut, (INTERP_NEAREST, ))
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("Index map size has not been checked")
+
+    # Hand-computed linear interpolation: destination pixel (1.5, 2.25)
+    # lies in source pixel (1, 2) with weights (.5, .25)
+    data = np.arange(16.).reshape(4, 4)
+    edges = np.arange(5.)
+    src_rect = (1.5, 2.25, 2.5, 3.25)
+    xmap = _xy_index_map(edges, 1.5, 1., 1)
+    ymap = _xy_index_map(edges, 2.25, 1., 1)
+    assert (xmap[0], ymap[0]) == (1, 2)
+    dst = np.zeros((1, 1), np.float64)
+    _scale_xy(data, (edges, edges, src_rect, xmap, ymap), dst, (0, 0, 1, 1),
+              (1., 0., None), (INTERP_LINEAR, ))
+    expected = ((9*.5+10*.5)*.75+(13*.5+14*.5)*.25)
+    assert dst[0, 0] == expected == 10.5
+
+
+def test():
+    """Test"""
+    # -- Create QApplication
+    import plotpy
+    _app = plotpy.qapplication()
+    # --
+    test_index_maps()
+    test_scaling()
+    print("Non-uniform image index maps: OK")
+
+if __name__ == "__main__":
+    test()
@@ -257,7 +257,7 @@ import os.path as osp
 from plotpy.qt.QtCore import Qt, QObject, QPointF, Signal
 from plotpy.qt.QtGui import (QMenu, QActionGroup, QPrinter, QMessageBox,
                               QPrintDialog, QAction, QToolButton, QKeySequence)
-from plotpy.qt.compat import getsavefilename, getopenfilename
+from plotpy.qt.compat import getsavefilename, getopenfilename, getopenfilenames
 
 from plotpy.qthelpers import get_std_icon, add_actions, add_separator
 from plotpy.configtools import get_icon
@@ -650,7 +650,7 @@ class MultiLineTool(InteractiveTool):
             # Error ??
             return
         self.shape.move_local_point_to(self.current_handle, event.pos())
-        filter.plot.replot()
+        filter.plot.replot_overlay([self.shape])
 
     def mouse_release(self, filter, event):
         """Releasing the mouse button validate the last point position"""
@@ -1530,6 +1530,10 @@ class CopyToClipboardTool(CommandTool):
         plot.copy_to_clipboard()
 
 
+#: Snapshots larger than this size (in bytes, 32-bit floating point data) 
+#: are assembled in a temporary memory-mapped file
+SNAPSHOT_MMAP_SIZE = 1 << 28
+
 def save_snapshot(plot, p0, p1, new_size=None):
     """
     Save rectangular plot area
@@ -1538,7 +1542,8 @@ def save_snapshot(plot, p0, p1, new_size=None):
     """
     from plotpy.image import (get_image_from_plot, get_plot_qrect,
                               get_items_in_rectangle,
-                              compute_trimageitems_original_size)
+                              compute_trimageitems_original_size,
+                              get_assembled_image_shape)
     from plotpy import io
     items = get_items_in_rectangle(plot, p0, p1)
     if not items:
@@ -1585,20 +1590,40 @@ def save_snapshot(plot, p0, p1, new_size=None):
         destw, desth = dlg.width, dlg.height
     
     try:
+        output = None
+        shape = get_assembled_image_shape(destw, desth)
+        large = 4*shape[0]*shape[1] > SNAPSHOT_MMAP_SIZE
+        if large:
+            # Large image: assembling image tile by tile in a temporary
+            # memory-mapped file
+            import tempfile
+            output = np.memmap(tempfile.TemporaryFile(), dtype=np.float32,
+                               mode='w+', shape=shape)
         data = get_image_from_plot(plot, p0, p1, destw=destw, desth=desth,
                                add_images=param.add_images,
                                apply_lut=param.apply_contrast,
                                apply_interpolation=param.apply_interpolation,
-                               original_resolution=dlg.keep_original_size)
+                               original_resolution=dlg.keep_original_size,
+                               output=output)
     
         dtype = None
         for item in items:
             if dtype is None or item.data.dtype.itemsize > dtype.itemsize:
                 dtype = item.data.dtype
+        converted = None
+        if large:
+            # Converting data by chunks into another memory-mapped file
+            converted = np.memmap(tempfile.TemporaryFile(), dtype=dtype,
+                                  mode='w+', shape=data.shape)
         if param.norm_range:
-            data = io.scale_data_to_dtype(data, dtype=dtype)
-        else:
+            data = io.scale_data_to_dtype(data, dtype=dtype, out=converted)
+        elif converted is None:
             data = np.array(data, dtype=dtype)
+        else:
+            step = max(io.SCALE_CHUNK_SIZE//max(data[:1].nbytes, 1), 1)
+            for i0 in range(0, data.shape[0], step):
+                converted[i0:i0+step] = data[i0:i0+step]
+            data = converted
     except MemoryError:
         mbytes = int(destw*desth*32./(8*1024**2))
         QMessageBox.critical(plot, _("Memory error"),
@@ -1726,6 +1751,17 @@ class OpenFileTool(CommandTool):
         if filename:
             self.directory = osp.dirname(filename)
         return filename
+
+    def get_filenames(self, plot):
+        saved_in, saved_out, saved_err = sys.stdin, sys.stdout, sys.stderr
+        sys.stdout = None
+        filenames, _f = getopenfilenames(plot, _("Open"),
+                                         self.directory, self.formats)
+        sys.stdin, sys.stdout, sys.stderr = saved_in, saved_out, saved_err
+        filenames = [to_text_string(fname) for fname in list(filenames)]
+        if filenames:
+            self.directory = osp.dirname(filenames[0])
+        return filenames
         
     def activate_command(self, plot, checked):
         """Activate tool"""
@@ -1764,10 +1800,45 @@ class LoadItemsTool(OpenFileTool):
 
 
 class OpenImageTool(OpenFileTool):
-    def __init__(self, manager, toolbar_id=DefaultToolbarID):
+    """
+    Open image tool
+    
+    If `multiple` is True, several files may be selected: images are then
+    loaded concurrently (see :py:func:`plotpy.io.imread_many`, `workers` 
+    being the number of loading threads) and the tool emits the
+    `SIG_OPEN_IMAGES` signal
+    """
+    
+    #: Signal emitted by OpenImageTool when images were opened (multiple 
+    #: selection mode, args: list of filenames, list of arrays)
+    SIG_OPEN_IMAGES = Signal("PyQt_PyObject", "PyQt_PyObject")
+    
+    def __init__(self, manager, toolbar_id=DefaultToolbarID, multiple=False,
+                 to_grayscale=True, workers=None):
         from plotpy import io
         super(OpenImageTool, self).__init__(manager, title=_("Open image"),
             formats=io.iohandler.get_filters('load'), toolbar_id=toolbar_id)
+        self.multiple = multiple
+        self.to_grayscale = to_grayscale
+        self.workers = workers
+
+    def activate_command(self, plot, checked):
+        """Activate tool"""
+        if not self.multiple:
+            super(OpenImageTool, self).activate_command(plot, checked)
+            return
+        filenames = self.get_filenames(plot)
+        if not filenames:
+            return
+        from plotpy import io
+        try:
+            arrays = io.imread_many(filenames, workers=self.workers,
+                                    to_grayscale=self.to_grayscale)
+        except Exception as msg:
+            QMessageBox.critical(plot, _("Open image"),
+                                 _("Unable to open images:")+"\n"+str(msg))
+            return
+        self.SIG_OPEN_IMAGES.emit(filenames, arrays)
     
 
 class AxisScaleTool(CommandTool):
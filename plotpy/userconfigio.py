@@ -133,7 +133,7 @@ class UserConfigReader(UserConfigIOHandler):
         return val
 
     read_bool = read_int = read_float = read_any
-    read_array = read_sequence = read_none = read_str = read_any
+    read_array = read_ndarray = read_sequence = read_none = read_str = read_any
 
     def read_unicode(self):
         val = self.read_any()
@@ -276,5 +276,114 @@ public:
 };
 
 
+/* A point on a non-uniform grid which also keeps track of
+   the destination pixel it was computed for
+*/
+template<class axis_type>
+class Point2DAxisMap : public Point2DAxis<axis_type> {
+public:
+    typedef Point::real real;
+
+    Point2DAxisMap():_j(-1),_i(-1) {}
+
+    void mapx(int j, int ix, real x) {
+	_j = j;
+	this->_ix = ix;
+	this->_x = x;
+    }
+    void mapy(int i, int iy, real y) {
+	_i = i;
+	this->_iy = iy;
+	this->_y = y;
+    }
+    void copy(const Point2DAxisMap<axis_type>& p) {
+	Point2DAxis<axis_type>::copy(p);
+	_j = p._j; _i = p._i;
+    }
+    Point2DAxisMap<axis_type>& operator=(const Point2DAxisMap<axis_type>& p) { copy(p);return *this; }
+
+    int _j, _i;
+};
+
+/* Same as XYTransform, except that source pixel indexes of
+   destination columns and rows are read from precomputed
+   index maps (-1 where destination pixel is outside source)
+   instead of walking along axes. Fractional increments
+   (subsampling) fall back to the axis walk.
+*/
+template<class axis_type, class map_type>
+class XYMapTransform {
+public:
+    typedef Point2DAxisMap<axis_type>  point;
+    typedef typename point::real real;
+
+    XYMapTransform(int _nx, int _ny,
+		   real _x0, real _y0,
+		   real _dx, real _dy,
+		   const axis_type& _ax,
+		   const axis_type& _ay,
+		   const map_type& _mx,
+		   const map_type& _my):nx(_nx), ny(_ny), x0(_x0), y0(_y0),
+	  dx(_dx), dy(_dy), ax(_ax), ay(_ay), mx(_mx), my(_my) {}
+
+    void testx(point& p) const {
+	if (p.ix()<0 || p.ix()>=nx) {
+	    p._insidex=false;
+	} else {
+	    p._insidex=true;
+	}
+    }
+    void testy(point& p) const {
+	if (p.iy()<0 || p.iy()>=ny) {
+	    p._insidey=false;
+	} else {
+	    p._insidey=true;
+	}
+    }
+    void set(point& p, int x, int y) const {
+	if (x>=0 && x<mx.ni) {
+	    p.mapx(x, mx.value(x), x0 + x*dx);
+	} else {
+	    p.mapx(-1, 0, 0.);
+	    p.setx(ax, x0 + x*dx);
+	}
+	if (y>=0 && y<my.ni) {
+	    p.mapy(y, my.value(y), y0 + y*dy);
+	} else {
+	    p.mapy(-1, 0, 0.);
+	    p.sety(ay, y0 + y*dy);
+	}
+	testx(p);
+	testy(p);
+    }
+    void incx(point& p, real k=1) const {
+	if (k==1 && p._j>=0 && p._j+1<mx.ni) {
+	    p.mapx(p._j+1, mx.value(p._j+1), p.x() + dx);
+	} else {
+	    p._j = -1;
+	    p.incx( ax, k*dx );
+	}
+	testx(p);
+    }
+    void incy(point& p, real k=1) const {
+	if (k==1 && p._i>=0 && p._i+1<my.ni) {
+	    p.mapy(p._i+1, my.value(p._i+1), p.y() + dy);
+	} else {
+	    p._i = -1;
+	    p.incy( ay, k*dy );
+	}
+	testy(p);
+    }
+public:
+    int nx, ny;
+    real x0, y0;
+    real dx, dy;
+    const axis_type& ax;
+    const axis_type& ay;
+    const map_type& mx;
+    const map_type& my;
+};
+
+
 
 #endif
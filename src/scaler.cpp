@@ -54,6 +54,7 @@ typedef union {
 } rgba_t;
 
 typedef XYTransform<Array1D<double> > XYScale;
+typedef XYMapTransform<Array1D<double>, Array1D<npy_int32> > XYMapScale;
 
 template <class Transform>
 struct params {
@@ -192,9 +193,9 @@ struct QuadInterpolation {
 };
 #endif
 
-template<class T>
-struct LinearInterpolation<T,XYScale> {
-    T operator()(const Array2D<T>& src, const XYScale& tr, const typename XYScale::point& p) {
+template<class T, class TR>
+struct XYLinearInterpolation {
+    T operator()(const Array2D<T>& src, const TR& tr, const typename TR::point& p) {
 	int nx = p.ix();
 	int ny = p.iy();
 	double v = src.value(nx, ny);
@@ -221,6 +222,12 @@ struct LinearInterpolation<T,XYScale> {
     }
 };
 
+template<class T>
+struct LinearInterpolation<T,XYScale> : public XYLinearInterpolation<T,XYScale> {};
+
+template<class T>
+struct LinearInterpolation<T,XYMapScale> : public XYLinearInterpolation<T,XYMapScale> {};
+
 template<>
 struct LinearInterpolation<npy_uint32,XYScale> {
     npy_uint32 operator()(const Array2D<npy_uint32>& src, const XYScale& tr, const XYScale::point& p) {
@@ -228,6 +235,13 @@ struct LinearInterpolation<npy_uint32,XYScale> {
     }
 };
 
+template<>
+struct LinearInterpolation<npy_uint32,XYMapScale> {
+    npy_uint32 operator()(const Array2D<npy_uint32>& src, const XYMapScale& tr, const XYMapScale::point& p) {
+	return 0;
+    }
+};
+
 template<class T, class TR>
 struct SubSampleInterpolation
 {
@@ -601,15 +615,35 @@ static PyObject* dispatch_source(Params& p)
    SRC_DATA : varies :
        Scale : source rect (x1,y1,x2,y2)
        Transform : transformation matrix
-       XY : source rect, X array, Y array
+       XY : X array, Y array, source rect and optionally X and Y index maps
+            (int32 source pixel index for each destination column/row)
    DST_DATA : dest rect (dx1,dy1,dx2,dy2)
    LUT_DATA : (a,b,bg) if DST is bw or (a,b,bg,cmap) if DST is rgb
 */
 
+static bool check_index_map(const char* name, PyArrayObject *arr, int n)
+{
+    if (!arr || !PyArray_Check(arr)) {
+	PyErr_Format(PyExc_TypeError, "%s must be a ndarray", name);
+	return false;
+    }
+    if (arr->nd!=1 || PyArray_DIM(arr, 0)!=n) {
+	PyErr_Format(PyExc_TypeError, "%s must be a 1-D array of length %d",
+		     name, n);
+	return false;
+    }
+    if (PyArray_TYPE(arr) != NPY_INT32) {
+	PyErr_Format(PyExc_TypeError, "%s data type must be int32", name);
+	return false;
+    }
+    return true;
+}
+
 static PyObject *py_scale_xy(PyObject *self, PyObject *args)
 {
     typedef params<XYScale> Params;
-    PyArrayObject *p_src=0, *p_dst=0, *p_ax=0, *p_ay=0;
+    typedef params<XYMapScale> MapParams;
+    PyArrayObject *p_src=0, *p_dst=0, *p_ax=0, *p_ay=0, *p_mx=0, *p_my=0;
     PyObject *p_lut_data, *p_src_data, *p_dst_data, *p_interp_data;
     double x1, y1, x2, y2;
 
@@ -622,8 +656,8 @@ static PyObject *py_scale_xy(PyObject *self, PyObject *args)
     if (!check_arrays(p_src, p_dst)) {
 	return NULL;
     }
-    if (!PyArg_ParseTuple(p_src_data, "OO(dddd):_scale_xy",
-			  &p_ax, &p_ay, &x1, &y1, &x2, &y2)) {
+    if (!PyArg_ParseTuple(p_src_data, "OO(dddd)|OO:_scale_xy",
+			  &p_ax, &p_ay, &x1, &y1, &x2, &y2, &p_mx, &p_my)) {
 	return NULL;
     }
     int ni = PyArray_DIM(p_src, 0);
@@ -633,6 +667,17 @@ static PyObject *py_scale_xy(PyObject *self, PyObject *args)
     double dx = (x2-x1)/dnj;
     double dy = (y2-y1)/dni;
     Array1D<double> ax(p_ax), ay(p_ay);
+    if (p_mx || p_my) {
+	if (!check_index_map("X index map", p_mx, dnj) ||
+	    !check_index_map("Y index map", p_my, dni)) {
+	    return NULL;
+	}
+	Array1D<npy_int32> mx(p_mx), my(p_my);
+	XYMapScale trans(nj, ni, x1, y1, dx, dy, ax, ay, mx, my);
+	MapParams scale_params(p_src, p_dst, p_dst_data,
+			       p_lut_data, p_interp_data, trans);
+	return dispatch_source<MapParams>(scale_params);
+    }
     XYScale trans(nj, ni, x1, y1, dx, dy, ax, ay);
     Params scale_params(p_src, p_dst, p_dst_data,
 			p_lut_data, p_interp_data, trans);